@@ -6,9 +6,12 @@ if __name__ == "__main__":
     print("Server: http://localhost:5000")
     print("\nEndpoints:")
     print("  POST /validate   - Validate a single email")
+    print("  POST /validate/batch - Validate many emails (JSON list or NDJSON)")
     print("  POST /extract    - Extract emails from source")
     print("  POST /transform  - Transform emails with new domain")
     print("  POST /generate   - Generate output in format")
+    print("  POST /process    - Extract -> transform -> generate in one call (streamed)")
+    print("  POST /jobs       - Same as /process, in the background (GET /jobs/<id>, /jobs/<id>/result)")
     print("\nTest: python examples/api_example.py")
     print("\nStarting server...\n")
     
@@ -0,0 +1,14 @@
+"""ASGI Entry Point - main_asgi.py (uvicorn main_asgi:app)"""
+from src.features.email_processing.adapters.input.asgi_adapter import EmailProcessingASGI
+
+app = EmailProcessingASGI()
+
+if __name__ == "__main__":
+    print("=== Email Processing API - Streaming (ASGI) ===")
+    print("Server: http://localhost:8000")
+    print("\nEndpoints:")
+    print("  POST /transform?new_domain=...&format=ndjson|csv  - Stream NDJSON/text lines in, results out")
+    print("  POST /generate?format=csv|ndjson                  - Stream /transform results in, rows out")
+    print("\nStarting server...\n")
+
+    app.run(host='0.0.0.0', port=8000)
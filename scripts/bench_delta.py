@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark del modo --since (DeltaTransformEngine): corrida completa frente a
+corrida delta con un pequeño porcentaje de cambios sobre una corrida
+anterior grande. El tiempo delta incluye cargar el CSV anterior y calcular
+added/removed, como hace el CLI.
+
+Uso: python scripts/bench_delta.py [--size 500000] [--changed 0.01]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.features.email_processing.adapters.output.csv_adapter import CsvEmailWriter, iter_csv_rows
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+from src.shared.delta_engine import DeltaTransformEngine
+from src.shared.validation_adapter import CompiledEmailValidator
+
+
+def build_corpus(size, seed=42):
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    corpus = []
+    for _ in range(size):
+        nombre = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        apellido = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        corpus.append(f"{nombre}.{apellido}@old-domain.com")
+    return corpus
+
+
+def full_run(corpus):
+    validator = CompiledEmailValidator()
+    service = EmailProcessingService(validator, MagicMock(), SequentialTransformEngine(validator, batch_size=1000))
+    start = time.perf_counter()
+    result = service.transform_emails(corpus, 'new-domain.com')
+    return result, time.perf_counter() - start
+
+
+def delta_run(corpus, previous_csv):
+    validator = CompiledEmailValidator()
+    start = time.perf_counter()
+    engine = DeltaTransformEngine(SequentialTransformEngine(validator, batch_size=1000), iter_csv_rows(previous_csv))
+    loaded = time.perf_counter() - start
+    service = EmailProcessingService(validator, MagicMock(), engine, reserved=engine.targets)
+    result = service.transform_emails(corpus, 'new-domain.com')
+    engine.record(result['emails'])
+    removed = engine.removed()
+    return result, engine, removed, loaded, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Delta (--since) benchmark')
+    parser.add_argument('--size', type=int, default=500_000)
+    parser.add_argument('--changed', type=float, default=0.01, help='Fraction of rows replaced in the new input')
+    args = parser.parse_args()
+
+    previous = build_corpus(args.size)
+    changed = int(args.size * args.changed)
+    current = previous[changed:] + build_corpus(changed, seed=7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        previous_csv = os.path.join(tmp, 'previous.csv')
+        baseline, _ = full_run(previous)
+        CsvEmailWriter().save_emails(baseline['emails'], previous_csv)
+
+        print(f"Corrida anterior: {args.size} filas; entrada nueva con {changed} cambios ({args.changed:.0%})")
+        full, elapsed = full_run(current)
+        print(f"  completa           {elapsed:6.2f}s")
+        result, engine, removed, loaded, elapsed = delta_run(current, previous_csv)
+        same = result['emails'] == full['emails']
+        print(f"  delta              {elapsed:6.2f}s  (carga del CSV {loaded:.2f}s)  +{len(engine.added)} "
+              f"-{len(removed)} ={engine.unchanged}  {'OK' if same else 'DIFF'}")
+
+        tracemalloc.start()
+        index = DeltaTransformEngine(SequentialTransformEngine(CompiledEmailValidator()), iter_csv_rows(previous_csv))
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  índice anterior    {retained / 1024 / 1024:6.1f} MB retenidos ({index.previous_count} filas)")
+
+
+if __name__ == '__main__':
+    main()
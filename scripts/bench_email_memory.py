@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Memoria retenida por correo procesado: dataclass con __dict__ (versión
+anterior de Email) vs Email con __slots__ vs EmailBatch columnar.
+Solo se mide lo que retiene el contenedor; el corpus de entrada se comparte.
+
+Uso: python scripts/bench_email_memory.py [--size 500000] [--names 5000]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.features.email_processing.domain.email import Email, EmailBatch
+
+
+@dataclass
+class DictEmail:
+    """Email tal como era antes de __slots__ (referencia)"""
+    nombre: str
+    apellido: str
+    correo_original: str
+    correo_nuevo: str
+
+
+def build_corpus(size, names, seed=42):
+    """Pares (nombre, apellido, correo) con nombres repetidos como en datos reales"""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+
+    def word():
+        return ''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+
+    nombres = [word() for _ in range(names)]
+    apellidos = [word() for _ in range(names * 2)]
+    corpus = []
+    for _ in range(size):
+        nombre, apellido = rng.choice(nombres), rng.choice(apellidos)
+        corpus.append((nombre, apellido, f"{nombre}.{apellido}@old-domain.com"))
+    return corpus
+
+
+def measure(build, corpus):
+    """Bytes retenidos por el contenedor que devuelve build(corpus)"""
+    gc.collect()
+    tracemalloc.start()
+    container = build(corpus)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current
+
+
+def as_dict_emails(corpus):
+    emails = []
+    for nombre, apellido, original in corpus:
+        email = Email.create(nombre, apellido, original, 'new-domain.com')
+        emails.append(DictEmail(email.nombre, email.apellido, email.correo_original, email.correo_nuevo))
+    return emails
+
+
+def as_slotted_emails(corpus):
+    return [Email.create(n, a, o, 'new-domain.com') for n, a, o in corpus]
+
+
+def as_batch(corpus):
+    return EmailBatch('new-domain.com', (Email.create(n, a, o, 'new-domain.com') for n, a, o in corpus))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Email memory benchmark')
+    parser.add_argument('--size', type=int, default=500_000)
+    parser.add_argument('--names', type=int, default=5000)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.size, args.names)
+    cases = {
+        'list[dataclass + __dict__]': as_dict_emails,
+        'list[Email (__slots__)]': as_slotted_emails,
+        'EmailBatch': as_batch,
+    }
+
+    print(f"Corpus: {args.size} correos, {args.names} nombres distintos")
+    baseline = None
+    for name, build in cases.items():
+        retained = measure(build, corpus)
+        baseline = baseline or retained
+        print(f"  {name:<28} {retained / args.size:7.1f} bytes/correo  ({retained / baseline:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark de ExcelEmailWriter: workbook en memoria (write_only=False,
+comportamiento anterior) vs workbook write-only (por defecto).
+Mide tiempo y pico de memoria (tracemalloc) escribiendo el mismo lote.
+
+Uso: python scripts/bench_excel.py [--size 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.features.email_processing.adapters.output.excel_adapter import ExcelEmailWriter
+from src.features.email_processing.domain.email import Email, EmailBatch
+
+
+def build_batch(size, seed=42):
+    """EmailBatch reproducible de correos válidos"""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    batch = EmailBatch('new-domain.com')
+    for _ in range(size):
+        nombre = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        apellido = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        batch.append(Email.create(nombre, apellido, f"{nombre}.{apellido}@old-domain.com", 'new-domain.com'))
+    return batch
+
+
+def measure(writer, batch, destination):
+    """Retorna (segundos, pico MB) de save_emails; el tiempo se mide sin tracemalloc"""
+    start = time.perf_counter()
+    writer.save_emails(batch, destination)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    writer.save_emails(batch, destination)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Excel writer benchmark')
+    parser.add_argument('--size', type=int, default=100_000)
+    args = parser.parse_args()
+
+    batch = build_batch(args.size)
+    cases = {
+        'in-memory workbook': ExcelEmailWriter(write_only=False),
+        'write-only workbook': ExcelEmailWriter(),
+    }
+
+    print(f"Lote: {args.size} correos")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, writer in cases.items():
+            destination = os.path.join(tmp, f"{name.replace(' ', '_')}.xlsx")
+            elapsed, peak = measure(writer, batch, destination)
+            size_mb = os.path.getsize(destination) / 1024 / 1024
+            print(f"  {name:<20} {elapsed:6.2f}s  pico {peak:7.1f} MB  archivo {size_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark de arranque en frío del paquete Lambda (terraform/lambda_handler.py).
+
+Arma el paquete como terraform/build.sh (src sin adaptadores ajenos a Lambda +
+lambda_handler.py), con y sin bytecode precompilado, y lanza N procesos nuevos
+con el directorio en solo lectura (como /var/task). Mide por proceso:
+  init  - import de lambda_handler (Init Duration sin el arranque del runtime)
+  first - primera invocación (POST /generate csv)
+  total - proceso completo visto desde fuera (intérprete + init + invocación)
+
+--ref compara además con el código de otro commit (git archive), p. ej. el
+anterior a la optimización de imports.
+
+Uso: python scripts/bench_lambda_import.py [--runs 30] [--ref HEAD~1]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Igual que terraform/build.sh
+EXCLUDED = [
+    'src/features/email_processing/adapters/input/api_adapter.py',
+    'src/features/email_processing/adapters/input/asgi_adapter.py',
+    'src/features/email_processing/adapters/input/cli_adapter.py',
+    'src/features/email_processing/adapters/input/cli_entrypoint.py',
+    'src/features/email_processing/adapters/output/excel_adapter.py',
+    'src/shared/vectorized_engine.py',
+]
+
+PROBE = r"""
+import time
+t0 = time.perf_counter()
+import lambda_handler
+t1 = time.perf_counter()
+import json, logging
+logging.disable(logging.CRITICAL)
+event = {'headers': {'x-api-key': 'dev-key-12345'}, 'rawPath': '/generate', 'body': json.dumps({
+    'transformed': [{'nombre': 'juan', 'apellido': 'perez', 'correo_original': 'juan.perez@old.com',
+                     'correo_nuevo': 'juan.perez@new.com'}], 'output_type': 'csv'})}
+assert lambda_handler.handler(event, None)['statusCode'] == 200
+t2 = time.perf_counter()
+print(json.dumps({'init': (t1 - t0) * 1000, 'first': (t2 - t1) * 1000}))
+"""
+
+
+def build(target, ref=None, compiled=False):
+    """Paquete en target: código del árbol actual o de ref; con .pyc si compiled."""
+    os.makedirs(target)
+    if ref is None:
+        shutil.copytree(os.path.join(ROOT, 'src'), os.path.join(target, 'src'),
+                        ignore=shutil.ignore_patterns('__pycache__'))
+        shutil.copy(os.path.join(ROOT, 'terraform', 'lambda_handler.py'), target)
+    else:
+        archive = subprocess.run(['git', '-C', ROOT, 'archive', ref, 'src', 'terraform/lambda_handler.py'],
+                                 check=True, capture_output=True).stdout
+        subprocess.run(['tar', '-x', '-C', target], input=archive, check=True)
+        shutil.move(os.path.join(target, 'terraform', 'lambda_handler.py'), target)
+    for path in EXCLUDED:
+        if os.path.exists(os.path.join(target, path)):
+            os.unlink(os.path.join(target, path))
+    if compiled:
+        subprocess.run([sys.executable, '-m', 'compileall', '-q', '--invalidation-mode', 'unchecked-hash', target],
+                       check=True)
+
+
+def measure(package, runs):
+    env = dict(os.environ, AWS_LAMBDA_FUNCTION_NAME='bench', PYTHONDONTWRITEBYTECODE='1')
+    samples = {'init': [], 'first': [], 'total': []}
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, '-c', PROBE], cwd=package, env=env,
+                             check=True, capture_output=True, text=True).stdout
+        samples['total'].append((time.perf_counter() - start) * 1000)
+        for key, value in json.loads(out.strip().splitlines()[-1]).items():
+            samples[key].append(value)
+    return samples
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=30)
+    parser.add_argument('--ref', help='commit a comparar (código anterior)')
+    args = parser.parse_args()
+
+    variants = []
+    if args.ref:
+        variants += [(f'{args.ref} source', args.ref, False), (f'{args.ref} compiled', args.ref, True)]
+    variants += [('current source', None, False), ('current compiled', None, True)]
+
+    workdir = tempfile.mkdtemp(prefix='bench_lambda_')
+    try:
+        print(f"{'package':<22} {'init p50':>9} {'init p99':>9} {'first p50':>10} {'total p50':>10} {'total p99':>10}")
+        for i, (label, ref, compiled) in enumerate(variants):
+            package = os.path.join(workdir, str(i))
+            build(package, ref, compiled)
+            s = measure(package, args.runs)
+            print(f"{label:<22} {statistics.median(s['init']):>7.1f}ms {percentile(s['init'], 0.99):>7.1f}ms "
+                  f"{statistics.median(s['first']):>8.2f}ms {statistics.median(s['total']):>8.1f}ms "
+                  f"{percentile(s['total'], 0.99):>8.1f}ms")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
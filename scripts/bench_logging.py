@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Throughput de EmailProcessingService con datos sucios según el logging:
+un warning por duplicado / rechazo (log_records=True) con PythonLogger
+síncrono, async (QueueListener) y async con muestreo de warnings, frente
+al modo por defecto (solo contadores agregados por regla).
+
+Los logs van a archivos reales en un directorio temporal (stderr incluido)
+para que la E/S del logging cuente como en una ejecución normal.
+
+Uso: python scripts/bench_logging.py [--size 200000] [--invalid-ratio 0.5]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.shared.logging_adapter import PythonLogger
+from src.shared.validation_adapter import CompiledEmailValidator
+
+
+def build_corpus(size, invalid_ratio, seed=42):
+    """Corpus reproducible con una fracción de correos inválidos y duplicados"""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    corpus = []
+    for i in range(size):
+        nombre = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        apellido = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        if rng.random() < invalid_ratio:
+            corpus.append(rng.choice([f"{nombre}{apellido}@old.com", f"{nombre}1.{apellido}@old.com",
+                                      corpus[-1] if corpus else f"{nombre}@@old.com"]))
+        else:
+            corpus.append(f"{nombre}.{apellido}@old.com")
+    return corpus
+
+
+def run(logger, corpus, log_records):
+    """Procesa el corpus y retorna segundos hasta que el último registro está en disco"""
+    service = EmailProcessingService(CompiledEmailValidator(), logger, log_records=log_records)
+    start = time.perf_counter()
+    for _ in service.transform_stream(corpus, 'new.com'):
+        pass
+    processing = time.perf_counter() - start
+    logger.close()
+    total = time.perf_counter() - start
+    return processing, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Logging throughput benchmark')
+    parser.add_argument('--size', type=int, default=200_000)
+    parser.add_argument('--invalid-ratio', type=float, default=0.5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.size, args.invalid_ratio)
+    cases = [
+        ('per-record sync', {}, True),
+        ('per-record async', {'async_mode': True}, True),
+        ('async + sample 1/100', {'async_mode': True, 'warning_sample': 100}, True),
+        ('aggregated (default)', {}, False),
+    ]
+
+    print(f"Corpus: {args.size} correos ({args.invalid_ratio:.0%} con warning)")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        stderr = sys.stderr
+        sys.stderr = open(os.path.join(tmp, 'stderr.log'), 'w', encoding='utf-8')
+        results = []
+        try:
+            for i, (name, options, log_records) in enumerate(cases):
+                logger = PythonLogger(f"bench_logging_{i}", **options)
+                results.append((name, *run(logger, corpus, log_records)))
+        finally:
+            sys.stderr.close()
+            sys.stderr = stderr
+
+    for name, processing, total in results:
+        print(f"  {name:<22} proceso {processing:6.2f}s ({args.size / processing:>9,.0f} correos/s)  "
+              f"hasta vaciar logs {total:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escalado de ProcessPoolTransformEngine frente al engine secuencial.
+
+Para cada número de workers mide la corrida completa de EmailProcessingService
+y separa la parte serie del proceso padre (strip, deduplicación, contadores y
+reconstrucción de filas a partir de las tuplas de los workers) reproduciendo
+los resultados ya calculados con un engine que no transforma nada. Con esa fracción serie imprime la cota de
+Amdahl: el speedup máximo alcanzable con N workers en esta máquina.
+
+--cost-us simula reglas más caras (microsegundos extra por fila validada).
+
+Uso: python scripts/bench_parallel.py [--size 300000] [--workers 1,2,4] [--cost-us 0]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.features.email_processing.domain.ports import TransformEngine
+from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+from src.shared import parallel_engine
+from src.shared.parallel_engine import ProcessPoolTransformEngine
+from src.shared.validation_adapter import CompiledEmailValidator
+
+
+class SlowValidator(CompiledEmailValidator):
+    """Validador con coste extra por fila (espera activa)"""
+
+    def __init__(self, cost_us):
+        super().__init__()
+        self.cost = cost_us / 1_000_000
+
+    def validate_fast(self, email):
+        end = time.perf_counter() + self.cost
+        while time.perf_counter() < end:
+            pass
+        return super().validate_fast(email)
+
+
+class ReplayEngine(TransformEngine):
+    """Decodifica tuplas de worker ya calculadas: mide solo el trabajo del proceso padre"""
+
+    def __init__(self, rows, batch_size):
+        self._rows = rows
+        self.batch_size = batch_size
+
+    def transform_batch(self, emails, new_domain):
+        return parallel_engine._decode(emails, next(self._rows))
+
+    def transform_batches(self, batches, new_domain):
+        for batch in batches:
+            yield parallel_engine._decode(batch, next(self._rows))
+
+
+def build_corpus(size, dup_ratio, seed=42):
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    corpus = []
+    for _ in range(size):
+        if corpus and rng.random() < dup_ratio:
+            corpus.append(rng.choice(corpus))
+            continue
+        nombre = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        apellido = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        corpus.append(f"{nombre}.{apellido}@old-domain.com")
+    return corpus
+
+
+def run(engine, corpus, repeat):
+    """Mejor tiempo de `repeat` corridas y una huella del resultado (sin retener las filas)"""
+    best = None
+    for _ in range(repeat):
+        service = EmailProcessingService(CompiledEmailValidator(), MagicMock(), engine)
+        start = time.perf_counter()
+        items = list(service.transform_stream(corpus, 'new-domain.com'))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return hash(tuple(map(repr, items))), best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parallel transform engine scaling benchmark')
+    parser.add_argument('--size', type=int, default=300_000)
+    parser.add_argument('--dup-ratio', type=float, default=0.05)
+    parser.add_argument('--batch-size', type=int, default=2000)
+    parser.add_argument('--workers', default=None, help='Comma-separated worker counts (default: 1..cpu_count)')
+    parser.add_argument('--cost-us', type=float, default=0, help='Extra validation cost per row (microseconds)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    counts = [int(n) for n in args.workers.split(',')] if args.workers else list(range(1, cpus + 1))
+    validator = SlowValidator(args.cost_us) if args.cost_us else CompiledEmailValidator()
+    corpus = build_corpus(args.size, args.dup_ratio)
+
+    print(f"Corpus: {args.size} correos, {args.dup_ratio:.0%} duplicados, coste extra {args.cost_us} us/fila, "
+          f"{cpus} CPU(s)")
+    baseline, sequential = run(SequentialTransformEngine(validator, batch_size=args.batch_size), corpus, args.repeat)
+    print(f"  secuencial         {sequential:6.2f}s")
+
+    # Parte serie: mismo flujo con las tuplas de los workers ya calculadas
+    parallel_engine._init_worker(validator)
+    service = EmailProcessingService(validator, MagicMock(), SequentialTransformEngine(validator, args.batch_size))
+    precomputed = [parallel_engine._transform_in_worker(batch, 'new-domain.com')
+                   for batch in service._unique_batches(corpus, deque(), service._dedup())]
+    serial = min(run(ReplayEngine(iter(precomputed), args.batch_size), corpus, 1)[1] for _ in range(args.repeat))
+    fraction = serial / sequential
+    print(f"  parte serie        {serial:6.2f}s  ({fraction:.0%} de la corrida secuencial)")
+
+    for workers in counts:
+        with ProcessPoolTransformEngine(validator, workers=workers, batch_size=args.batch_size) as pool:
+            result, elapsed = run(pool, corpus, args.repeat)
+        bound = 1 / (fraction + (1 - fraction) / min(workers, cpus))
+        print(f"  pool({workers})            {elapsed:6.2f}s  speedup {sequential / elapsed:4.2f}x  "
+              f"Amdahl {bound:4.2f}x  {'OK' if result == baseline else 'DIFF'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark de CachedTransformEngine: corrida sin caché frente a caché fría,
+caliente y caliente con un porcentaje de filas nuevas (corrida nocturna).
+
+--cost-us simula reglas más caras (microsegundos extra por fila validada)
+para ver a partir de qué coste por fila compensa la caché.
+
+--stamp-age 1 re-sella cada acierto (LRU exacto) para medir su coste.
+
+Uso: python scripts/bench_transform_cache.py [--size 200000] [--changed 0.01] [--cost-us 0] [--stamp-age 4]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+from src.shared.transform_cache import CachedTransformEngine
+from src.shared.validation_adapter import CompiledEmailValidator
+
+
+class SlowValidator(CompiledEmailValidator):
+    """Validador con coste extra por fila (espera activa)"""
+
+    def __init__(self, cost_us):
+        super().__init__()
+        self.cost = cost_us / 1_000_000
+
+    def validate_fast(self, email):
+        end = time.perf_counter() + self.cost
+        while time.perf_counter() < end:
+            pass
+        return super().validate_fast(email)
+
+
+def build_corpus(size, seed=42):
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    corpus = []
+    for _ in range(size):
+        nombre = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        apellido = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        corpus.append(f"{nombre}.{apellido}@old-domain.com")
+    return corpus
+
+
+def run(engine, corpus):
+    service = EmailProcessingService(CompiledEmailValidator(), MagicMock(), engine)
+    start = time.perf_counter()
+    result = service.transform_emails(corpus, 'new-domain.com')
+    service.close()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Transform cache benchmark')
+    parser.add_argument('--size', type=int, default=200_000)
+    parser.add_argument('--changed', type=float, default=0.01, help='Fraction of new rows in the delta run')
+    parser.add_argument('--cost-us', type=float, default=0, help='Extra validation cost per row (microseconds)')
+    parser.add_argument('--stamp-age', type=int, default=4, help='Runs before a hit is re-stamped (1 = exact LRU)')
+    args = parser.parse_args()
+
+    validator = SlowValidator(args.cost_us) if args.cost_us else CompiledEmailValidator()
+    corpus = build_corpus(args.size)
+    delta = corpus[int(args.size * args.changed):] + build_corpus(int(args.size * args.changed), seed=7)
+
+    def engine():
+        return SequentialTransformEngine(validator, batch_size=1000)
+
+    print(f"Corpus: {args.size} correos, coste extra {args.cost_us} us/fila")
+    baseline, elapsed = run(engine(), corpus)
+    print(f"  sin caché          {elapsed:6.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite')
+        for name, rows in (('caché fría', corpus), ('caché caliente', corpus),
+                           (f'caliente +{args.changed:.0%} nuevos', delta)):
+            cached = CachedTransformEngine(engine(), path, stamp_age=args.stamp_age)
+            result, elapsed = run(cached, rows)
+            same = rows is delta or result['emails'] == baseline['emails']
+            print(f"  {name:<18} {elapsed:6.2f}s  aciertos {cached.hits:>8}  "
+                  f"fallos {cached.misses:>8}  {'OK' if same else 'DIFF'}")
+
+
+if __name__ == '__main__':
+    main()
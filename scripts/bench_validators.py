@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark de validadores: RegexEmailValidator vs CompiledEmailValidator
+Usa un corpus mixto (válidos + cada regla BR-001..BR-005) y verifica que
+ambos validadores producen exactamente el mismo resultado.
+
+Uso: python scripts/bench_validators.py [--size 200000] [--invalid-ratio 0.35]
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.shared.validation_adapter import RegexEmailValidator, CompiledEmailValidator
+
+INVALID_SAMPLES = [
+    "juan.perezexample.com",            # BR-001
+    "juan.perez@@example.com",          # BR-001
+    "juanperez@example.com",            # BR-002
+    "juan.del.carmen@example.com",      # BR-002
+    "a.perez@example.com",              # BR-003
+    "juan.p@example.com",               # BR-004
+    "juan123.perez@example.com",        # BR-005
+    "maria-jose.garcia@example.com",    # BR-005
+    "josé.garcía@example.com",          # BR-005
+]
+
+
+def build_corpus(size, invalid_ratio, seed=42):
+    """Genera corpus reproducible de correos válidos e inválidos"""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    corpus = []
+    for _ in range(size):
+        if rng.random() < invalid_ratio:
+            corpus.append(rng.choice(INVALID_SAMPLES))
+        else:
+            nombre = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+            apellido = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+            corpus.append(f"{nombre}.{apellido}@old-domain.com")
+    return corpus
+
+
+def run_all(validator, corpus):
+    """Valida todo el corpus y retorna los resultados"""
+    results = []
+    for email in corpus:
+        try:
+            results.append(validator.validate_and_parse(email))
+        except ValueError as e:
+            results.append(str(e))
+    return results
+
+
+def run_all_fast(validator, corpus):
+    """Valida todo el corpus con validate_fast() (sin excepciones)"""
+    results = []
+    for email in corpus:
+        reason, nombre, apellido, _ = validator.validate_fast(email)
+        results.append((nombre, apellido) if reason is None else reason.message)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validator microbenchmark')
+    parser.add_argument('--size', type=int, default=200_000)
+    parser.add_argument('--invalid-ratio', type=float, default=0.35)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.size, args.invalid_ratio)
+    compiled = CompiledEmailValidator()
+    cases = {
+        'Regex.validate_and_parse': lambda: run_all(RegexEmailValidator(), corpus),
+        'Compiled.validate_and_parse': lambda: run_all(compiled, corpus),
+        'Compiled.validate_fast': lambda: run_all_fast(compiled, corpus),
+    }
+
+    baseline = cases['Regex.validate_and_parse']()
+    for name, case in cases.items():
+        if case() != baseline:
+            print(f"ERROR: {name} no produce el mismo resultado")
+            sys.exit(1)
+
+    print(f"Corpus: {args.size} correos ({args.invalid_ratio:.0%} inválidos), mejor de {args.repeat}")
+    timings = {}
+    for name, case in cases.items():
+        timings[name] = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        speedup = timings['Regex.validate_and_parse'] / timings[name]
+        print(f"  {name:<28} {timings[name]:.3f}s  ({args.size / timings[name]:,.0f} correos/s)  {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,10 @@ setup(
         "requests>=2.31.0",
         "openpyxl>=3.1.2",
     ],
+    extras_require={
+        "vectorized": ["numpy>=2.0"],
+        "asgi": ["uvicorn>=0.23"],
+    },
     entry_points={
         "console_scripts": [
             "email-processor=src.features.email_processing.adapters.input.cli_entrypoint:main",
@@ -1,22 +1,37 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, send_file
 import logging
-import json
+import os
+from typing import Dict, Iterable, Iterator, Optional, Union
+from src.features.email_processing.domain.email import Email, TransformError
 from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.features.email_processing.adapters.output.csv_adapter import StreamingCsvWriter, iter_csv
 from src.features.email_processing.adapters.output.file_adapter import FileEmailRepository
-from src.shared.validation_adapter import RegexEmailValidator
+from src.features.email_processing.adapters.output.json_adapter import (
+    JsonArrayEncoder, JsonEmailWriter, NdjsonEmailWriter, compact_json, iter_ndjson, iter_ndjson_values
+)
+from src.shared.jobs import Job, JobManager
+from src.shared.validation_adapter import CompiledEmailValidator
 from src.shared.logging_adapter import PythonLogger
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_PROCESS_MIMETYPES = {'json': 'application/json', 'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+_JOB_WRITERS = {'csv': StreamingCsvWriter, 'ndjson': NdjsonEmailWriter, 'json': JsonEmailWriter}
+
 
 class EmailProcessingAPI:
-    def __init__(self):
+    def __init__(self, job_workers: int = 2, jobs_dir: Optional[str] = None):
+        """
+        job_workers: threads running /jobs in the background.
+        jobs_dir: where job outputs are written (temporary directory by default).
+        """
         self.app = Flask(__name__)
         # Dependency Injection
-        self.validator = RegexEmailValidator()
+        self.validator = CompiledEmailValidator()
         self.logger = PythonLogger("api")
         self.service = EmailProcessingService(self.validator, self.logger)
+        self.jobs = JobManager(workers=job_workers, directory=jobs_dir)
         self._setup_routes()
     
     def _setup_routes(self):
@@ -41,6 +56,42 @@ class EmailProcessingAPI:
                 logger.error(f"Validate error: {e}")
                 return jsonify({'error': str(e)}), 400
         
+        @self.app.route('/validate/batch', methods=['POST'])
+        def validate_batch():
+            """
+            Validate many emails in one request.
+            Body: {"emails": ["email1", "email2"]}, or NDJSON
+            (Content-Type: application/x-ndjson) with one "email" or
+            {"email": "..."} per line.
+            Response: {"results": [{"index": 0, "valid": true},
+                                   {"index": 1, "valid": false, "rule": "BR-002"}],
+                       "valid": N, "total": N}
+            NDJSON requests get one result per line plus a {"summary": ...} line;
+            a line that is not JSON or lacks "email" is a 400.
+            """
+            try:
+                ndjson = request.mimetype == 'application/x-ndjson'
+                if ndjson:
+                    # Línea a línea desde el stream: el body no se carga entero
+                    emails = iter_ndjson_values(line.decode('utf-8') for line in request.stream)
+                else:
+                    emails = request.json.get('emails')
+                    if not isinstance(emails, list):
+                        return jsonify({'error': 'Missing required field: emails (list)'}), 400
+
+                results = list(self.service.validate_batch(emails))
+                valid = sum(1 for r in results if r['valid'])
+                logger.info(f"Validated {len(results)} emails: {valid} valid")
+
+                if ndjson:
+                    lines = [compact_json(r) + '\n' for r in results]
+                    lines.append(compact_json({'summary': {'valid': valid, 'total': len(results)}}) + '\n')
+                    return Response(''.join(lines), mimetype='application/x-ndjson')
+                return jsonify({'results': results, 'valid': valid, 'total': len(results)})
+            except Exception as e:
+                logger.error(f"Validate batch error: {e}")
+                return jsonify({'error': str(e)}), 400
+
         @self.app.route('/extract', methods=['POST'])
         def extract():
             """
@@ -119,7 +170,7 @@ class EmailProcessingAPI:
             Generate output in specified format.
             Body: {
                 "transformed": [{"transformed": "email", "valid": true}],
-                "output_type": "csv|json|inline|silent"
+                "output_type": "csv|json|ndjson|inline|silent"
             }
             """
             try:
@@ -128,21 +179,8 @@ class EmailProcessingAPI:
                 output_type = data.get('output_type', 'inline')
                 
                 # Convert to Email objects
-                from src.features.email_processing.domain.email import Email
-                email_objects = []
-                for item in transformed:
-                    if item.get('valid'):
-                        parts = item['transformed'].split('@')
-                        if len(parts) == 2:
-                            name_parts = parts[0].split('.')
-                            if len(name_parts) == 2:
-                                email_obj = Email.create(
-                                    nombre=name_parts[0],
-                                    apellido=name_parts[1],
-                                    correo_original=item['original'],
-                                    nuevo_dominio=parts[1]
-                                )
-                                email_objects.append(email_obj)
+                from src.features.email_processing.domain.transform_result import emails_from_transformed
+                email_objects = emails_from_transformed(transformed)
                 
                 logger.info(f"Generating {len(email_objects)} emails in {output_type} format")
                 
@@ -156,6 +194,11 @@ class EmailProcessingAPI:
                     content = JsonFormatter().format(email_objects)
                     return jsonify({'content': content, 'format': 'json', 'count': len(email_objects)})
                 
+                elif output_type == 'ndjson':
+                    from src.features.email_processing.adapters.output.json_adapter import NdjsonFormatter
+                    content = NdjsonFormatter().format(email_objects)
+                    return jsonify({'content': content, 'format': 'ndjson', 'count': len(email_objects)})
+                
                 elif output_type == 'inline':
                     from src.features.email_processing.domain.output_service import OutputService
                     emails = OutputService.generate_inline(email_objects)
@@ -168,12 +211,192 @@ class EmailProcessingAPI:
                     return jsonify({'count': count})
                 
                 else:
-                    return jsonify({'error': 'Invalid output_type. Use: csv, json, inline, or silent'}), 400
+                    return jsonify({'error': 'Invalid output_type. Use: csv, json, ndjson, inline, or silent'}), 400
                     
             except Exception as e:
                 logger.error(f"Generate error: {e}")
                 return jsonify({'error': str(e)}), 400
     
+        @self.app.route('/process', methods=['POST'])
+        def process():
+            """
+            Complete pipeline in one request: extract -> transform -> generate.
+            Body: {
+                "input_type": "file|list|text",
+                "input": "path/to/file.txt" | ["email1", "email2"] | "email1\nemail2",
+                "new_domain": "company.com",
+                "output_type": "json|ndjson|csv"
+            }
+            The response is streamed while rows are transformed.
+            """
+            try:
+                data = request.json
+                new_domain = data.get('new_domain')
+                if not new_domain:
+                    return jsonify({'error': 'Missing required field: new_domain'}), 400
+                output_type = data.get('output_type', 'json')
+                if output_type not in _PROCESS_MIMETYPES:
+                    return jsonify({'error': 'Invalid output_type. Use: json, ndjson, or csv'}), 400
+
+                emails = self._process_source(data.get('input_type', 'list'), data['input'])
+                # transform_stream valida el dominio al llamarse: el 400 sale antes del stream
+                stats = {}
+                stream = self.service.transform_stream(emails, new_domain, stats)
+
+                logger.info(f"Processing emails to domain {new_domain} as {output_type}")
+                return Response(self._buffered(self._process_output(stream, stats, output_type)),
+                                mimetype=_PROCESS_MIMETYPES[output_type])
+            except Exception as e:
+                logger.error(f"Process error: {e}")
+                return jsonify({'error': str(e)}), 400
+
+        @self.app.route('/jobs', methods=['POST'])
+        def submit_job():
+            """
+            Run the complete pipeline in the background (large inputs).
+            Body: same as /process; output_type: csv (default), ndjson or json.
+            Response (202): {"id": "...", "status": "queued", "progress": {...}}
+            Poll GET /jobs/<id>, then download GET /jobs/<id>/result.
+            """
+            try:
+                data = request.json
+                new_domain = data.get('new_domain')
+                if not new_domain:
+                    return jsonify({'error': 'Missing required field: new_domain'}), 400
+                if not self.validator.validate_domain(new_domain):
+                    return jsonify({'error': f"Invalid target domain: {new_domain}"}), 400
+                output_type = data.get('output_type', 'csv')
+                if output_type not in _JOB_WRITERS:
+                    return jsonify({'error': 'Invalid output_type. Use: csv, ndjson, or json'}), 400
+                input_type = data.get('input_type', 'list')
+                input_data = data['input']
+                # Validar la entrada ahora: el error llega al cliente y no al job
+                self._process_source(input_type, input_data)
+
+                job = self.jobs.submit(
+                    lambda job: self._run_job(job, input_type, input_data, new_domain, output_type),
+                    suffix=f".{output_type}",
+                    params={'input_type': input_type, 'new_domain': new_domain, 'output_type': output_type})
+                logger.info(f"Job {job.id} queued ({input_type} -> {output_type})")
+                return jsonify(job.to_dict()), 202
+            except Exception as e:
+                logger.error(f"Job submit error: {e}")
+                return jsonify({'error': str(e)}), 400
+
+        @self.app.route('/jobs/<job_id>', methods=['GET'])
+        def job_status(job_id):
+            """Job status and progress (rows_done, rows_total, percent, rate, eta_seconds)."""
+            job = self.jobs.get(job_id)
+            if job is None:
+                return jsonify({'error': f"Job not found: {job_id}"}), 404
+            return jsonify(job.to_dict())
+
+        @self.app.route('/jobs/<job_id>/result', methods=['GET'])
+        def job_result(job_id):
+            """Stream the output file of a finished job (409 while it is queued/running or failed)."""
+            job = self.jobs.get(job_id)
+            if job is None:
+                return jsonify({'error': f"Job not found: {job_id}"}), 404
+            if job.status != 'done':
+                return jsonify({'error': f"Job is {job.status}", 'status': job.status}), 409
+            output_type = job.params['output_type']
+            return send_file(job.output_path, mimetype=_PROCESS_MIMETYPES[output_type],
+                             as_attachment=True, download_name=f"result.{output_type}")
+
+    def _run_job(self, job: Job, input_type: str, input_data, new_domain: str, output_type: str) -> None:
+        """Background task: transform the input and write accepted rows to job.output_path."""
+        if input_type == 'file':
+            emails = self._file_source(job, input_data)
+        else:
+            emails = list(self._process_source(input_type, input_data))
+            job.rows_total = len(emails)
+
+        with _JOB_WRITERS[output_type]().open(job.output_path) as writer:
+            batch = []
+            for item in self.service.transform_stream(emails, new_domain, job.stats):
+                if isinstance(item, Email):
+                    batch.append(item)
+                    if len(batch) >= 1000:
+                        writer.write(batch)
+                        batch = []
+            if batch:
+                writer.write(batch)
+        logger.info(f"Job {job.id} done: {job.stats['processed']}/{job.stats['total']} emails")
+
+    @staticmethod
+    def _file_source(job: Job, path: str) -> Iterator[str]:
+        """Emails of a file, reporting bytes read as job.fraction (row count unknown upfront)."""
+        size = os.path.getsize(path) or 1
+        for chunk in FileEmailRepository().iter_chunks(path):
+            yield from chunk.emails
+            job.fraction = chunk.end_offset / size
+
+    @staticmethod
+    def _process_source(input_type: str, input_data) -> Iterable[str]:
+        """
+        Raw emails for /process and /jobs, read lazily (same input types as
+        /extract). The input is checked here, before any response is started.
+        """
+        if input_type == 'list':
+            if not isinstance(input_data, list):
+                raise ValueError('input must be a list of emails for input_type list')
+            for index, email in enumerate(input_data):
+                if not isinstance(email, str):
+                    raise ValueError(f"Invalid email at index {index}: expected a string")
+            return input_data
+        if input_type not in ('file', 'text'):
+            raise ValueError('Invalid input_type. Use: file, list, or text')
+        if not isinstance(input_data, str):
+            raise ValueError(f"input must be a string for input_type {input_type}")
+        if input_type == 'file':
+            if not os.path.exists(input_data):
+                raise FileNotFoundError(f"Archivo no encontrado: {input_data}")
+            return FileEmailRepository().iter_emails(input_data)
+        return (e.strip() for e in input_data.split('\n') if e.strip())
+
+    @staticmethod
+    def _process_output(stream: Iterator[Union[Email, TransformError]], stats: Dict,
+                        output_type: str) -> Iterator[str]:
+        """
+        Encode accepted rows as they come out of the stream.
+
+        json: {"emails": [...], "processed", "total", "error_counts"}.
+        ndjson: one email per line plus a final {"summary": {...}} line.
+        csv: header plus accepted rows.
+        """
+        emails = (item for item in stream if isinstance(item, Email))
+        if output_type == 'csv':
+            yield from iter_csv(emails)
+        elif output_type == 'ndjson':
+            yield from iter_ndjson(emails)
+        else:
+            encoder = JsonArrayEncoder()
+            yield encoder.start()
+            yield from encoder.encode(emails)
+
+        summary = {'processed': stats['processed'], 'total': stats['total'], 'error_counts': stats['error_counts']}
+        logger.info(f"Processed {stats['processed']}/{stats['total']} emails successfully")
+        if output_type == 'json':
+            # Cierre propio: "total" es de la entrada, no el número de filas del array
+            yield '],' + compact_json(summary)[1:]
+        elif output_type == 'ndjson':
+            yield compact_json({'summary': summary}) + '\n'
+
+    @staticmethod
+    def _buffered(chunks: Iterable[str], size: int = 64 * 1024) -> Iterator[str]:
+        """Group small pieces into ~size writes (one WSGI write per row is slow)."""
+        pending = []
+        pending_size = 0
+        for chunk in chunks:
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= size:
+                yield ''.join(pending)
+                pending = []
+                pending_size = 0
+        if pending:
+            yield ''.join(pending)
+
     def run(self, host='localhost', port=5000):
         """Run Flask server locally."""
         logger.info(f"Starting API server on {host}:{port}")
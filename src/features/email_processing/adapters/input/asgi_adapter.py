@@ -0,0 +1,283 @@
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs
+from src.features.email_processing.domain.email import Email
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.features.email_processing.domain.transform_result import emails_from_transformed
+from src.features.email_processing.adapters.output.csv_adapter import iter_csv
+from src.features.email_processing.adapters.output.json_adapter import compact_json, iter_ndjson, iter_ndjson_values
+from src.shared.validation_adapter import CompiledEmailValidator
+from src.shared.logging_adapter import PythonLogger
+
+logger = logging.getLogger(__name__)
+
+_CONTENT_TYPES = {
+    'ndjson': b'application/x-ndjson; charset=utf-8',
+    'csv': b'text/csv; charset=utf-8',
+}
+
+
+class _LineSplitter:
+    """Splits a chunked request body into complete lines (a line may span chunks)."""
+
+    def __init__(self):
+        self._tail = b''
+
+    def feed(self, chunk: bytes) -> List[str]:
+        data = self._tail + chunk
+        parts = data.split(b'\n')
+        self._tail = parts.pop()
+        return [part.decode('utf-8') for part in parts]
+
+    def close(self) -> List[str]:
+        tail, self._tail = self._tail, b''
+        return [tail.decode('utf-8')] if tail else []
+
+
+class EmailProcessingASGI:
+    """
+    Streaming variant of EmailProcessingAPI as a plain ASGI application
+    (serve with any ASGI server, e.g. `uvicorn main_asgi:app`).
+
+    POST /transform?new_domain=...&format=ndjson|csv
+        Body: NDJSON ({"email": ...} or "...") or text/plain, one email per
+        line, chunked. Response: one NDJSON result per input row (same
+        fields as /transform in EmailProcessingAPI) plus a final summary
+        line, or CSV of the accepted rows.
+    POST /generate?format=csv|ndjson
+        Body: NDJSON of /transform results. Response: CSV/NDJSON rows.
+
+    The request body is read on the event loop. Each batch of complete
+    lines is handed to a worker thread as one short task (a push-based
+    TransformSession keeps duplicate detection and stats across batches),
+    so a thread is only busy while it transforms rows, never while a slow
+    client uploads. At most one batch per request is in flight and at most
+    BATCH_LINES lines wait behind it; reading pauses beyond that, so a slow
+    client throttles the pipeline instead of growing memory.
+
+    The response starts with the first output, i.e. once work has run: an
+    error before that (bad NDJSON on the first lines) is still a 400.
+    Errors after the response has started end an NDJSON stream with an
+    {"error": ...} line; CSV has no place for one, so the response is left
+    unterminated and the server drops the connection.
+    """
+
+    BATCH_LINES = 10_000
+
+    def __init__(self, service: Optional[EmailProcessingService] = None, max_workers: Optional[int] = None):
+        # Dependency Injection
+        self.validator = CompiledEmailValidator()
+        self.logger = PythonLogger("asgi")
+        self.service = service or EmailProcessingService(self.validator, self.logger)
+        # Sin tope propio: por defecto el de ThreadPoolExecutor (según CPUs)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asgi-stream")
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        path = scope['path'].rstrip('/')
+        routes = {'/transform': self._transform, '/generate': self._generate}
+        if path not in routes:
+            await self._json(send, 404, {'error': f"Not found: {scope['path']}"})
+            return
+        if scope['method'] != 'POST':
+            await self._json(send, 405, {'error': 'Method not allowed'})
+            return
+
+        params = {k: v[-1] for k, v in parse_qs(scope.get('query_string', b'').decode('latin-1')).items()}
+        try:
+            await routes[path](scope, receive, send, params)
+        except ValueError as e:
+            await self._json(send, 400, {'error': str(e)})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.close()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _transform(self, scope, receive, send, params):
+        new_domain = params.get('new_domain')
+        output_format = params.get('format', 'ndjson')
+        if not new_domain:
+            raise ValueError('Missing required parameter: new_domain')
+        if output_format not in _CONTENT_TYPES:
+            raise ValueError('Invalid format. Use: ndjson or csv')
+
+        plain_text = self._is_plain_text(scope)
+        stats = {}
+        # Valida el dominio antes de leer el body (ValueError -> 400)
+        session = self.service.open_session(new_domain, stats)
+        csv_header = [output_format == 'csv']
+
+        def step(lines: List[str], out: List[str]):
+            emails = lines if plain_text else iter_ndjson_values(lines, 'email')
+            items = session.feed(emails)
+            if output_format == 'csv':
+                header, csv_header[0] = csv_header[0], False
+                for text in iter_csv((item for item in items if isinstance(item, Email)), header=header):
+                    out.append(text)
+                return
+            for item in items:
+                if isinstance(item, Email):
+                    out.append(compact_json({'original': item.correo_original, 'transformed': item.correo_nuevo,
+                                             'valid': True}) + '\n')
+                else:
+                    out.append(compact_json({'original': item.email, 'valid': False, 'error': item.error}) + '\n')
+
+        def finish(out: List[str]):
+            session.close()
+            if output_format == 'csv':
+                if csv_header[0]:
+                    out.extend(iter_csv(()))
+                return
+            out.append(compact_json({'summary': {'valid': stats['processed'], 'total': stats['total'],
+                                                 'error_counts': stats['error_counts']}}) + '\n')
+
+        await self._stream(receive, send, output_format, step, finish, session.close)
+
+    async def _generate(self, scope, receive, send, params):
+        output_format = params.get('format', 'csv')
+        if output_format not in _CONTENT_TYPES:
+            raise ValueError('Invalid format. Use: csv or ndjson')
+        csv_header = [output_format == 'csv']
+
+        def step(lines: List[str], out: List[str]):
+            # Sin resumen: cada lote de líneas se convierte por separado
+            emails = emails_from_transformed(list(iter_ndjson_values(lines, None)))
+            if output_format == 'csv':
+                header, csv_header[0] = csv_header[0], False
+                out.extend(iter_csv(emails, header=header))
+            else:
+                out.extend(iter_ndjson(emails))
+
+        def finish(out: List[str]):
+            if csv_header[0]:
+                out.extend(iter_csv(()))
+
+        await self._stream(receive, send, output_format, step, finish)
+
+    @staticmethod
+    def _is_plain_text(scope) -> bool:
+        headers = dict(scope.get('headers') or [])
+        return headers.get(b'content-type', b'').startswith(b'text/plain')
+
+    @staticmethod
+    def _run_step(step: Callable, *args) -> Tuple[str, Optional[Exception]]:
+        """Run step(*args, out) on a worker thread; keep the output produced before a failure."""
+        out = []
+        try:
+            step(*args, out)
+        except Exception as e:
+            return ''.join(out), e
+        return ''.join(out), None
+
+    async def _stream(self, receive, send, output_format: str, step: Callable[[List[str], List[str]], None],
+                      finish: Callable[[List[str]], None], close: Optional[Callable[[], None]] = None):
+        """
+        Feed the request body to step() batch by batch and send its output.
+
+        step(lines, out) appends the encoded results of one batch of
+        non-blank lines to out; finish(out) appends the trailer. Both run on
+        the executor, one at a time per request, while the event loop keeps
+        receiving the next lines. close() runs in any case.
+        """
+        loop = asyncio.get_running_loop()
+        splitter = _LineSplitter()
+        buffered: List[str] = []
+        receiving = asyncio.ensure_future(receive())
+        running = None
+        started = False
+
+        async def start():
+            nonlocal started
+            if not started:
+                started = True
+                await send({'type': 'http.response.start', 'status': 200,
+                            'headers': [(b'content-type', _CONTENT_TYPES[output_format])]})
+
+        async def emit(text: str, failure: Optional[Exception]) -> bool:
+            """Send one step's output; False once the stream has failed."""
+            if failure is not None:
+                if not started and not text:
+                    # Nada enviado todavía: aún se puede responder con un 400
+                    raise failure
+                logger.error(f"Stream error: {failure}")
+                if output_format != 'ndjson':
+                    await start()
+                    await send({'type': 'http.response.body', 'body': text.encode('utf-8'), 'more_body': True})
+                    # CSV no tiene dónde marcar el error: sin cierre del body el servidor
+                    # corta la conexión y el cliente ve una respuesta incompleta
+                    raise RuntimeError(f"Stream aborted: {failure}") from failure
+                text += compact_json({'error': str(failure)}) + '\n'
+            if text:
+                await start()
+                await send({'type': 'http.response.body', 'body': text.encode('utf-8'), 'more_body': True})
+            return failure is None
+
+        try:
+            ok = True
+            while ok and (receiving is not None or running is not None or buffered):
+                if running is None and buffered:
+                    running = loop.run_in_executor(self._executor, self._run_step, step, buffered)
+                    buffered = []
+                # Con un lote completo esperando no se lee más: contrapresión
+                reading = receiving if len(buffered) < self.BATCH_LINES else None
+                waiting = [future for future in (reading, running) if future is not None]
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if running in done:
+                    finished, running = running, None
+                    ok = await emit(*finished.result())
+                if receiving in done:
+                    message = receiving.result()
+                    receiving = None
+                    if message['type'] == 'http.disconnect':
+                        # Cliente desconectado: no hay a quién responder
+                        return
+                    lines = splitter.feed(message.get('body', b''))
+                    if message.get('more_body', False):
+                        receiving = asyncio.ensure_future(receive())
+                    else:
+                        lines += splitter.close()
+                    buffered += [line for line in lines if line.strip()]
+            if ok:
+                await emit(*await loop.run_in_executor(self._executor, self._run_step, finish))
+            await start()
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            if receiving is not None:
+                receiving.cancel()
+            if running is not None:
+                # El lote en curso no se puede interrumpir: esperar a que suelte la sesión
+                await asyncio.gather(running, return_exceptions=True)
+            if close is not None:
+                close()
+
+    @staticmethod
+    async def _json(send, status: int, payload: dict):
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': json.dumps(payload).encode('utf-8')})
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def run(self, host='localhost', port=8000):
+        """Serve with uvicorn (pip install email-processor-cli[asgi])."""
+        try:
+            import uvicorn
+        except ImportError:
+            raise ImportError("uvicorn required to serve the ASGI app. Install: pip install uvicorn")
+        logger.info(f"Starting ASGI server on {host}:{port}")
+        uvicorn.run(self, host=host, port=port)
@@ -1,17 +1,40 @@
 import logging
+import os
 import time
+from collections import deque
 from typing import Union, List
+from src.features.email_processing.domain.email import Email, email_rows
 from src.features.email_processing.domain.email_service import EmailProcessingService
-from src.features.email_processing.adapters.output.file_adapter import FileEmailRepository
-from src.features.email_processing.adapters.output.csv_adapter import CsvEmailWriter
-from src.shared.validation_adapter import RegexEmailValidator
+from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+from src.features.email_processing.domain.transform_result import TransformResult, emails_from_transformed
+from src.features.email_processing.domain.collision_resolver import CollisionResolver
+from src.features.email_processing.adapters.output.file_adapter import FileEmailRepository, iter_directory
+from src.features.email_processing.adapters.output.csv_adapter import CsvEmailWriter, StreamingCsvWriter, iter_csv_rows
+from src.features.email_processing.adapters.output.json_adapter import JsonEmailWriter, NdjsonEmailWriter
+from src.features.email_processing.adapters.output.excel_adapter import ExcelEmailWriter
+from src.shared.validation_adapter import CompiledEmailValidator
 from src.shared.logging_adapter import PythonLogger
 from src.shared.error_logger import ErrorLogger
 from src.shared.summary_generator import SummaryGenerator
+from src.shared.dedup import build_duplicate_detector
+from src.shared.checkpoint import (
+    RunCheckpoint, checkpoint_path, input_stamp, load_checkpoint, remove_checkpoint, save_checkpoint
+)
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Formatos que se escriben fila a fila mientras se transforma
+STREAMING_WRITERS = {
+    'csv': StreamingCsvWriter,
+    'json': JsonEmailWriter,
+    'ndjson': NdjsonEmailWriter,
+    'excel': ExcelEmailWriter,
+}
+
+# Formatos a los que se puede seguir escribiendo tras un corte (checkpoints / --resume)
+RESUMABLE_OUTPUTS = ('csv', 'ndjson')
+
 
 class EmailProcessingCLI:
     """
@@ -23,14 +46,65 @@ class EmailProcessingCLI:
         python main.py --input-type text --input "email1\nemail2" --new-domain company.com --output-type silent
     
     Input types: file, list, text
-    Output types: csv, json, inline, silent
+    Output types: csv, json, ndjson, excel, txt, inline, silent
     """
     
-    def __init__(self):
+    def __init__(self, workers: int = 1, engine: str = 'sequential', async_logging: bool = False,
+                 warning_sample: int = 1, warning_rate: int = None, log_records: bool = False,
+                 dedup: str = 'exact', bloom: bool = False, expected_rows: int = 1_000_000,
+                 dedup_target: bool = False,
+                 resolve_collisions: bool = False, directory: str = None, suffix_format: str = '{local}{n}',
+                 cache: str = None, cache_max_entries: int = 5_000_000, since: str = None,
+                 checkpoint_interval: float = 60.0):
         # Dependency Injection
-        self.validator = RegexEmailValidator()
-        self.logger = PythonLogger("cli")
-        self.service = EmailProcessingService(self.validator, self.logger)
+        self.validator = CompiledEmailValidator()
+        self.logger = PythonLogger("cli", async_logging, warning_sample, warning_rate)
+        detector_factory = build_duplicate_detector(dedup, bloom, expected_rows)
+        collisions = None
+        if resolve_collisions or directory:
+            collisions = self._build_resolver_factory(detector_factory, directory, suffix_format)
+        transform_engine = self._build_engine(engine, workers)
+        if cache:
+            from src.shared.transform_cache import CachedTransformEngine
+            transform_engine = CachedTransformEngine(transform_engine, cache, max_entries=cache_max_entries)
+        self.checkpoint_interval = checkpoint_interval
+        # Estos modos guardan estado que no se reconstruye al reanudar
+        self._resumable = not (dedup_target or collisions or since)
+        self.delta = None
+        if since:
+            from src.shared.delta_engine import DeltaTransformEngine
+            transform_engine = self.delta = DeltaTransformEngine(transform_engine, iter_csv_rows(since))
+            self.logger.info(f"Delta mode: {self.delta.previous_count} previous rows loaded from {since}")
+        self.service = EmailProcessingService(self.validator, self.logger, transform_engine,
+                                              log_records=log_records, dedup=detector_factory,
+                                              target_dedup=dedup_target, collisions=collisions,
+                                              reserved=self.delta.targets if self.delta else None)
+    
+    def _build_resolver_factory(self, detector_factory, directory: str, suffix_format: str):
+        # Validar el formato al construir el CLI, no al primer lote
+        CollisionResolver(suffix_format=suffix_format)
+        
+        def factory():
+            resolver = CollisionResolver(detector_factory(), suffix_format)
+            if directory:
+                seeded = resolver.seed(iter_directory(directory))
+                self.logger.info(f"Loaded {seeded} existing addresses from {directory}")
+            return resolver
+        return factory
+    
+    def _build_engine(self, engine: str, workers: int):
+        if engine == 'vectorized':
+            from src.shared.vectorized_engine import VectorizedTransformEngine
+            return VectorizedTransformEngine(row_validator=self.validator)
+        if engine != 'sequential':
+            raise ValueError(f"Invalid engine: {engine}")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if workers > 1:
+            from src.shared.parallel_engine import ProcessPoolTransformEngine
+            return ProcessPoolTransformEngine(self.validator, workers=workers)
+        # Lotes de 1000: la deduplicación consulta el detector una vez por lote
+        return SequentialTransformEngine(self.validator, batch_size=1000)
     
     @staticmethod
     def show_usage():
@@ -48,10 +122,32 @@ INPUT OPTIONS:
 
 TRANSFORM OPTIONS:
   --new-domain    New domain for emails (required)
+  --workers       Parallel worker processes for validation (default: 1)
+  --engine        Transform engine: sequential, vectorized (default: sequential)
+  --dedup         Duplicate detection: exact, hash64, hash128, disk (default: exact)
+  --bloom         Bloom filter in front of --dedup disk (ignored by in-memory modes)
+  --expected-rows Expected distinct rows, sizes the --bloom filter (default: 1000000)
+  --dedup-target  Reject rows whose generated address was already issued (DUP-TARGET)
+  --resolve-collisions  Give colliding generated addresses a suffix (juan.perez2@...)
+  --directory     Existing mailboxes (.txt one per line, or .csv 'Correo Nuevo' column);
+                  implies --resolve-collisions
+  --suffix-format Suffix pattern with {local} and {n} (default: {local}{n})
+  --cache         SQLite file caching validation/transform results between runs
+  --cache-max-entries  Oldest entries beyond this are evicted (default: 5000000)
+  --resume        Continue an interrupted file -> csv/ndjson run from <output>.checkpoint
+  --checkpoint-interval  Seconds between checkpoints, 0 disables (default: 60)
+  --since         Previous output CSV: reuse its rows, transform only new addresses
+                  and write <output>.added.csv / <output>.removed.csv
+
+LOGGING OPTIONS:
+  --log-mode        sync or async (handlers on a background thread) (default: sync)
+  --log-records     Log a warning per rejected/duplicate email (default: per-rule totals only)
+  --warning-sample  Keep 1 of every N per-record warnings (default: 1)
+  --warning-rate    Max per-record warnings per second (default: unlimited)
 
 OUTPUT OPTIONS:
-  --output-type   Type: csv, json, excel, txt, inline, silent (default: csv)
-  --output        Output file path (required for csv/json)
+  --output-type   Type: csv, json, ndjson, excel, txt, inline, silent (default: csv)
+  --output        Output file path (required for csv/json/ndjson/excel/txt)
 
 EXAMPLES:
   # From file to CSV
@@ -88,7 +184,7 @@ EXAMPLES:
         except:
             return False
     
-    def transform(self, emails: list, new_domain: str, error_logger: ErrorLogger = None) -> list:
+    def transform(self, emails: list, new_domain: str, error_logger: ErrorLogger = None) -> TransformResult:
         logger.info(f"Transforming {len(emails)} emails to domain {new_domain}")
         
         if error_logger is None:
@@ -97,25 +193,13 @@ EXAMPLES:
         # Use domain service
         result = self.service.transform_emails(emails, new_domain)
         
-        transformed = []
-        for email in result['emails']:
-            transformed.append({
-                'original': email.correo_original,
-                'transformed': str(email),
-                'valid': True
-            })
+        if self.delta is not None:
+            self.delta.record(result['emails'])
+        transformed = TransformResult.from_emails(result['emails'])
         
         for error in result['error_details']:
             error_msg = error['error']
-            # Extraer código de regla y descripción
-            if ':' in error_msg:
-                parts = error_msg.split(':', 1)
-                rule = parts[0].strip()
-                description = parts[1].strip() if len(parts) > 1 else error_msg
-            else:
-                rule = 'UNKNOWN'
-                description = error_msg
-            error_logger.log_error(error['email'], rule, description)
+            self._log_error(error_logger, error['email'], error_msg)
             transformed.append({
                 'original': error['email'],
                 'valid': False,
@@ -125,28 +209,149 @@ EXAMPLES:
         logger.info(f"Transformed {result['processed']}/{result['total']} emails successfully")
         return transformed
     
+    @staticmethod
+    def _log_error(error_logger: ErrorLogger, email: str, error_msg: str):
+        # Extraer código de regla y descripción
+        if ':' in error_msg:
+            parts = error_msg.split(':', 1)
+            rule = parts[0].strip()
+            description = parts[1].strip() if len(parts) > 1 else error_msg
+        else:
+            rule = 'UNKNOWN'
+            description = error_msg
+        error_logger.log_error(email, rule, description)
+    
+    def stream_to_file(self, source: str, new_domain: str, output_file: str, output_type: str = 'csv',
+                       error_logger: ErrorLogger = None, resume: bool = False) -> dict:
+        """
+        File -> csv/json/ndjson/excel without holding the dataset in memory.
+        
+        Reads the input in chunks, transforms lazily and writes accepted rows
+        chunk by chunk. For csv/ndjson a checkpoint (<output>.checkpoint) is
+        saved at most every checkpoint_interval seconds at a chunk boundary;
+        with resume=True the run continues from it. Returns the service stats
+        (total, processed, errors, success_rate).
+        """
+        if error_logger is None:
+            error_logger = ErrorLogger()
+        if output_type not in STREAMING_WRITERS:
+            raise ValueError(f"Invalid output_type for streaming: {output_type}")
+        # Antes de abrir el writer: un --input mal escrito no debe truncar la salida existente
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"Archivo no encontrado: {source}")
+        
+        checkpointing = output_type in RESUMABLE_OUTPUTS and self.checkpoint_interval > 0 and self._resumable
+        state_path = checkpoint_path(output_file)
+        stamp = input_stamp(source)
+        state = self._load_resume_state(state_path, source, new_domain, output_type, stamp) if resume else None
+        
+        repo = FileEmailRepository()
+        seen = ()
+        if state is not None:
+            logger.info(f"Resuming {source} from byte {state.input_offset} ({state.stats['total']} emails done)")
+            error_logger.resume(state.error_log_size, *state.error_log_counts)
+            # Reconstruir la deduplicación con lo ya procesado (sin transformar)
+            seen = (chunk.emails for chunk in repo.iter_chunks(source, stop=state.input_offset))
+        
+        # (filas acumuladas, offset final) de cada chunk leído y aún no escrito completo
+        boundaries = deque()
+        
+        def rows():
+            count = 0
+            for chunk in repo.iter_chunks(source, start=state.input_offset if state else 0):
+                count += len(chunk.emails)
+                boundaries.append((count, chunk.end_offset))
+                yield from chunk.emails
+        
+        base = state.stats if state else None
+        stats = {}
+        stream = self.service.transform_stream(rows(), new_domain, stats, seen)
+        clock = time.monotonic
+        next_checkpoint = clock() + self.checkpoint_interval
+        
+        with STREAMING_WRITERS[output_type]().open(output_file, state.output_size if state else None) as writer:
+            pending = []
+            # stats del servicio avanza por lote del engine; el checkpoint necesita
+            # los conteos exactos hasta la última fila entregada
+            done = 0
+            rejected = {}
+            for item in stream:
+                done += 1
+                if isinstance(item, Email):
+                    pending.append(item)
+                else:
+                    rejected[item.rule] = rejected.get(item.rule, 0) + 1
+                    self._log_error(error_logger, item.email, item.error)
+                
+                # Chunk completo: escribir sus filas y, si toca, guardar checkpoint
+                while boundaries and done >= boundaries[0][0]:
+                    _, end_offset = boundaries.popleft()
+                    self._write(writer, pending)
+                    pending = []
+                    if checkpointing and clock() >= next_checkpoint:
+                        save_checkpoint(state_path, RunCheckpoint(
+                            source, new_domain, output_type, end_offset, writer.flush(), error_logger.flush(),
+                            [error_logger.get_error_count(), error_logger.get_warning_count()],
+                            self._merge_stats(base, self._counted(done, rejected)), stamp))
+                        next_checkpoint = clock() + self.checkpoint_interval
+            self._write(writer, pending)
+        
+        if checkpointing:
+            remove_checkpoint(state_path)
+        stats = self._merge_stats(base, stats)
+        print(f"[OK] Saved to {output_file}")
+        logger.info(f"Transformed {stats['processed']}/{stats['total']} emails successfully")
+        return stats
+    
+    def _write(self, writer, emails: List[Email]) -> None:
+        # En modo delta, added sale de las filas finales (ya renombradas o rechazadas)
+        if self.delta is not None:
+            self.delta.record(emails)
+        writer.write(emails)
+    
+    def _load_resume_state(self, path: str, source: str, new_domain: str, output_type: str, stamp: list):
+        if output_type not in RESUMABLE_OUTPUTS:
+            raise ValueError(f"--resume supports {', '.join(RESUMABLE_OUTPUTS)} output, not {output_type}")
+        if not self._resumable:
+            raise ValueError("--resume cannot be combined with --dedup-target, --resolve-collisions or --since")
+        state = load_checkpoint(path)
+        if state is None:
+            logger.warning(f"No checkpoint found at {path}; starting from the beginning")
+        elif not state.matches(source, new_domain, output_type):
+            raise ValueError(f"Checkpoint {path} belongs to a different run "
+                             f"({state.input} -> {state.new_domain}, {state.output_type})")
+        elif state.input_stamp != stamp:
+            raise ValueError(f"{source} changed since checkpoint {path} was saved; "
+                             f"delete the checkpoint to start over")
+        return state
+    
+    @staticmethod
+    def _counted(total: int, rejected: dict) -> dict:
+        """Stats of the rows delivered so far, from their count and rejections per rule."""
+        errors = sum(rejected.values())
+        return {'total': total, 'processed': total - errors, 'errors': errors, 'error_counts': dict(rejected),
+                'success_rate': ((total - errors) / total) * 100 if total else 0}
+    
+    @staticmethod
+    def _merge_stats(base: dict, stats: dict) -> dict:
+        """Stats of the resumed part added to those saved in the checkpoint."""
+        if base is None:
+            return stats
+        merged = {key: base[key] + stats[key] for key in ('total', 'processed', 'errors')}
+        error_counts = dict(base['error_counts'])
+        for rule, count in stats['error_counts'].items():
+            error_counts[rule] = error_counts.get(rule, 0) + count
+        merged['error_counts'] = error_counts
+        merged['success_rate'] = (merged['processed'] / merged['total']) * 100 if merged['total'] else 0
+        return merged
+    
     def generate(self, transformed: list, output_type: str = 'csv', output_file: str = None):
         logger.info(f"Generating {len(transformed)} items in {output_type} format")
         
         if output_type == 'csv':
             if not output_file:
                 raise ValueError("output_file required for csv")
-            # Convert to Email objects
-            email_objects = []
-            for item in transformed:
-                if item.get('valid'):
-                    from src.features.email_processing.domain.email import Email
-                    parts = item['transformed'].split('@')
-                    if len(parts) == 2:
-                        name_parts = parts[0].split('.')
-                        if len(name_parts) == 2:
-                            email_obj = Email.create(
-                                nombre=name_parts[0],
-                                apellido=name_parts[1],
-                                correo_original=item['original'],
-                                nuevo_dominio=parts[1]
-                            )
-                            email_objects.append(email_obj)
+            email_objects = emails_from_transformed(transformed)
             CsvEmailWriter().save_emails(email_objects, output_file)
             print(f"[OK] Saved to {output_file}")
             return len(email_objects)
@@ -154,46 +359,23 @@ EXAMPLES:
         elif output_type == 'json':
             if not output_file:
                 raise ValueError("output_file required for json")
-            # Convert to Email objects
-            email_objects = []
-            for item in transformed:
-                if item.get('valid'):
-                    from src.features.email_processing.domain.email import Email
-                    parts = item['transformed'].split('@')
-                    if len(parts) == 2:
-                        name_parts = parts[0].split('.')
-                        if len(name_parts) == 2:
-                            email_obj = Email.create(
-                                nombre=name_parts[0],
-                                apellido=name_parts[1],
-                                correo_original=item['original'],
-                                nuevo_dominio=parts[1]
-                            )
-                            email_objects.append(email_obj)
-            from src.features.email_processing.adapters.output.json_adapter import JsonEmailWriter
+            email_objects = emails_from_transformed(transformed)
             JsonEmailWriter().save_emails(email_objects, output_file)
             print(f"[OK] Saved to {output_file}")
             return len(email_objects)
         
+        elif output_type == 'ndjson':
+            if not output_file:
+                raise ValueError("output_file required for ndjson")
+            email_objects = emails_from_transformed(transformed)
+            NdjsonEmailWriter().save_emails(email_objects, output_file)
+            print(f"[OK] Saved to {output_file}")
+            return len(email_objects)
+        
         elif output_type == 'excel':
             if not output_file:
                 raise ValueError("output_file required for excel")
-            email_objects = []
-            for item in transformed:
-                if item.get('valid'):
-                    from src.features.email_processing.domain.email import Email
-                    parts = item['transformed'].split('@')
-                    if len(parts) == 2:
-                        name_parts = parts[0].split('.')
-                        if len(name_parts) == 2:
-                            email_obj = Email.create(
-                                nombre=name_parts[0],
-                                apellido=name_parts[1],
-                                correo_original=item['original'],
-                                nuevo_dominio=parts[1]
-                            )
-                            email_objects.append(email_obj)
-            from src.features.email_processing.adapters.output.excel_adapter import ExcelEmailWriter
+            email_objects = emails_from_transformed(transformed)
             ExcelEmailWriter().save_emails(email_objects, output_file)
             print(f"[OK] Saved to {output_file}")
             return len(email_objects)
@@ -201,21 +383,7 @@ EXAMPLES:
         elif output_type == 'txt':
             if not output_file:
                 raise ValueError("output_file required for txt")
-            email_objects = []
-            for item in transformed:
-                if item.get('valid'):
-                    from src.features.email_processing.domain.email import Email
-                    parts = item['transformed'].split('@')
-                    if len(parts) == 2:
-                        name_parts = parts[0].split('.')
-                        if len(name_parts) == 2:
-                            email_obj = Email.create(
-                                nombre=name_parts[0],
-                                apellido=name_parts[1],
-                                correo_original=item['original'],
-                                nuevo_dominio=parts[1]
-                            )
-                            email_objects.append(email_obj)
+            email_objects = emails_from_transformed(transformed)
             from src.features.email_processing.adapters.output.txt_adapter import TxtEmailWriter
             TxtEmailWriter().save_emails(email_objects, output_file)
             print(f"[OK] Saved to {output_file}")
@@ -224,13 +392,8 @@ EXAMPLES:
         elif output_type == 'inline':
             # Mostrar los 4 campos según PDD
             print("Nombre,Apellido,Correo Original,Correo Nuevo")
-            for item in transformed:
-                if item.get('valid'):
-                    parts = item['transformed'].split('@')
-                    if len(parts) == 2:
-                        name_parts = parts[0].split('.')
-                        if len(name_parts) == 2:
-                            print(f"{name_parts[0].capitalize()},{name_parts[1].capitalize()},{item['original']},{item['transformed']}")
+            for row in email_rows(emails_from_transformed(transformed)):
+                print(','.join(row))
             return sum(1 for item in transformed if item.get('valid'))
         
         elif output_type == 'silent':
@@ -240,38 +403,71 @@ EXAMPLES:
         else:
             raise ValueError(f"Invalid output_type: {output_type}")
     
+    def write_delta(self, output_file: str = None) -> dict:
+        """
+        After a --since run, write <output>.added.csv and <output>.removed.csv
+        next to the merged output and return the delta counts.
+        """
+        stem = os.path.splitext(output_file)[0] if output_file else 'delta'
+        added, removed = self.delta.added, self.delta.removed()
+        writer = CsvEmailWriter()
+        writer.save_emails(added, f"{stem}.added.csv")
+        writer.save_emails(removed, f"{stem}.removed.csv")
+        
+        counts = {'added': len(added), 'removed': len(removed), 'unchanged': self.delta.unchanged}
+        logger.info(f"Delta: {counts['added']} added, {counts['removed']} removed, {counts['unchanged']} unchanged")
+        print(f"[OK] Delta: +{counts['added']} -{counts['removed']} ={counts['unchanged']} "
+              f"({stem}.added.csv, {stem}.removed.csv)")
+        return counts
+    
     def run(self, config: dict):
         start_time = time.time()
         error_logger = ErrorLogger()
         
         try:
-            # Extract
-            emails = self.extract(config['input'], config.get('input_type', 'file'))
-            
-            # Validar archivo vacío
-            if len(emails) == 0:
-                error_logger.log_warning("N/A", "Archivo de entrada vacío")
-                logger.warning("Archivo de entrada vacío")
-            
-            # Transform
-            transformed = self.transform(emails, config['new_domain'], error_logger)
+            output_type = config.get('output_type', 'csv')
+            if (config.get('input_type', 'file') == 'file' and output_type in STREAMING_WRITERS
+                    and config.get('output_file')):
+                # Extract -> Transform -> Generate por lotes, sin cargar el archivo completo
+                result = self.stream_to_file(config['input'], config['new_domain'], config['output_file'],
+                                             output_type, error_logger, config.get('resume', False))
+                total, valid = result['total'], result['processed']
+                
+                # Validar archivo vacío
+                if total == 0:
+                    error_logger.log_warning("N/A", "Archivo de entrada vacío")
+                    logger.warning("Archivo de entrada vacío")
+            else:
+                # Extract
+                emails = self.extract(config['input'], config.get('input_type', 'file'))
+                
+                # Validar archivo vacío
+                if len(emails) == 0:
+                    error_logger.log_warning("N/A", "Archivo de entrada vacío")
+                    logger.warning("Archivo de entrada vacío")
+                
+                # Transform
+                transformed = self.transform(emails, config['new_domain'], error_logger)
+                
+                # Generate
+                count = self.generate(transformed, config.get('output_type', 'csv'), config.get('output_file'))
+                total, valid = len(emails), sum(1 for t in transformed if t.get('valid'))
             
-            # Generate
-            count = self.generate(transformed, config.get('output_type', 'csv'), config.get('output_file'))
+            if self.delta is not None:
+                self.write_delta(config.get('output_file'))
             
             # Guardar error log
             error_logger.save()
             
             # Generar resumen
             duration = time.time() - start_time
-            valid = sum(1 for t in transformed if t.get('valid'))
             stats = {
-                'total': len(emails),
+                'total': total,
                 'processed': valid,
                 'errors': error_logger.get_error_count(),
                 'duplicates': error_logger.get_warning_count(),
                 'warnings': error_logger.get_warning_count(),
-                'success_rate': (valid / len(emails) * 100) if emails else 0,
+                'success_rate': (valid / total * 100) if total else 0,
                 'duration': f"{duration:.2f}s",
                 'output_file': config.get('output_file', 'N/A'),
                 'error_log': 'error_log.txt',
@@ -280,13 +476,16 @@ EXAMPLES:
             
             SummaryGenerator.generate(stats)
             
-            logger.info(f"Processed {valid}/{len(emails)} emails successfully")
+            logger.info(f"Processed {valid}/{total} emails successfully")
             
             if config.get('output_type') != 'silent':
-                print(f"\n[OK] Processed {valid}/{len(emails)} emails")
+                print(f"\n[OK] Processed {valid}/{total} emails")
                 print(f"[OK] Error log: error_log.txt")
                 print(f"[OK] Summary: summary.txt")
         
         except Exception as e:
             logger.error(f"Error: {e}")
             raise
+        finally:
+            self.service.close()
+            self.logger.close()
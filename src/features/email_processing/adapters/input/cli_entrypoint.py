@@ -9,24 +9,65 @@ def main():
     parser.add_argument('--input-type', choices=['file', 'list', 'text'], default='file', help='Input type')
     parser.add_argument('--input', required=True, help='Input data')
     parser.add_argument('--new-domain', required=True, help='New domain for emails')
-    parser.add_argument('--output-type', choices=['csv', 'json', 'excel', 'txt', 'inline', 'silent'], default='csv', help='Output type')
-    parser.add_argument('--output', help='Output file (required for csv/json)')
+    parser.add_argument('--output-type', choices=['csv', 'json', 'ndjson', 'excel', 'txt', 'inline', 'silent'], default='csv', help='Output type')
+    parser.add_argument('--output', help='Output file (required for csv/json/ndjson/excel/txt)')
+    parser.add_argument('--workers', type=int, default=1, help='Parallel worker processes for validation (default: 1)')
+    parser.add_argument('--engine', choices=['sequential', 'vectorized'], default='sequential', help='Transform engine (vectorized requires numpy)')
+    parser.add_argument('--dedup', choices=['exact', 'hash64', 'hash128', 'disk'], default='exact',
+                        help='Duplicate detection: in-memory set, hashed digests or on-disk index (default: exact)')
+    parser.add_argument('--bloom', action='store_true', help='Bloom filter in front of --dedup disk')
+    parser.add_argument('--expected-rows', type=int, default=1_000_000,
+                        help='Expected distinct rows, sizes the --bloom filter (default: 1000000)')
+    parser.add_argument('--dedup-target', action='store_true',
+                        help='Reject rows whose generated address was already issued (rule DUP-TARGET)')
+    parser.add_argument('--resolve-collisions', action='store_true',
+                        help='Give colliding generated addresses a numeric suffix instead of keeping duplicates')
+    parser.add_argument('--directory', help='Existing mailboxes to pre-seed collision resolution (.txt or .csv)')
+    parser.add_argument('--suffix-format', default='{local}{n}', help='Collision suffix pattern (default: {local}{n})')
+    parser.add_argument('--cache', help='SQLite file caching transform results between runs')
+    parser.add_argument('--cache-max-entries', type=int, default=5_000_000,
+                        help='Max cached results; oldest are evicted (default: 5000000)')
+    parser.add_argument('--since', help='Previous output CSV: transform only new addresses and write added/removed files')
+    parser.add_argument('--resume', action='store_true', help='Continue an interrupted run from <output>.checkpoint')
+    parser.add_argument('--checkpoint-interval', type=float, default=60.0,
+                        help='Seconds between checkpoints for file -> csv/ndjson runs, 0 disables (default: 60)')
+    parser.add_argument('--log-mode', choices=['sync', 'async'], default='sync', help='Run log handlers on a background thread (async)')
+    parser.add_argument('--log-records', action='store_true', help='Log a warning per rejected/duplicate email')
+    parser.add_argument('--warning-sample', type=int, default=1, help='Keep 1 of every N per-record warnings (default: 1)')
+    parser.add_argument('--warning-rate', type=int, help='Max per-record warnings per second (default: unlimited)')
     
     args = parser.parse_args()
     
-    if args.output_type in ['csv', 'json', 'excel', 'txt'] and not args.output:
+    if args.output_type in ['csv', 'json', 'ndjson', 'excel', 'txt'] and not args.output:
         parser.error(f"--output required for {args.output_type}")
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.engine == 'vectorized' and args.workers > 1:
+        parser.error("--workers cannot be combined with --engine vectorized")
+    if args.warning_sample < 1:
+        parser.error("--warning-sample must be >= 1")
+    if args.warning_rate is not None and args.warning_rate < 1:
+        parser.error("--warning-rate must be >= 1")
     
     config = {
         'input_type': args.input_type,
         'input': args.input,
         'new_domain': args.new_domain,
         'output_type': args.output_type,
-        'output_file': args.output
+        'output_file': args.output,
+        'resume': args.resume
     }
     
-    cli = EmailProcessingCLI()
     try:
+        cli = EmailProcessingCLI(workers=args.workers, engine=args.engine,
+                                 async_logging=args.log_mode == 'async',
+                                 warning_sample=args.warning_sample, warning_rate=args.warning_rate,
+                                 log_records=args.log_records, dedup=args.dedup, bloom=args.bloom,
+                                 expected_rows=args.expected_rows,
+                                 dedup_target=args.dedup_target, resolve_collisions=args.resolve_collisions,
+                                 directory=args.directory, suffix_format=args.suffix_format,
+                                 cache=args.cache, cache_max_entries=args.cache_max_entries, since=args.since,
+                                 checkpoint_interval=args.checkpoint_interval)
         cli.run(config)
     except FileNotFoundError as e:
         print(f"[ERROR] {e}", file=sys.stderr)
@@ -1,9 +1,11 @@
 import logging
 import base64
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Iterable, Optional
 from src.features.email_processing.domain.email_service import EmailProcessingService
-from src.shared.validation_adapter import RegexEmailValidator
+from src.shared.validation_adapter import CompiledEmailValidator
 from src.shared.logging_adapter import PythonLogger
+from src.shared.request_log import RequestLog
 
 logger = logging.getLogger(__name__)
 
@@ -12,27 +14,31 @@ class EmailProcessingLambda:
     """
     Lambda adapter for email processing.
     Handles AWS Lambda events and responses following hexagonal architecture.
+
+    Each step records its counts and timings in request_log; the handler
+    logs them as one line per invocation (see RequestLog).
     """
     
-    def __init__(self):
+    def __init__(self, request_log: Optional[RequestLog] = None):
         # Dependency Injection
-        self.validator = RegexEmailValidator()
+        self.validator = CompiledEmailValidator()
         self.logger = PythonLogger("lambda")
-        self.service = EmailProcessingService(self.validator, self.logger)
+        # Sin líneas INFO por ejecución: el resumen va en la línea de RequestLog
+        self.service = EmailProcessingService(self.validator, self.logger, log_summary=False)
+        self.request_log = request_log or RequestLog.from_env(logger)
     
     def extract(self, data: Dict[str, Any]) -> list:
         """Extract emails from different input types."""
         input_type = data.get('input_type', 'list')
         input_data = data.get('input', data.get('emails', []))
         
-        logger.info(f"Extracting emails from {input_type}")
-        
         if input_type == 'file':
             file_content = data.get('file_content')
             if not file_content:
                 raise ValueError('file_content required for input_type=file')
             decoded = base64.b64decode(file_content).decode('utf-8')
             emails = [e.strip() for e in decoded.split('\n') if e.strip()]
+            self.request_log.add(file_bytes=len(decoded))
         elif input_type == 'list':
             emails = input_data if isinstance(input_data, list) else [input_data]
         elif input_type == 'text':
@@ -40,14 +46,25 @@ class EmailProcessingLambda:
         else:
             raise ValueError('Invalid input_type. Use: file, list, or text')
         
-        logger.info(f"Extracted {len(emails)} emails")
+        self.request_log.add(input_type=input_type, extracted=len(emails))
         return emails
     
+    def validate_batch(self, emails: Iterable[str]) -> Dict[str, Any]:
+        """Validate many emails: per-item {'index', 'valid'[, 'rule']} plus valid/total counts."""
+        start = time.perf_counter()
+        results = list(self.service.validate_batch(emails))
+        valid = sum(1 for r in results if r['valid'])
+        self.request_log.add(validated=len(results), valid=valid,
+                             validate_ms=round((time.perf_counter() - start) * 1000, 2))
+        return {'results': results, 'valid': valid, 'total': len(results)}
+
     def transform(self, emails: list, new_domain: str) -> Dict[str, Any]:
         """Transform emails using domain service."""
-        logger.info(f"Transforming {len(emails)} emails to domain {new_domain}")
+        start = time.perf_counter()
         result = self.service.transform_emails(emails, new_domain)
-        logger.info(f"Transformed {result['processed']}/{result['total']} emails successfully")
+        self.request_log.add(total=result['total'], processed=result['processed'], errors=result['errors'],
+                             error_counts=result['error_counts'],
+                             transform_ms=round((time.perf_counter() - start) * 1000, 2))
         return result
     
     def generate(self, result: Dict[str, Any], output_type: str = 'json') -> Dict[str, Any]:
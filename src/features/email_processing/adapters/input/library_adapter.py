@@ -3,9 +3,10 @@ Library Usage Adapter - Modular & Stateless
 """
 from typing import Union, List
 from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.features.email_processing.domain.transform_result import TransformResult, emails_from_transformed
 from src.features.email_processing.adapters.output.file_adapter import FileEmailRepository
 
-from src.shared.validation_adapter import RegexEmailValidator
+from src.shared.validation_adapter import CompiledEmailValidator
 from src.shared.logging_adapter import PythonLogger
 
 
@@ -16,11 +17,30 @@ class EmailProcessingLibrary:
     """
     
     # Shared service instance
-    _validator = RegexEmailValidator()
+    _validator = CompiledEmailValidator()
     _logger = PythonLogger("library")
     _service = EmailProcessingService(_validator, _logger)
     _error_logger = None
     
+    @classmethod
+    def configure_logging(cls, async_mode: bool = False, warning_sample: int = 1, warning_rate: int = None,
+                          log_records: bool = False):
+        """
+        Configure library logging.
+        
+        Args:
+            async_mode: If True, log handlers run on a background thread
+            warning_sample: Keep 1 of every N per-record warnings
+            warning_rate: Max per-record warnings per second (None = unlimited)
+            log_records: If True, log a warning per rejected/duplicate email
+                (otherwise only per-rule totals are logged)
+        
+        Calling it with the defaults drains pending records and restores
+        synchronous logging.
+        """
+        cls._logger.configure(async_mode, warning_sample, warning_rate)
+        cls._service.log_records = log_records
+    
     @staticmethod
     def extract(input_data: Union[str, List[str]], input_type: str = 'file') -> List[str]:
         """
@@ -43,7 +63,7 @@ class EmailProcessingLibrary:
             raise ValueError(f"Invalid input_type: {input_type}")
     
     @classmethod
-    def transform(cls, emails: List[str], new_domain: str, enable_logging: bool = False) -> List[dict]:
+    def transform(cls, emails: List[str], new_domain: str, enable_logging: bool = False) -> TransformResult:
         """
         Transform emails to new domain.
         
@@ -53,7 +73,8 @@ class EmailProcessingLibrary:
             enable_logging: If True, generates error_log.txt
         
         Returns:
-            List of dicts with 'original', 'transformed', 'valid' keys
+            TransformResult: list of dicts with 'original', 'transformed', 'valid'
+            keys that also carries the Email objects in `.emails`
         """
         # Initialize error logger if enabled
         if enable_logging:
@@ -63,13 +84,7 @@ class EmailProcessingLibrary:
         # Use domain service
         result = cls._service.transform_emails(emails, new_domain)
         
-        transformed = []
-        for email in result['emails']:
-            transformed.append({
-                'original': email.correo_original,
-                'transformed': str(email),
-                'valid': True
-            })
+        transformed = TransformResult.from_emails(result['emails'])
         
         for error in result['error_details']:
             # Log error if enabled
@@ -103,8 +118,8 @@ class EmailProcessingLibrary:
         
         Args:
             transformed: List of transformed email dicts
-            output_type: 'csv', 'json', 'inline', or 'silent'
-            output_file: Output file path (required for csv/json)
+            output_type: 'csv', 'json', 'ndjson', 'inline', or 'silent'
+            output_file: Output file path (required for csv/json/ndjson)
             enable_summary: If True, generates summary.txt
         
         Returns:
@@ -128,22 +143,7 @@ class EmailProcessingLibrary:
         if output_type == 'csv':
             if not output_file:
                 raise ValueError("output_file required for csv")
-            # Convert to Email objects
-            from src.features.email_processing.domain.email import Email
-            email_objects = []
-            for item in transformed:
-                if item.get('valid'):
-                    parts = item['transformed'].split('@')
-                    if len(parts) == 2:
-                        name_parts = parts[0].split('.')
-                        if len(name_parts) == 2:
-                            email_obj = Email.create(
-                                nombre=name_parts[0],
-                                apellido=name_parts[1],
-                                correo_original=item['original'],
-                                nuevo_dominio=parts[1]
-                            )
-                            email_objects.append(email_obj)
+            email_objects = emails_from_transformed(transformed)
             from src.features.email_processing.adapters.output.csv_adapter import CsvEmailWriter
             CsvEmailWriter().save_emails(email_objects, output_file)
             return len(email_objects)
@@ -151,26 +151,19 @@ class EmailProcessingLibrary:
         elif output_type == 'json':
             if not output_file:
                 raise ValueError("output_file required for json")
-            # Convert to Email objects
-            from src.features.email_processing.domain.email import Email
             from src.features.email_processing.adapters.output.json_adapter import JsonEmailWriter
-            email_objects = []
-            for item in transformed:
-                if item.get('valid'):
-                    parts = item['transformed'].split('@')
-                    if len(parts) == 2:
-                        name_parts = parts[0].split('.')
-                        if len(name_parts) == 2:
-                            email_obj = Email.create(
-                                nombre=name_parts[0],
-                                apellido=name_parts[1],
-                                correo_original=item['original'],
-                                nuevo_dominio=parts[1]
-                            )
-                            email_objects.append(email_obj)
+            email_objects = emails_from_transformed(transformed)
             JsonEmailWriter().save_emails(email_objects, output_file)
             return len(email_objects)
         
+        elif output_type == 'ndjson':
+            if not output_file:
+                raise ValueError("output_file required for ndjson")
+            from src.features.email_processing.adapters.output.json_adapter import NdjsonEmailWriter
+            email_objects = emails_from_transformed(transformed)
+            NdjsonEmailWriter().save_emails(email_objects, output_file)
+            return len(email_objects)
+        
         elif output_type == 'inline':
             emails = [item['transformed'] for item in transformed if item.get('valid')]
             return emails
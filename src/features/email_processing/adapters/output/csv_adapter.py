@@ -1,8 +1,9 @@
 import csv
 import io
-from typing import List
+import os
+from typing import Iterable, Iterator, List
 from src.features.email_processing.domain.ports import EmailWriter, OutputFormatter
-from src.features.email_processing.domain.email import Email
+from src.features.email_processing.domain.email import Email, email_rows
 
 
 class CsvEmailWriter(EmailWriter):
@@ -13,8 +14,127 @@ class CsvEmailWriter(EmailWriter):
         with open(destination, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(self.headers)
-            for email in emails:
-                writer.writerow(email.to_list())
+            writer.writerows(email_rows(emails))
+
+
+class StreamingCsvWriter(EmailWriter):
+    """
+    Writes rows as they arrive instead of waiting for the full list.
+
+    Usage:
+        with StreamingCsvWriter().open('result.csv') as writer:
+            for batch in batches:
+                writer.write(batch)
+
+    Rows go through a large write buffer that is flushed every flush_every
+    rows and at the end of each write() call, so output reaches disk while
+    the transform stage is still running and memory does not grow with the
+    number of rows.
+    """
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+    DEFAULT_FLUSH_EVERY = 10_000
+
+    def __init__(self, headers: List[str] = None, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 flush_every: int = DEFAULT_FLUSH_EVERY):
+        if flush_every < 1:
+            raise ValueError("flush_every must be >= 1")
+        self.headers = headers or ['Nombre', 'Apellido', 'Correo Original', 'Correo Nuevo']
+        self.buffer_size = buffer_size
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self._file = None
+        self._writer = None
+
+    def open(self, destination: str, offset: int = None) -> 'StreamingCsvWriter':
+        """
+        Start a new file, or with offset (a size returned by flush()) cut an
+        interrupted file back to that point and append to it.
+        """
+        self.rows_written = 0
+        if offset is not None:
+            os.truncate(destination, offset)
+            self._file = open(destination, 'a', newline='', encoding='utf-8', buffering=self.buffer_size)
+            self._writer = csv.writer(self._file)
+            return self
+        self._file = open(destination, 'w', newline='', encoding='utf-8', buffering=self.buffer_size)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.headers)
+        self._file.flush()
+        return self
+
+    def flush(self) -> int:
+        """Flush and fsync buffered rows; returns the file size (a valid open() offset)."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def write(self, emails: Iterable[Email]) -> int:
+        """Write a batch (list, EmailBatch or any iterator of Email); returns rows written."""
+        if self._writer is None:
+            raise ValueError("Writer is not open")
+        writerow = self._writer.writerow
+        count = 0
+        for row in email_rows(emails):
+            writerow(row)
+            count += 1
+            if (self.rows_written + count) % self.flush_every == 0:
+                self._file.flush()
+        self.rows_written += count
+        self._file.flush()
+        return count
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def save_emails(self, emails: Iterable[Email], destination: str):
+        with self.open(destination):
+            self.write(emails)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_csv(emails: Iterable[Email], headers: List[str] = None, header: bool = True) -> Iterator[str]:
+    """Yield CSV text row by row (header first unless header=False), for streamed responses."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(headers or ['Nombre', 'Apellido', 'Correo Original', 'Correo Nuevo'])
+    for row in email_rows(emails):
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_csv_rows(source: str) -> Iterator[List[str]]:
+    """
+    Read back a CSV written by CsvEmailWriter / StreamingCsvWriter as plain
+    [nombre, apellido, correo_original, correo_nuevo] rows (no Email objects).
+    """
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Archivo no encontrado: {source}")
+    with open(source, newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is not None and len(header) != 4:
+            raise ValueError(f"Expected 4 columns (Nombre, Apellido, Correo Original, Correo Nuevo) in {source}")
+        for row in reader:
+            if len(row) == 4:
+                yield row
+
+
+def iter_csv_emails(source: str) -> Iterator[Email]:
+    """Read back a CSV written by CsvEmailWriter / StreamingCsvWriter, one Email per row."""
+    for row in iter_csv_rows(source):
+        yield Email(*row)
 
 
 class CsvFormatter(OutputFormatter):
@@ -27,6 +147,5 @@ class CsvFormatter(OutputFormatter):
         output = io.StringIO()
         writer = csv.writer(output)
         writer.writerow(self.headers)
-        for email in emails:
-            writer.writerow(email.to_list())
+        writer.writerows(email_rows(emails))
         return output.getvalue()
\ No newline at end of file
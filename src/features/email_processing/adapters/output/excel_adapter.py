@@ -1,28 +1,87 @@
-from typing import List
+from typing import Iterable, List
 from src.features.email_processing.domain.ports import EmailWriter
-from src.features.email_processing.domain.email import Email
+from src.features.email_processing.domain.email import Email, email_rows
 
 
 class ExcelEmailWriter(EmailWriter):
-    def __init__(self, headers: List[str] = None):
+    """
+    Writes emails to .xlsx.
+
+    By default uses an openpyxl write-only workbook: rows are serialized as
+    they are appended instead of being kept as cell objects, so memory stays
+    flat. When a sheet reaches max_rows (Excel's limit, header included) the
+    writer continues on a new sheet ("Correos Procesados 2", ...) with the
+    same headers. write_only=False keeps the previous in-memory workbook.
+    """
+    MAX_ROWS = 1_048_576
+    SHEET_TITLE = "Correos Procesados"
+
+    def __init__(self, headers: List[str] = None, write_only: bool = True, max_rows: int = MAX_ROWS):
+        if max_rows < 2:
+            raise ValueError("max_rows must be >= 2")
         self.headers = headers or ['Nombre', 'Apellido', 'Correo Original', 'Correo Nuevo']
-    
-    def save_emails(self, emails: List[Email], destination: str):
+        self.write_only = write_only
+        self.max_rows = max_rows
+        self.rows_written = 0
+        self._wb = None
+        self._ws = None
+        self._sheet_rows = 0
+        self._sheets = 0
+        self._destination = None
+
+    def open(self, destination: str) -> 'ExcelEmailWriter':
         try:
-            import openpyxl
             from openpyxl import Workbook
         except ImportError:
             raise ImportError("openpyxl required for Excel output. Install: pip install openpyxl")
-        
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Correos Procesados"
-        
+
+        self._wb = Workbook(write_only=self.write_only)
+        self._destination = destination
+        self.rows_written = 0
+        self._sheets = 0
+        self._add_sheet()
+        return self
+
+    def _add_sheet(self):
+        self._sheets += 1
+        title = self.SHEET_TITLE if self._sheets == 1 else f"{self.SHEET_TITLE} {self._sheets}"
+        if self._sheets == 1 and not self.write_only:
+            # El workbook normal ya trae una hoja activa
+            self._ws = self._wb.active
+            self._ws.title = title
+        else:
+            self._ws = self._wb.create_sheet(title)
+
         # Headers
-        ws.append(self.headers)
-        
-        # Data
-        for email in emails:
-            ws.append(email.to_list())
-        
-        wb.save(destination)
+        self._ws.append(self.headers)
+        self._sheet_rows = 1
+
+    def write(self, emails: Iterable[Email]) -> int:
+        """Append a batch (list, EmailBatch or any iterator of Email); returns rows written."""
+        if self._wb is None:
+            raise ValueError("Writer is not open")
+        count = 0
+        for row in email_rows(emails):
+            if self._sheet_rows >= self.max_rows:
+                self._add_sheet()
+            self._ws.append(row)
+            self._sheet_rows += 1
+            count += 1
+        self.rows_written += count
+        return count
+
+    def close(self) -> None:
+        if self._wb is not None:
+            self._wb.save(self._destination)
+            self._wb = None
+            self._ws = None
+
+    def save_emails(self, emails: Iterable[Email], destination: str):
+        with self.open(destination):
+            self.write(emails)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
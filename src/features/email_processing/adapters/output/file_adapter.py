@@ -1,21 +1,106 @@
+import csv
 import os
-from typing import List
+from typing import Iterator, List, NamedTuple, Optional
 from src.features.email_processing.domain.ports import EmailRepository
 
 
+class EmailChunk(NamedTuple):
+    """Bounded batch of emails plus the byte offset where it ends in the source file."""
+    emails: List[str]
+    end_offset: int
+
+
 class FileEmailRepository(EmailRepository):
+    DEFAULT_CHUNK_LINES = 10_000
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, chunk_lines: int = DEFAULT_CHUNK_LINES, chunk_bytes: Optional[int] = None,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        if chunk_lines < 1:
+            raise ValueError("chunk_lines must be >= 1")
+        if chunk_bytes is not None and chunk_bytes < 1:
+            raise ValueError("chunk_bytes must be >= 1")
+        self.chunk_lines = chunk_lines
+        self.chunk_bytes = chunk_bytes
+        self.buffer_size = buffer_size
+
     def read_emails(self, source: str) -> List[str]:
+        return list(self.iter_emails(source))
+
+    def read(self, source: str) -> List[str]:
+        """Alias para read_emails para compatibilidad"""
+        return self.read_emails(source)
+
+    def iter_emails(self, source: str) -> Iterator[str]:
+        """Yield emails one by one without loading the whole file."""
+        for chunk in self.iter_chunks(source):
+            yield from chunk.emails
+
+    def iter_chunks(self, source: str, start: int = 0, stop: Optional[int] = None) -> Iterator[EmailChunk]:
+        """
+        Yield emails in bounded batches.
+
+        A batch is closed when it holds chunk_lines emails or, if chunk_bytes
+        is set, when the raw bytes read for it reach chunk_bytes. The file is
+        read through a large buffered handle, so only one batch is in memory.
+        start / stop are byte offsets at line boundaries (e.g. end_offset of
+        a previous chunk) to read only part of the file; offsets stay
+        absolute. Lines may end in '\n', '\r\n' or a bare '\r' (as in text
+        mode); offsets and batch limits only advance at '\n', so a file
+        that uses bare '\r' throughout is read as a single block.
+        """
         if not os.path.exists(source):
             raise FileNotFoundError(f"Archivo no encontrado: {source}")
-        
-        with open(source, 'r', encoding='utf-8') as file:
+        if stop is not None and stop <= start:
+            return
+
+        with open(source, 'rb', buffering=self.buffer_size) as file:
+            file.seek(start)
             emails = []
-            for line in file:
-                line = line.strip()
-                if line and not line.startswith('#') and '@' in line:
+            offset = start
+            chunk_start = start
+            for raw_line in file:
+                offset += len(raw_line)
+                line = raw_line.decode('utf-8').strip()
+                if '\r' in line:
+                    # '\r' suelto (Mac clásico): mismos saltos que el modo texto
+                    for part in line.replace('\r\n', '\n').replace('\r', '\n').split('\n'):
+                        part = part.strip()
+                        if part and not part.startswith('#') and '@' in part:
+                            emails.append(part)
+                elif line and not line.startswith('#') and '@' in line:
                     emails.append(line)
-            return emails
-    
-    def read(self, source: str) -> List[str]:
-        """Alias para read_emails para compatibilidad"""
-        return self.read_emails(source)
\ No newline at end of file
+
+                if stop is not None and offset >= stop:
+                    break
+                if len(emails) >= self.chunk_lines or (
+                        self.chunk_bytes is not None and offset - chunk_start >= self.chunk_bytes):
+                    if emails:
+                        yield EmailChunk(emails, offset)
+                        emails = []
+                    chunk_start = offset
+
+            if emails:
+                yield EmailChunk(emails, offset)
+
+
+def iter_directory(source: str, column: str = 'Correo Nuevo') -> Iterator[str]:
+    """
+    Yield existing mailboxes from a directory export.
+
+    .csv files are read by column (default: the 'Correo Nuevo' column of a
+    previous run's output); any other file is read as one address per line.
+    """
+    if not source.lower().endswith('.csv'):
+        yield from FileEmailRepository().iter_emails(source)
+        return
+
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Archivo no encontrado: {source}")
+    with open(source, newline='', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        if column not in (reader.fieldnames or []):
+            raise ValueError(f"Column '{column}' not found in {source}")
+        for row in reader:
+            if row[column]:
+                yield row[column]
@@ -1,42 +1,203 @@
 import json
-from typing import List
+import os
+from abc import abstractmethod
+from typing import Iterable, Iterator, List, Optional
 from src.features.email_processing.domain.ports import EmailWriter, OutputFormatter
-from src.features.email_processing.domain.email import Email
-
-
-class JsonEmailWriter(EmailWriter):
-    def save_emails(self, emails: List[Email], destination: str):
-        data = {
-            'emails': [
-                {
-                    'nombre': email.nombre,
-                    'apellido': email.apellido,
-                    'correo_original': email.correo_original,
-                    'correo_nuevo': email.correo_nuevo
-                }
-                for email in emails
-            ],
-            'total': len(emails)
-        }
-        
-        with open(destination, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+from src.features.email_processing.domain.email import Email, email_dicts
+
+# Salida compacta para consumidores máquina; un solo encoder reutilizado por registro
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+# JSON compacto de un valor (respuestas NDJSON, líneas de log)
+compact_json = _COMPACT_ENCODER.encode
+
+
+def iter_ndjson(emails: Iterable[Email]) -> Iterator[str]:
+    """Yield one JSON object per line (NDJSON / JSON Lines)."""
+    encode = _COMPACT_ENCODER.encode
+    for record in email_dicts(emails):
+        yield encode(record) + '\n'
+
+
+def iter_ndjson_values(lines: Iterable[str], key: Optional[str] = 'email') -> Iterator:
+    """
+    Parse NDJSON input lines, skipping blank ones.
+
+    With key set, object lines yield that field and bare JSON strings are
+    yielded as-is; with key=None each decoded value is yielded unchanged.
+    Raises ValueError (with the line number) for a line that is not JSON or
+    an object without the key.
+    """
+    decode = json.JSONDecoder().decode
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            value = decode(line)
+        except ValueError as e:
+            raise ValueError(f"Invalid NDJSON at line {number}: {e}") from e
+        if key is not None and isinstance(value, dict):
+            if key not in value:
+                raise ValueError(f"Invalid NDJSON at line {number}: missing \"{key}\"")
+            value = value[key]
+        yield value
+
+
+class JsonArrayEncoder:
+    """
+    Incremental encoder for the {"emails": [...], "total": n} document.
+
+    Records are encoded one at a time, so the full document is never built
+    in memory. With indent set, the output matches json.dumps(indent=...).
+    """
+
+    def __init__(self, indent: Optional[int] = None):
+        self.indent = indent
+        self.count = 0
+        if indent is None:
+            self._encoder = _COMPACT_ENCODER
+        else:
+            self._encoder = json.JSONEncoder(ensure_ascii=False, indent=indent)
+
+    def start(self) -> str:
+        self.count = 0
+        if self.indent is None:
+            return '{"emails":['
+        return '{\n' + ' ' * self.indent + '"emails": ['
+
+    def encode(self, emails: Iterable[Email]) -> Iterator[str]:
+        encode = self._encoder.encode
+        if self.indent is None:
+            for record in email_dicts(emails):
+                yield (',' if self.count else '') + encode(record)
+                self.count += 1
+        else:
+            pad = '\n' + ' ' * (self.indent * 2)
+            for record in email_dicts(emails):
+                yield (',' if self.count else '') + pad + encode(record).replace('\n', pad)
+                self.count += 1
+
+    def end(self) -> str:
+        if self.indent is None:
+            return f'],"total":{self.count}}}'
+        pad = '\n' + ' ' * self.indent
+        return (pad if self.count else '') + '],' + pad + f'"total": {self.count}\n}}'
+
+    def iterencode(self, emails: Iterable[Email]) -> Iterator[str]:
+        yield self.start()
+        yield from self.encode(emails)
+        yield self.end()
+
+
+class _StreamingJsonWriter(EmailWriter):
+    """Shared open/write/close cycle: chunks go through a large buffer, flushed after each write()."""
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self.rows_written = 0
+        self._file = None
+
+    # Solo los formatos sin cabecera ni cierre admiten reanudar a mitad de archivo
+    APPENDABLE = False
+
+    def open(self, destination: str, offset: int = None):
+        """Start a new file, or with offset (see flush()) truncate and append (appendable formats only)."""
+        self.rows_written = 0
+        if offset is not None:
+            if not self.APPENDABLE:
+                raise ValueError(f"{type(self).__name__} cannot append to an existing file")
+            os.truncate(destination, offset)
+            self._file = open(destination, 'a', encoding='utf-8', buffering=self.buffer_size)
+            return self
+        self._file = open(destination, 'w', encoding='utf-8', buffering=self.buffer_size)
+        self._file.write(self._header())
+        return self
+
+    def flush(self) -> int:
+        """Flush and fsync written records; returns the file size (a valid open() offset)."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def write(self, emails: Iterable[Email]) -> int:
+        """Write a batch (list, EmailBatch or any iterator of Email); returns rows written."""
+        if self._file is None:
+            raise ValueError("Writer is not open")
+        count = 0
+        for chunk in self._records(emails):
+            self._file.write(chunk)
+            count += 1
+        self.rows_written += count
+        self._file.flush()
+        return count
+
+    def close(self, complete: bool = True) -> None:
+        """Write the footer and close; complete=False leaves the document visibly truncated."""
+        if self._file is not None:
+            if complete:
+                self._file.write(self._footer())
+            self._file.close()
+            self._file = None
+
+    def save_emails(self, emails: Iterable[Email], destination: str):
+        with self.open(destination):
+            self.write(emails)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Sin cierre ]} si hubo excepción: un documento a medias no debe parecer completo
+        self.close(complete=exc_type is None)
+
+    def _header(self) -> str:
+        return ''
+
+    @abstractmethod
+    def _records(self, emails: Iterable[Email]) -> Iterator[str]:
+        """Encoded chunks for a batch of emails."""
+
+    def _footer(self) -> str:
+        return ''
+
+
+class JsonEmailWriter(_StreamingJsonWriter):
+    """Writes {"emails": [...], "total": n} incrementally (compact unless indent is given)."""
+
+    def __init__(self, indent: Optional[int] = None, buffer_size: int = _StreamingJsonWriter.DEFAULT_BUFFER_SIZE):
+        super().__init__(buffer_size)
+        self._encoder = JsonArrayEncoder(indent)
+
+    def _header(self) -> str:
+        return self._encoder.start()
+
+    def _records(self, emails: Iterable[Email]) -> Iterator[str]:
+        return self._encoder.encode(emails)
+
+    def _footer(self) -> str:
+        return self._encoder.end()
+
+
+class NdjsonEmailWriter(_StreamingJsonWriter):
+    """Writes one JSON object per line (NDJSON)."""
+    APPENDABLE = True
+
+    def _records(self, emails: Iterable[Email]) -> Iterator[str]:
+        return iter_ndjson(emails)
 
 
 class JsonFormatter(OutputFormatter):
     """Formats emails to JSON string (for APIs)."""
-    
+
+    def __init__(self, indent: Optional[int] = None):
+        self.indent = indent
+
+    def format(self, emails: List[Email]) -> str:
+        return ''.join(JsonArrayEncoder(self.indent).iterencode(emails))
+
+
+class NdjsonFormatter(OutputFormatter):
+    """Formats emails to NDJSON string (for APIs)."""
+
     def format(self, emails: List[Email]) -> str:
-        data = {
-            'emails': [
-                {
-                    'nombre': email.nombre,
-                    'apellido': email.apellido,
-                    'correo_original': email.correo_original,
-                    'correo_nuevo': email.correo_nuevo
-                }
-                for email in emails
-            ],
-            'total': len(emails)
-        }
-        return json.dumps(data, indent=2, ensure_ascii=False)
\ No newline at end of file
+        return ''.join(iter_ndjson(emails))
@@ -1,6 +1,6 @@
 from typing import List
 from src.features.email_processing.domain.ports import EmailWriter
-from src.features.email_processing.domain.email import Email
+from src.features.email_processing.domain.email import Email, email_rows
 
 
 class TxtEmailWriter(EmailWriter):
@@ -13,5 +13,5 @@ class TxtEmailWriter(EmailWriter):
             f.write(','.join(self.headers) + '\n')
             
             # Data
-            for email in emails:
-                f.write(','.join(email.to_list()) + '\n')
+            for row in email_rows(emails):
+                f.write(','.join(row) + '\n')
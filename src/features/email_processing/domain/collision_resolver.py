@@ -0,0 +1,89 @@
+"""
+Collision Resolver - Domain Layer
+Issues unique correo_nuevo addresses by adding a numeric suffix on collision.
+"""
+from typing import Iterable, List, Optional
+from src.features.email_processing.domain.duplicate_detector import ExactDuplicateDetector
+from src.features.email_processing.domain.ports import DuplicateDetector
+
+
+class CollisionResolver:
+    """
+    Index of already-issued target addresses.
+
+    The first row generating an address keeps it; later ones get the next
+    free suffix (juan.perez2@..., juan.perez3@...). The next suffix to try
+    is remembered for the max_tracked most recently colliding base
+    addresses, so probing is O(1) amortized per row; a base address that
+    was forgotten probes again from `start`, which is slower but gives the
+    same result because every issued address is in the index.
+    Generated addresses never contain digits (BR-005), so a suffixed
+    address can only clash with a pre-seeded or previously suffixed one.
+
+    The index is a DuplicateDetector (exact set by default); pass a
+    hashed or disk detector to bound memory on very large runs.
+    """
+
+    def __init__(self, detector: Optional[DuplicateDetector] = None, suffix_format: str = '{local}{n}',
+                 start: int = 2, max_tracked: int = 100_000):
+        if '{n}' not in suffix_format or '{local}' not in suffix_format:
+            raise ValueError("suffix_format must contain {local} and {n}")
+        if start < 1:
+            raise ValueError("start must be >= 1")
+        if max_tracked < 1:
+            raise ValueError("max_tracked must be >= 1")
+        self._issued = detector if detector is not None else ExactDuplicateDetector()
+        self.suffix_format = suffix_format
+        self.start = start
+        self.resolved = 0
+        self.max_tracked = max_tracked
+        # Siguiente sufijo por dirección base, en orden de último uso (LRU acotado)
+        self._next = {}
+
+    def seed(self, addresses: Iterable[str], batch_size: int = 10_000) -> int:
+        """Mark existing mailboxes (e.g. a directory export) as issued; returns how many were read."""
+        count = 0
+        batch = []
+        for address in addresses:
+            batch.append(address.strip().lower())
+            if len(batch) >= batch_size:
+                self._issued.add_batch(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self._issued.add_batch(batch)
+            count += len(batch)
+        return count
+
+    def resolve(self, address: str) -> str:
+        """Return address if still free, otherwise the first free suffixed variant. Marks it as issued."""
+        if not self._issued.is_duplicate(address):
+            return address
+        return self._suffixed(address)
+
+    def resolve_batch(self, addresses: List[str]) -> List[str]:
+        """resolve() for a batch, with one index lookup for the common (free) case."""
+        taken = self._issued.check_batch(addresses)
+        if not any(taken):
+            return addresses
+        return [self._suffixed(address) if collision else address
+                for address, collision in zip(addresses, taken)]
+
+    def _suffixed(self, address: str) -> str:
+        local, _, domain = address.rpartition('@')
+        n = self._next.get(address, self.start)
+        is_duplicate = self._issued.is_duplicate
+        while True:
+            candidate = f"{self.suffix_format.format(local=local, n=n)}@{domain}"
+            n += 1
+            if not is_duplicate(candidate):
+                break
+        self._next.pop(address, None)
+        if len(self._next) >= self.max_tracked:
+            del self._next[next(iter(self._next))]
+        self._next[address] = n
+        self.resolved += 1
+        return candidate
+
+    def close(self) -> None:
+        self._issued.close()
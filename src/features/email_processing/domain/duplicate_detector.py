@@ -0,0 +1,43 @@
+"""
+Duplicate Detectors - Domain Layer
+Default in-memory implementation of the DuplicateDetector port.
+"""
+from typing import List
+from src.features.email_processing.domain.ports import DuplicateDetector
+
+
+class ExactDuplicateDetector(DuplicateDetector):
+    """Keeps every distinct key in a set (exact, memory grows with distinct inputs)."""
+
+    def __init__(self):
+        self._seen = set()
+
+    def check_batch(self, keys: List[str]) -> List[bool]:
+        seen = self._seen
+        # Caso habitual (lote sin repetidos): operaciones de conjunto en C
+        if seen.isdisjoint(keys):
+            size = len(seen)
+            seen.update(keys)
+            if len(seen) - size == len(keys):
+                return [False] * len(keys)
+            seen.difference_update(keys)
+        flags = []
+        for key in keys:
+            if key in seen:
+                flags.append(True)
+            else:
+                seen.add(key)
+                flags.append(False)
+        return flags
+
+    def is_duplicate(self, key: str) -> bool:
+        if key in self._seen:
+            return True
+        self._seen.add(key)
+        return False
+
+    def add_batch(self, keys: List[str]) -> None:
+        self._seen.update(keys)
+
+    def __len__(self) -> int:
+        return len(self._seen)
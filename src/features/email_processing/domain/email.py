@@ -1,11 +1,18 @@
 """
 Entidad Email - Core Domain (Pure Business Logic)
 """
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+from src.features.email_processing.domain.validation import ValidationReason
 
 
 @dataclass
 class Email:
+    # Sin __dict__ por instancia: los lotes grandes mantienen millones de Email vivos
+    __slots__ = ('nombre', 'apellido', 'correo_original', 'correo_nuevo')
+
     nombre: str
     apellido: str
     correo_original: str
@@ -29,4 +36,136 @@ class Email:
         }
     
     def to_list(self):
-        return [self.nombre, self.apellido, self.correo_original, self.correo_nuevo]
\ No newline at end of file
+        return [self.nombre, self.apellido, self.correo_original, self.correo_nuevo]
+
+
+class EmailBatch(Sequence):
+    """
+    Columnar container of transformed emails sharing one target domain.
+
+    Fields are kept as parallel lists instead of one object per row:
+    nombre/apellido are interned (first and last names repeat a lot) and
+    correo_nuevo is derived from them (TR-005) on access. Rows whose
+    correo_nuevo does not follow that rule are stored in a sparse override
+    map. Indexing or iterating yields regular Email objects; writers should
+    prefer rows()/dicts(), which skip building them.
+    """
+
+    def __init__(self, domain: str, emails: Iterable[Email] = ()):
+        self.domain = domain.lower()
+        self.nombres: List[str] = []
+        self.apellidos: List[str] = []
+        self.correos_originales: List[str] = []
+        self._overrides: Dict[int, str] = {}
+        self.extend(emails)
+
+    def append(self, email: Email) -> None:
+        nombre = sys.intern(email.nombre)
+        apellido = sys.intern(email.apellido)
+        if email.correo_nuevo != f"{nombre.lower()}.{apellido.lower()}@{self.domain}":
+            self._overrides[len(self.nombres)] = email.correo_nuevo
+        self.nombres.append(nombre)
+        self.apellidos.append(apellido)
+        self.correos_originales.append(email.correo_original)
+
+    def extend(self, emails: Iterable[Email]) -> None:
+        for email in emails:
+            self.append(email)
+
+    def copy(self) -> 'EmailBatch':
+        batch = EmailBatch(self.domain)
+        batch.nombres = self.nombres.copy()
+        batch.apellidos = self.apellidos.copy()
+        batch.correos_originales = self.correos_originales.copy()
+        batch._overrides = self._overrides.copy()
+        return batch
+
+    def clear(self) -> None:
+        self.nombres.clear()
+        self.apellidos.clear()
+        self.correos_originales.clear()
+        self._overrides.clear()
+
+    def correos_nuevos(self) -> Iterator[str]:
+        """Yield correo_nuevo per row without building Email objects."""
+        overrides = self._overrides
+        suffix = f"@{self.domain}"
+        for i, (nombre, apellido) in enumerate(zip(self.nombres, self.apellidos)):
+            yield overrides.get(i) or f"{nombre.lower()}.{apellido.lower()}{suffix}"
+
+    def rows(self) -> Iterator[List[str]]:
+        """Same as Email.to_list() for every row."""
+        return map(list, zip(self.nombres, self.apellidos, self.correos_originales, self.correos_nuevos()))
+
+    def dicts(self) -> Iterator[Dict[str, str]]:
+        """Same as Email.to_dict() for every row."""
+        for nombre, apellido, correo_original, correo_nuevo in zip(
+                self.nombres, self.apellidos, self.correos_originales, self.correos_nuevos()):
+            yield {
+                'nombre': nombre,
+                'apellido': apellido,
+                'correo_original': correo_original,
+                'correo_nuevo': correo_nuevo
+            }
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]
+        nombre = self.nombres[index]
+        apellido = self.apellidos[index]
+        correo_nuevo = self._overrides.get(index) or f"{nombre.lower()}.{apellido.lower()}@{self.domain}"
+        return Email(nombre, apellido, self.correos_originales[index], correo_nuevo)
+
+    def __iter__(self) -> Iterator[Email]:
+        return map(Email, self.nombres, self.apellidos, self.correos_originales, self.correos_nuevos())
+
+    def __eq__(self, other):
+        if isinstance(other, (EmailBatch, list)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"EmailBatch(domain={self.domain!r}, size={len(self)})"
+
+
+def email_rows(emails: Iterable[Email]) -> Iterator[List[str]]:
+    """Rows as lists for writers; reads EmailBatch columns directly."""
+    if isinstance(emails, EmailBatch):
+        return emails.rows()
+    return (email.to_list() for email in emails)
+
+
+def email_dicts(emails: Iterable[Email]) -> Iterator[Dict[str, str]]:
+    """Rows as dicts for writers; reads EmailBatch columns directly."""
+    if isinstance(emails, EmailBatch):
+        return emails.dicts()
+    return (email.to_dict() for email in emails)
+
+
+class TransformError(NamedTuple):
+    """
+    Rejected input row produced by the transform pipeline.
+
+    Only the reason code is stored; the human readable message is resolved
+    when an error report asks for it.
+    """
+    email: str
+    reason: ValidationReason
+    detail: Optional[str] = None
+
+    @property
+    def rule(self) -> str:
+        return self.reason.rule
+
+    @property
+    def error(self) -> str:
+        return self.detail or self.reason.message
+
+    def to_dict(self) -> Dict[str, str]:
+        return {'email': self.email, 'error': self.error}
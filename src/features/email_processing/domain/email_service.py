@@ -1,57 +1,325 @@
-from typing import List, Dict
-from src.features.email_processing.domain.email import Email
-from src.features.email_processing.domain.ports import EmailValidator, Logger
+import time
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+from src.features.email_processing.domain.collision_resolver import CollisionResolver
+from src.features.email_processing.domain.duplicate_detector import ExactDuplicateDetector
+from src.features.email_processing.domain.email import Email, EmailBatch, TransformError
+from src.features.email_processing.domain.ports import DuplicateDetector, EmailValidator, Logger, TransformEngine
+from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+from src.features.email_processing.domain.validation import ValidationReason
 
 
 class EmailProcessingService:
     """Core business logic - Stateless service."""
-    
-    def __init__(self, validator: EmailValidator, logger: Logger):
+
+    def __init__(self, validator: EmailValidator, logger: Logger, engine: Optional[TransformEngine] = None,
+                 log_records: bool = False, progress_interval: float = 5.0,
+                 dedup: Callable[[], DuplicateDetector] = ExactDuplicateDetector, target_dedup: bool = False,
+                 collisions: Optional[Callable[[], CollisionResolver]] = None,
+                 reserved: Optional[Mapping[str, str]] = None, log_summary: bool = True):
+        """
+        log_records: log one warning per rejected/duplicate row (opt-in).
+            Rejections are always counted per rule in stats['error_counts'].
+        log_summary: log the per-run INFO lines (start, completion, rejections
+            by rule, resolved collisions). Callers that report stats
+            themselves (e.g. one line per Lambda invocation) turn it off.
+        progress_interval: seconds between "Processed N emails" lines.
+        dedup: factory for the DuplicateDetector of each run.
+        target_dedup: also index the generated correo_nuevo and reject rows
+            whose target address was already issued (rule DUP-TARGET), e.g.
+            Juan.Perez@a.com after juan.perez@a.com.
+        collisions: factory for a CollisionResolver; colliding correo_nuevo
+            values get a suffix instead of being rejected (takes precedence
+            over target_dedup). stats['renamed'] counts them.
+        reserved: correo_original -> correo_nuevo issued by an earlier run
+            (see DeltaTransformEngine). With collisions or target_dedup these
+            addresses are taken before the run starts; a row that reproduces
+            its own reserved address keeps it, any other row colliding with
+            it is renamed or rejected.
+        """
         self._validator = validator
         self._logger = logger
-    
+        self._engine = engine or SequentialTransformEngine(validator)
+        self._dedup = dedup
+        self.target_dedup = target_dedup
+        self._collisions = collisions
+        self._reserved = reserved or {}
+        self.log_records = log_records
+        self.log_summary = log_summary
+        self.progress_interval = progress_interval
+
+    def close(self) -> None:
+        """Release resources held by the transform engine."""
+        self._engine.close()
+
     def transform_emails(self, raw_emails: List[str], new_domain: str) -> Dict:
         """Transform emails applying BR-001 to BR-005 and TR-001 to TR-005."""
-        self._logger.info(f"Transforming {len(raw_emails)} emails to domain {new_domain}")
-        
-        # Validar dominio destino
+        if self.log_summary:
+            self._logger.info(f"Transforming {len(raw_emails)} emails to domain {new_domain}")
+
+        stats = {}
+        processed = EmailBatch(new_domain)
+        errors = []
+        for item in self.transform_stream(raw_emails, new_domain, stats):
+            if isinstance(item, Email):
+                processed.append(item)
+            else:
+                errors.append(item.to_dict())
+
+        stats['emails'] = processed
+        stats['error_details'] = errors
+        return stats
+
+    def validate_batch(self, raw_emails: Iterable[str]) -> Iterator[Dict]:
+        """
+        Check BR-001 to BR-005 for many emails (bulk pre-validation).
+
+        Yields {'index', 'valid'} per email, plus 'rule' (BR-00x) when it is
+        rejected. Uses the validator's fast path: no exceptions and no
+        per-row logging. Each email is judged on its own, as in a single
+        validate call, so there is no duplicate detection.
+        """
+        validate = self._validator.validate_fast
+        for index, email in enumerate(raw_emails):
+            if not isinstance(email, str):
+                raise ValueError(f"Invalid email at index {index}: expected a string")
+            reason = validate(email).reason
+            if reason is None:
+                yield {'index': index, 'valid': True}
+            else:
+                yield {'index': index, 'valid': False, 'rule': reason.rule}
+
+    def transform_stream(self, raw_emails: Iterable[str], new_domain: str, stats: Optional[Dict] = None,
+                         seen: Iterable[List[str]] = ()) -> Iterator[Union[Email, TransformError]]:
+        """
+        Lazily transform any iterable of raw emails.
+
+        Yields an Email for each accepted row and a TransformError for each
+        rejected one, in input order. If a stats dict is given it is updated
+        in place (total, processed, errors, error_counts, success_rate) while
+        the stream is consumed, once per engine batch before its rows are
+        yielded, so memory stays flat regardless of input size.
+        error_counts maps rule code (BR-001..BR-005, Duplicate, DUP-TARGET)
+        to rejections. seen: batches of raw emails already processed by an
+        earlier, interrupted run; they only prime duplicate detection.
+        """
+        # Validar dominio destino (antes de consumir el iterable)
         if not self._validator.validate_domain(new_domain):
             raise ValueError(f"Invalid target domain: {new_domain}")
-        
-        processed = []
-        errors = []
-        seen = set()
-        
-        for i, raw_email in enumerate(raw_emails, 1):
-            raw_email = raw_email.strip()
-            
-            # Detectar duplicados
-            if raw_email in seen:
-                self._logger.warning(f"Duplicate email: {raw_email}")
-                errors.append({'email': raw_email, 'error': 'Duplicate'})
-                continue
-            seen.add(raw_email)
-            
-            # Validar y transformar
-            try:
-                nombre, apellido = self._validator.validate_and_parse(raw_email)
-                email = Email.create(nombre, apellido, raw_email, new_domain)
-                processed.append(email)
-                
-                if i % 10 == 0:
-                    self._logger.info(f"Processed {i}/{len(raw_emails)} emails")
-            except ValueError as e:
-                self._logger.warning(f"Validation failed for {raw_email}: {e}")
-                errors.append({'email': raw_email, 'error': str(e)})
-        
-        stats = {
-            'total': len(raw_emails),
-            'processed': len(processed),
-            'errors': len(errors),
-            'success_rate': (len(processed) / len(raw_emails)) * 100 if raw_emails else 0,
-            'emails': processed,
-            'error_details': errors
-        }
-        
-        self._logger.info(f"Transformation completed: {stats['processed']}/{stats['total']} ({stats['success_rate']:.1f}%)")
-        return stats
\ No newline at end of file
+
+        if stats is None:
+            stats = {}
+        stats.update({'total': 0, 'processed': 0, 'errors': 0, 'error_counts': {}, 'success_rate': 0})
+        return self._stream(raw_emails, new_domain, stats, seen)
+
+    def open_session(self, new_domain: str, stats: Optional[Dict] = None) -> 'TransformSession':
+        """
+        Push-based counterpart of transform_stream for callers that receive
+        input in pieces (e.g. a request body): feed() each batch as it
+        arrives, close() at the end. Duplicate detection, collisions and
+        stats span all batches, exactly as in one transform_stream() run.
+        """
+        if not self._validator.validate_domain(new_domain):
+            raise ValueError(f"Invalid target domain: {new_domain}")
+
+        if stats is None:
+            stats = {}
+        stats.update({'total': 0, 'processed': 0, 'errors': 0, 'error_counts': {}, 'success_rate': 0})
+        return TransformSession(self, new_domain, stats)
+
+    def _stream(self, raw_emails: Iterable[str], new_domain: str, stats: Dict,
+                seen: Iterable[List[str]] = ()) -> Iterator[Union[Email, TransformError]]:
+        session = TransformSession(self, new_domain, stats, seen)
+        try:
+            yield from session.feed(raw_emails)
+        finally:
+            session.close()
+
+    def _unique_batches(self, raw_emails: Iterable[str], layouts: deque,
+                        detector: DuplicateDetector) -> Iterator[List[str]]:
+        """Strip and de-duplicate input (first occurrence wins) into engine-sized batches."""
+        batch_size = self._engine.batch_size
+        if batch_size == 1:
+            # Lotes de una fila: evitar el coste de check_batch() por fila
+            is_duplicate = detector.is_duplicate
+            for raw_email in raw_emails:
+                raw_email = raw_email.strip()
+                if is_duplicate(raw_email):
+                    layouts.append([TransformError(raw_email, ValidationReason.DUPLICATE)])
+                    yield []
+                else:
+                    layouts.append(None)
+                    yield [raw_email]
+            return
+
+        strip = str.strip
+        raw_emails = iter(raw_emails)
+        while True:
+            pending = list(map(strip, islice(raw_emails, batch_size)))
+            if not pending:
+                return
+            yield self._split_duplicates(pending, layouts, detector)
+
+    @staticmethod
+    def _is_new(item: Union[Email, TransformError], reserved: Mapping[str, str]) -> bool:
+        """Accepted row that does not reproduce its own reserved address."""
+        return isinstance(item, Email) and reserved.get(item.correo_original) != item.correo_nuevo
+
+    @classmethod
+    def _resolve_collisions(cls, results: List[Union[Email, TransformError]], resolver: CollisionResolver,
+                            reserved: Mapping[str, str]) -> List[Union[Email, TransformError]]:
+        """Give accepted rows whose correo_nuevo was already issued the next free suffixed address."""
+        accepted = [item for item in results if cls._is_new(item, reserved)]
+        if not accepted:
+            return results
+        addresses = [email.correo_nuevo for email in accepted]
+        resolved = resolver.resolve_batch(addresses)
+        if resolved is addresses:
+            return results
+        renamed = iter(resolved)
+        checked = []
+        for item in results:
+            if cls._is_new(item, reserved):
+                correo_nuevo = next(renamed)
+                if correo_nuevo != item.correo_nuevo:
+                    item = Email(item.nombre, item.apellido, item.correo_original, correo_nuevo)
+            checked.append(item)
+        return checked
+
+    @classmethod
+    def _reject_target_collisions(cls, results: List[Union[Email, TransformError]], detector: DuplicateDetector,
+                                  reserved: Mapping[str, str]) -> List[Union[Email, TransformError]]:
+        """Replace accepted rows whose correo_nuevo was already issued by a DUP-TARGET error."""
+        accepted = [item for item in results if cls._is_new(item, reserved)]
+        if not accepted:
+            return results
+        collisions = iter(detector.check_batch([email.correo_nuevo for email in accepted]))
+        checked = []
+        for item in results:
+            if cls._is_new(item, reserved) and next(collisions):
+                reason = ValidationReason.DUPLICATE_TARGET
+                item = TransformError(item.correo_original, reason, f"{reason.message}: {item.correo_nuevo}")
+            checked.append(item)
+        return checked
+
+    @staticmethod
+    def _split_duplicates(emails: List[str], layouts: deque, detector: DuplicateDetector) -> List[str]:
+        flags = detector.check_batch(emails)
+        if not any(flags):
+            layouts.append(None)
+            return emails
+        duplicate = ValidationReason.DUPLICATE
+        layouts.append([TransformError(raw_email, duplicate) if is_dup else None
+                        for raw_email, is_dup in zip(emails, flags)])
+        return [raw_email for raw_email, is_dup in zip(emails, flags) if not is_dup]
+
+
+class TransformSession:
+    """
+    State of one transform run (see EmailProcessingService.open_session).
+
+    Batches must be fed one at a time, but not necessarily from the same
+    thread.
+    """
+
+    def __init__(self, service: EmailProcessingService, new_domain: str, stats: Dict,
+                 seen: Iterable[List[str]] = ()):
+        self._service = service
+        self.new_domain = new_domain
+        self.stats = stats
+        # Cada lote enviado al engine deja aquí su "layout": None si no tenía
+        # duplicados (el resultado del engine es el lote completo) o una lista
+        # con None por correo único y el TransformError de cada duplicado.
+        # El engine devuelve lotes en orden, así que basta FIFO.
+        self._layouts = deque()
+        self._next_progress = time.monotonic() + service.progress_interval
+        self._closed = False
+
+        self._detector = service._dedup()
+        self._resolver = service._collisions() if service._collisions is not None else None
+        self._target_detector = service._dedup() if service.target_dedup and self._resolver is None else None
+        if self._resolver is not None:
+            stats['renamed'] = 0
+        try:
+            reserved = service._reserved
+            if reserved:
+                if self._resolver is not None:
+                    self._resolver.seed(reserved.values())
+                elif self._target_detector is not None:
+                    self._target_detector.add_batch(list(reserved.values()))
+            for batch in seen:
+                self._detector.check_batch([raw_email.strip() for raw_email in batch])
+        except BaseException:
+            self.close()
+            raise
+
+    def feed(self, raw_emails: Iterable[str]) -> Iterator[Union[Email, TransformError]]:
+        """Lazily transform the next piece of input; results come in input order."""
+        service = self._service
+        batches = service._unique_batches(raw_emails, self._layouts, self._detector)
+        for results in service._engine.transform_batches(batches, self.new_domain):
+            yield from self._account(results)
+
+    def _account(self, results: List[Union[Email, TransformError]]) -> List[Union[Email, TransformError]]:
+        service = self._service
+        stats = self.stats
+        reserved = service._reserved
+        if self._resolver is not None:
+            results = service._resolve_collisions(results, self._resolver, reserved)
+            stats['renamed'] = self._resolver.resolved
+        elif self._target_detector is not None:
+            results = service._reject_target_collisions(results, self._target_detector, reserved)
+        layout = self._layouts.popleft()
+        if layout is None:
+            items = results
+        else:
+            pending = iter(results)
+            items = [slot if slot is not None else next(pending) for slot in layout]
+
+        # Contadores por lote (no por fila): solo los rechazos se recorren
+        errors = [item for item in items if isinstance(item, TransformError)]
+        error_counts = stats['error_counts']
+        stats['total'] += len(items)
+        stats['errors'] += len(errors)
+        stats['processed'] += len(items) - len(errors)
+        for item in errors:
+            error_counts[item.rule] = error_counts.get(item.rule, 0) + 1
+            if service.log_records:
+                if item.reason is ValidationReason.DUPLICATE:
+                    service._logger.warning(f"Duplicate email: {item.email}")
+                elif item.reason is ValidationReason.DUPLICATE_TARGET:
+                    service._logger.warning(f"Duplicate target for {item.email}: {item.error}")
+                else:
+                    service._logger.warning(f"Validation failed for {item.email}: {item.error}")
+
+        # Progreso por tiempo (una comprobación por lote), no por número de filas
+        if time.monotonic() >= self._next_progress:
+            service._logger.info(f"Processed {stats['total']} emails")
+            self._next_progress = time.monotonic() + service.progress_interval
+        return items
+
+    def close(self) -> None:
+        """Release the run's detectors and log its summary (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        service = self._service
+        stats = self.stats
+        self._detector.close()
+        if self._target_detector is not None:
+            self._target_detector.close()
+        if self._resolver is not None:
+            self._resolver.close()
+        total = stats['total']
+        stats['success_rate'] = (stats['processed'] / total) * 100 if total else 0
+        if not service.log_summary:
+            return
+        logger = service._logger
+        if self._resolver is not None and self._resolver.resolved:
+            logger.info(f"Resolved {self._resolver.resolved} target address collisions with a suffix")
+        logger.info(f"Transformation completed: {stats['processed']}/{total} ({stats['success_rate']:.1f}%)")
+        error_counts = stats['error_counts']
+        if error_counts:
+            summary = ', '.join(f"{rule}={count}" for rule, count in sorted(error_counts.items()))
+            logger.info(f"Rejected by rule: {summary}")
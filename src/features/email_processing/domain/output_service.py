@@ -3,7 +3,7 @@ Output Service - Domain Layer
 Handles output generation in different formats (hexagonal architecture).
 """
 from typing import List, Dict, Any, Optional
-from src.features.email_processing.domain.email import Email
+from src.features.email_processing.domain.email import Email, EmailBatch, email_dicts
 
 
 class OutputService:
@@ -12,6 +12,8 @@ class OutputService:
     @staticmethod
     def generate_inline(emails: List[Email]) -> List[str]:
         """Generate inline output (list of email strings)."""
+        if isinstance(emails, EmailBatch):
+            return list(emails.correos_nuevos())
         return [str(email) for email in emails]
     
     @staticmethod
@@ -22,12 +24,4 @@ class OutputService:
     @staticmethod
     def to_dict_list(emails: List[Email]) -> List[Dict[str, str]]:
         """Convert emails to list of dictionaries."""
-        return [
-            {
-                'nombre': email.nombre,
-                'apellido': email.apellido,
-                'correo_original': email.correo_original,
-                'correo_nuevo': email.correo_nuevo
-            }
-            for email in emails
-        ]
+        return list(email_dicts(emails))
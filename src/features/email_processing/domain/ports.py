@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, Iterator, List, Union
+from src.features.email_processing.domain.email import Email, TransformError
+from src.features.email_processing.domain.validation import ValidationReason, ValidationResult
 
 
 class EmailValidator(ABC):
@@ -9,6 +11,22 @@ class EmailValidator(ABC):
     def validate_and_parse(self, email: str) -> tuple[str, str]:
         """Validate email and return (nombre, apellido)."""
         pass
+
+    def validate_fast(self, email: str) -> ValidationResult:
+        """
+        Exception-free validation for hot loops.
+
+        Returns ValidationResult(None, nombre, apellido) when valid, or the
+        ValidationReason of the first failing rule. This default adapts
+        validate_and_parse(); implementations should override it.
+        """
+        try:
+            nombre, apellido = self.validate_and_parse(email)
+        except ValueError as e:
+            message = str(e)
+            reason = ValidationReason.from_message(message)
+            return ValidationResult(reason, detail=None if reason is not ValidationReason.OTHER else message)
+        return ValidationResult(None, nombre, apellido)
     
     @abstractmethod
     def validate_domain(self, domain: str) -> bool:
@@ -51,4 +69,57 @@ class OutputFormatter(ABC):
     @abstractmethod
     def format(self, emails: List) -> str:
         """Format emails to string representation."""
-        pass
\ No newline at end of file
+        pass
+
+class TransformEngine(ABC):
+    """
+    Port for batch validation + transformation (BR-001..BR-005, TR-001..TR-005).
+
+    Engines receive already de-duplicated batches and must return one result
+    per input email (Email or TransformError), in input order.
+    """
+
+    batch_size: int = 1
+
+    @abstractmethod
+    def transform_batch(self, emails: List[str], new_domain: str) -> List[Union[Email, TransformError]]:
+        """Validate and transform a single batch."""
+        pass
+
+    def transform_batches(self, batches: Iterable[List[str]], new_domain: str) -> Iterator[List[Union[Email, TransformError]]]:
+        """Transform a stream of batches, yielding results in the same order."""
+        for batch in batches:
+            yield self.transform_batch(batch, new_domain)
+
+    def close(self) -> None:
+        """Release engine resources (worker pools, handles)."""
+        pass
+
+
+class DuplicateDetector(ABC):
+    """
+    Port for first-occurrence-wins duplicate detection over one stream.
+
+    A detector holds the state of a single run; the service creates a new
+    one per transform_stream() call.
+    """
+
+    @abstractmethod
+    def check_batch(self, keys: List[str]) -> List[bool]:
+        """
+        Return, in order, True for each key already seen (in a previous batch
+        or earlier in this one) and record the others.
+        """
+        pass
+
+    def is_duplicate(self, key: str) -> bool:
+        """Single-key check_batch(); override for a cheaper per-row path."""
+        return self.check_batch([key])[0]
+
+    def add_batch(self, keys: List[str]) -> None:
+        """Record keys known to be new, skipping the lookup where possible."""
+        self.check_batch(keys)
+
+    def close(self) -> None:
+        """Release detector resources (temp files, connections)."""
+        pass
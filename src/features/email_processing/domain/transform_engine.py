@@ -0,0 +1,103 @@
+"""
+Transform Engines - Domain Layer
+Default in-process implementation of the TransformEngine port.
+"""
+from abc import abstractmethod
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Union
+from src.features.email_processing.domain.email import Email, TransformError
+from src.features.email_processing.domain.ports import EmailValidator, TransformEngine
+
+
+class SequentialTransformEngine(TransformEngine):
+    """Validates and transforms batches in the calling process."""
+
+    def __init__(self, validator: EmailValidator, batch_size: int = 1):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self._validator = validator
+        self.batch_size = batch_size
+
+    def transform_batch(self, emails: List[str], new_domain: str) -> List[Union[Email, TransformError]]:
+        validate = self._validator.validate_fast
+        create = Email.create
+        results = []
+        for raw_email in emails:
+            reason, nombre, apellido, detail = validate(raw_email)
+            if reason is None:
+                results.append(create(nombre, apellido, raw_email, new_domain))
+            else:
+                results.append(TransformError(raw_email, reason, detail))
+        return results
+
+
+class LookupTransformEngine(TransformEngine):
+    """
+    Base for engines that answer part of each batch from a lookup table.
+
+    Subclasses implement _lookup() (a result per email, None on a miss) and
+    optionally _store(). Misses go to the wrapped engine through its own
+    transform_batches(), so its batching and parallelism are kept, and the
+    results are merged back in input order.
+    """
+
+    def __init__(self, engine: TransformEngine):
+        self._engine = engine
+        self.batch_size = engine.batch_size
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def _lookup(self, emails: List[str], domain: str) -> List[Optional[Union[Email, TransformError]]]:
+        """A result per email, None on a miss."""
+
+    def _store(self, emails: List[str], results: List[Union[Email, TransformError]], domain: str) -> None:
+        """Called with the wrapped engine's results for the misses of a batch."""
+        pass
+
+    def _finish(self) -> None:
+        """Called once transform_batches() has been fully consumed."""
+        pass
+
+    def _miss(self, cached: List, emails: List[str], domain: str) -> List[str]:
+        missing = [raw for raw, hit in zip(emails, cached) if hit is None]
+        self.hits += len(emails) - len(missing)
+        self.misses += len(missing)
+        return missing
+
+    @staticmethod
+    def _merge(cached: List, results: List[Union[Email, TransformError]]) -> List[Union[Email, TransformError]]:
+        fresh = iter(results)
+        return [hit if hit is not None else next(fresh) for hit in cached]
+
+    def transform_batch(self, emails: List[str], new_domain: str) -> List[Union[Email, TransformError]]:
+        domain = new_domain.lower()
+        cached = self._lookup(emails, domain)
+        missing = self._miss(cached, emails, domain)
+        if not missing:
+            return cached
+        results = self._engine.transform_batch(missing, new_domain)
+        self._store(missing, results, domain)
+        return self._merge(cached, results)
+
+    def transform_batches(self, batches: Iterable[List[str]], new_domain: str) -> Iterator[List[Union[Email, TransformError]]]:
+        domain = new_domain.lower()
+        # Lotes ya consultados, en orden, a la espera del resultado de sus fallos
+        pending = deque()
+
+        def misses():
+            for batch in batches:
+                cached = self._lookup(batch, domain)
+                missing = self._miss(cached, batch, domain)
+                pending.append((cached, missing))
+                yield missing
+
+        for results in self._engine.transform_batches(misses(), new_domain):
+            cached, missing = pending.popleft()
+            if missing:
+                self._store(missing, results, domain)
+            yield self._merge(cached, results)
+        self._finish()
+
+    def close(self) -> None:
+        self._engine.close()
@@ -0,0 +1,82 @@
+"""
+Transform Result - Domain Layer
+Row-level transform output that keeps the Email objects built by the service.
+"""
+from typing import Dict, Iterable, List, Optional
+from src.features.email_processing.domain.email import Email, EmailBatch
+
+
+class TransformResult(list):
+    """
+    List of {'original', 'transformed', 'valid'[, 'error']} dicts, as returned
+    by the CLI and library transform() steps, that also carries the accepted
+    emails. generate() writes `emails` directly instead of re-parsing the
+    'transformed' strings back into Email objects, as long as the accepted
+    rows still match them (see emails_in_sync).
+    """
+
+    def __init__(self, rows: Iterable[Dict] = (), emails: Optional[List[Email]] = None):
+        super().__init__(rows)
+        self.emails = emails if emails is not None else []
+        # Columnas de las filas aceptadas tal como se construyeron (from_emails)
+        self._originals: Optional[List[str]] = None
+        self._targets: Optional[List[str]] = None
+
+    @classmethod
+    def from_emails(cls, emails: List[Email]) -> 'TransformResult':
+        """
+        One valid row per accepted email, read from the EmailBatch columns
+        when possible (no Email object per row). Callers append the rejected
+        rows afterwards.
+        """
+        if isinstance(emails, EmailBatch):
+            originals = list(emails.correos_originales)
+            targets = list(emails.correos_nuevos())
+        else:
+            originals = [email.correo_original for email in emails]
+            targets = [email.correo_nuevo for email in emails]
+        result = cls(({'original': original, 'transformed': target, 'valid': True}
+                      for original, target in zip(originals, targets)), emails)
+        result._originals = originals
+        result._targets = targets
+        return result
+
+    def emails_in_sync(self) -> bool:
+        """False once the caller has removed, reordered or edited accepted rows."""
+        accepted = [row for row in self if row.get('valid')]
+        if self._targets is not None:
+            # Mismos objetos str que al construir: la comparación de listas es en C
+            return (len(accepted) == len(self._targets)
+                    and [row.get('original') for row in accepted] == self._originals
+                    and [row.get('transformed') for row in accepted] == self._targets)
+        return len(accepted) == len(self.emails) and all(
+            row.get('original') == email.correo_original and row.get('transformed') == email.correo_nuevo
+            for row, email in zip(accepted, self.emails)
+        )
+
+
+def emails_from_transformed(transformed: List[Dict]) -> List[Email]:
+    """
+    Accepted emails of a transform() result.
+
+    TransformResult already holds them; plain lists of dicts (built by hand
+    or deserialized) and results edited after transform() are parsed back
+    from their 'transformed' address.
+    """
+    if isinstance(transformed, TransformResult) and transformed.emails_in_sync():
+        return transformed.emails
+
+    emails = []
+    for item in transformed:
+        if item.get('valid'):
+            parts = item['transformed'].split('@')
+            if len(parts) == 2:
+                name_parts = parts[0].split('.')
+                if len(name_parts) == 2:
+                    emails.append(Email.create(
+                        nombre=name_parts[0],
+                        apellido=name_parts[1],
+                        correo_original=item['original'],
+                        nuevo_dominio=parts[1]
+                    ))
+    return emails
@@ -0,0 +1,61 @@
+"""
+Validation result codes - Core Domain
+Compact, exception-free representation of BR-001..BR-005 outcomes.
+"""
+from enum import Enum
+from typing import NamedTuple, Optional
+
+# Versión de BR-001..BR-005 / TR-001..TR-005: subirla al cambiar una regla
+# invalida los resultados guardados (CachedTransformEngine)
+RULES_VERSION = '1'
+
+
+class ValidationReason(Enum):
+    """Rule id + reason of a rejected email. Messages are built once, at import time."""
+
+    MISSING_AT = ('BR-001', 'Falta símbolo @')
+    MULTIPLE_AT = ('BR-001', 'Múltiples símbolos @ detectados')
+    MISSING_DOT = ('BR-002', 'Falta punto separador en prefijo')
+    MULTIPLE_DOTS = ('BR-002', 'Múltiples puntos en prefijo (formato debe ser nombre.apellido)')
+    NOMBRE_TOO_SHORT = ('BR-003', 'Nombre muy corto (mínimo 2 caracteres)')
+    NOMBRE_TOO_LONG = ('BR-003', 'Nombre muy largo (máximo 50 caracteres)')
+    APELLIDO_TOO_SHORT = ('BR-004', 'Apellido muy corto (mínimo 2 caracteres)')
+    APELLIDO_TOO_LONG = ('BR-004', 'Apellido muy largo (máximo 50 caracteres)')
+    NOMBRE_DIGITS = ('BR-005', 'Nombre contiene números')
+    NOMBRE_HYPHEN = ('BR-005', 'Nombre contiene guiones')
+    NOMBRE_APOSTROPHE = ('BR-005', 'Nombre contiene apóstrofes')
+    NOMBRE_INVALID_CHARS = ('BR-005', 'Nombre contiene caracteres no permitidos')
+    APELLIDO_DIGITS = ('BR-005', 'Apellido contiene números')
+    APELLIDO_HYPHEN = ('BR-005', 'Apellido contiene guiones')
+    APELLIDO_APOSTROPHE = ('BR-005', 'Apellido contiene apóstrofes')
+    APELLIDO_INVALID_CHARS = ('BR-005', 'Apellido contiene caracteres no permitidos')
+    DUPLICATE = ('Duplicate', None)
+    DUPLICATE_TARGET = ('DUP-TARGET', 'Correo nuevo ya generado por otra fila')
+    OTHER = ('UNKNOWN', None)
+
+    def __init__(self, rule: str, description: Optional[str]):
+        self.rule = rule
+        self.description = description or rule
+        self.message = f"{rule}: {description}" if description else rule
+
+    @classmethod
+    def from_message(cls, message: str) -> 'ValidationReason':
+        """Map a legacy ValueError message back to its reason (OTHER if unknown)."""
+        return _BY_MESSAGE.get(message, cls.OTHER)
+
+
+_BY_MESSAGE = {reason.message: reason for reason in ValidationReason}
+
+
+class ValidationResult(NamedTuple):
+    """Outcome of EmailValidator.validate_fast(): reason is None when the email is valid."""
+    reason: Optional[ValidationReason]
+    nombre: str = ''
+    apellido: str = ''
+    detail: Optional[str] = None
+
+    @property
+    def message(self) -> Optional[str]:
+        if self.reason is None:
+            return None
+        return self.detail or self.reason.message
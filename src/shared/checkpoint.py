@@ -0,0 +1,64 @@
+"""
+Run Checkpoints - Estado mínimo para reanudar una ejecución archivo -> archivo
+"""
+import json
+import os
+from typing import Dict, List, NamedTuple, Optional
+
+
+class RunCheckpoint(NamedTuple):
+    """
+    Progress of a file -> csv/ndjson run, valid at an input chunk boundary.
+
+    Every input row before input_offset has its output row within the first
+    output_size bytes of the output and its rejection within the first
+    error_log_size bytes of the error log. Dedup state is not stored: it is
+    rebuilt on resume by replaying input[:input_offset] through the detector.
+    input_stamp (size and mtime of the input when the run started) rejects
+    a resume after the input was replaced or appended to, since
+    input_offset may then no longer fall on a line boundary.
+    """
+    input: str
+    new_domain: str
+    output_type: str
+    input_offset: int
+    output_size: int
+    error_log_size: int
+    error_log_counts: List[int]  # [errores, advertencias] ya escritos
+    stats: Dict
+    input_stamp: List[int]  # [tamaño, mtime_ns] del input
+
+    def matches(self, source: str, new_domain: str, output_type: str) -> bool:
+        return (self.input, self.new_domain, self.output_type) == (source, new_domain, output_type)
+
+
+def input_stamp(source: str) -> List[int]:
+    """[size, mtime_ns] of a file; changes when it is rewritten or appended to."""
+    stat = os.stat(source)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def checkpoint_path(output_file: str) -> str:
+    return f"{output_file}.checkpoint"
+
+
+def save_checkpoint(path: str, checkpoint: RunCheckpoint) -> None:
+    """Write atomically: a crash while saving keeps the previous checkpoint."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint._asdict(), f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> Optional[RunCheckpoint]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return RunCheckpoint(**json.load(f))
+
+
+def remove_checkpoint(path: str) -> None:
+    if os.path.exists(path):
+        os.unlink(path)
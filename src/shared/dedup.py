@@ -0,0 +1,291 @@
+"""
+Duplicate Detectors - Estrategias de deduplicación con memoria acotada
+"""
+import hashlib
+import heapq
+import math
+import os
+import sqlite3
+import tempfile
+from array import array
+from bisect import bisect_left
+from functools import partial
+from typing import Callable, List, Optional
+from src.features.email_processing.domain.duplicate_detector import ExactDuplicateDetector
+from src.features.email_processing.domain.ports import DuplicateDetector
+
+DEDUP_MODES = ('exact', 'hash64', 'hash128', 'disk')
+
+_MASK64 = (1 << 64) - 1
+
+
+class HashedDuplicateDetector(DuplicateDetector):
+    """
+    Keeps a 64 or 128 bit digest per distinct key instead of the string itself.
+
+    64 bits use Python's keyed string hash (SipHash, computed in C and
+    cached on the str); 128 bits use blake2b. Digests only live for one
+    run, so a per-process hash seed is fine. Recent digests live in a small
+    set; every buffer_size keys they are sorted into a packed array run
+    (8 or 16 bytes per key) and looked up with bisect. Runs of similar size
+    are merged so lookups touch O(log n) runs. 128 bits is exact for any
+    practical input size; with 64 bits a collision (a new key reported as
+    duplicate) becomes possible past a few billion keys.
+    """
+
+    def __init__(self, bits: int = 128, buffer_size: int = 1 << 18):
+        if bits not in (64, 128):
+            raise ValueError("bits must be 64 or 128")
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be >= 1")
+        self.bits = bits
+        self.buffer_size = buffer_size
+        self._recent = set()
+        # Runs ordenadas: (digests con signo, None) en 64 bits, (altos, bajos) en 128 bits
+        self._runs = []
+        self._count = 0
+
+    def _digests(self, keys: List[str]) -> List[int]:
+        if self.bits == 64:
+            return list(map(hash, keys))
+        from_bytes = int.from_bytes
+        blake2b = hashlib.blake2b
+        return [from_bytes(blake2b(key.encode('utf-8'), digest_size=16).digest(), 'little') for key in keys]
+
+    def _in_runs(self, digest: int) -> bool:
+        if self.bits == 64:
+            for run, _ in self._runs:
+                i = bisect_left(run, digest)
+                if i < len(run) and run[i] == digest:
+                    return True
+            return False
+
+        high, low = digest >> 64, digest & _MASK64
+        for highs, lows in self._runs:
+            i = bisect_left(highs, high)
+            size = len(highs)
+            while i < size and highs[i] == high:
+                if lows[i] == low:
+                    return True
+                i += 1
+        return False
+
+    def is_duplicate(self, key: str) -> bool:
+        return self.check_batch([key])[0]
+
+    def check_batch(self, keys: List[str]) -> List[bool]:
+        digests = self._digests(keys)
+        new = self._unseen(digests)
+        if len(new) == len(digests):
+            # Caso habitual: ningún repetido, ni previo ni dentro del lote
+            flags = [False] * len(digests)
+        else:
+            # La primera aparición de cada digest nuevo no es duplicado
+            pending = set(new)
+            flags = []
+            for digest in digests:
+                if digest in pending:
+                    pending.discard(digest)
+                    flags.append(False)
+                else:
+                    flags.append(True)
+        self._add_new(new)
+        return flags
+
+    def add_batch(self, keys: List[str]) -> None:
+        self._add_new(self._unseen(self._digests(keys)))
+
+    def _unseen(self, digests: List[int]) -> set:
+        """Distinct digests not recorded yet (set operations, bisect only for the runs)."""
+        new = set(digests)
+        new.difference_update(self._recent)
+        if self._runs and new:
+            in_runs = self._in_runs
+            new.difference_update([digest for digest in new if in_runs(digest)])
+        return new
+
+    def _add_new(self, digests) -> None:
+        self._recent.update(digests)
+        self._count += len(digests)
+        if len(self._recent) >= self.buffer_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        digests = sorted(self._recent)
+        self._recent = set()
+        if self.bits == 64:
+            self._runs.append((array('q', digests), None))
+        else:
+            self._runs.append((array('Q', [d >> 64 for d in digests]), array('Q', [d & _MASK64 for d in digests])))
+
+        # Fusión por tamaños: la última run se fusiona mientras no sea menor que la mitad de la anterior
+        while len(self._runs) > 1 and len(self._runs[-1][0]) * 2 > len(self._runs[-2][0]):
+            newer = self._runs.pop()
+            older = self._runs.pop()
+            self._runs.append(self._merge(older, newer))
+
+    def _merge(self, older, newer):
+        if self.bits == 64:
+            return array('q', heapq.merge(older[0], newer[0])), None
+        highs = array('Q')
+        lows = array('Q')
+        for high, low in heapq.merge(zip(*older), zip(*newer)):
+            highs.append(high)
+            lows.append(low)
+        return highs, lows
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class SqliteDuplicateDetector(DuplicateDetector):
+    """
+    Exact detector for inputs larger than RAM.
+
+    Distinct keys are stored in an on-disk SQLite B-tree (a sorted index),
+    so memory is bounded by the page cache (cache_kb) plus one batch. Each
+    batch costs one indexed lookup and one bulk insert. The database is a
+    temporary file removed on close() unless a path is given.
+    """
+
+    _LOOKUP_CHUNK = 500  # por debajo del límite de parámetros de SQLite
+
+    def __init__(self, path: Optional[str] = None, cache_kb: int = 64 * 1024):
+        self._owns_file = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='email_dedup_', suffix='.sqlite')
+            os.close(fd)
+        self.path = path
+        # Una sesión push (TransformSession) puede alimentarse desde distintos
+        # hilos, siempre de uno en uno
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(f"PRAGMA cache_size=-{int(cache_kb)}")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY) WITHOUT ROWID")
+
+    def check_batch(self, keys: List[str]) -> List[bool]:
+        unique = list(dict.fromkeys(keys))
+        existing = set()
+        for start in range(0, len(unique), self._LOOKUP_CHUNK):
+            chunk = unique[start:start + self._LOOKUP_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            existing.update(row[0] for row in self._conn.execute(
+                f"SELECT key FROM seen WHERE key IN ({placeholders})", chunk))
+        self._conn.executemany("INSERT INTO seen VALUES (?)", ((key,) for key in unique if key not in existing))
+
+        flags = []
+        in_batch = set()
+        for key in keys:
+            flags.append(key in existing or key in in_batch)
+            in_batch.add(key)
+        return flags
+
+    def add_batch(self, keys: List[str]) -> None:
+        self._conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((key,) for key in keys))
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            if not self._owns_file:
+                self._conn.commit()
+            self._conn.close()
+            self._conn = None
+            if self._owns_file and os.path.exists(self.path):
+                os.unlink(self.path)
+
+
+class BloomPrefilter(DuplicateDetector):
+    """
+    Bloom filter in front of another detector.
+
+    Keys the filter has never seen are new for sure and are recorded in the
+    wrapped detector without a lookup; only possible repeats (real ones plus
+    ~error_rate false positives) are checked against it. Results are those
+    of the wrapped detector, so exact modes stay exact. Only worth it when
+    lookups are expensive (the disk detector).
+
+    The filter is blocked: each key sets HASHES bits inside one 64-bit
+    word picked from its string hash, so a key costs one word access and
+    no per-bit loop. Memory is sized from `capacity` (expected distinct
+    keys); going past it keeps results exact but lets false positives grow.
+    """
+
+    HASHES = 4
+
+    def __init__(self, inner: DuplicateDetector, capacity: int = 1_000_000, error_rate: float = 0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.inner = inner
+        # Bits por clave para HASHES fijos: m/n = -k / ln(1 - p^(1/k))
+        bits_per_key = -self.HASHES / math.log(1 - error_rate ** (1 / self.HASHES))
+        self._words = array('Q', bytes(8 * max(1, math.ceil(capacity * bits_per_key / 64))))
+
+    def _check_and_add(self, keys: List[str]) -> List[bool]:
+        """Per key, True if it may have been added before; adds every key."""
+        words = self._words
+        size = len(words)
+        present = []
+        for h in map(hash, keys):
+            i = (h >> 24) % size
+            mask = (1 << (h & 63)) | (1 << ((h >> 6) & 63)) | (1 << ((h >> 12) & 63)) | (1 << ((h >> 18) & 63))
+            word = words[i]
+            if word & mask == mask:
+                present.append(True)
+            else:
+                words[i] = word | mask
+                present.append(False)
+        return present
+
+    def check_batch(self, keys: List[str]) -> List[bool]:
+        present = self._check_and_add(keys)
+        if not any(present):
+            self.inner.add_batch(keys)
+            return present
+
+        # Primero registrar los nuevos: una repetición dentro del lote siempre
+        # aparece después de su primera ocurrencia, que ya será "nueva"
+        new_keys = [key for key, maybe in zip(keys, present) if not maybe]
+        if new_keys:
+            self.inner.add_batch(new_keys)
+        maybe = [i for i, flag in enumerate(present) if flag]
+        flags = [False] * len(keys)
+        for i, duplicate in zip(maybe, self.inner.check_batch([keys[i] for i in maybe])):
+            flags[i] = duplicate
+        return flags
+
+    def add_batch(self, keys: List[str]) -> None:
+        self._check_and_add(keys)
+        self.inner.add_batch(keys)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+def build_duplicate_detector(mode: str = 'exact', bloom: bool = False,
+                             bloom_capacity: int = 1_000_000) -> Callable[[], DuplicateDetector]:
+    """
+    Factory for EmailProcessingService(dedup=...).
+
+    mode: 'exact' (set of strings), 'hash64' / 'hash128' (set of digests),
+        'disk' (SQLite, exact, bounded memory)
+    bloom: put a BloomPrefilter sized for bloom_capacity distinct keys in
+        front of the disk detector. In-memory modes already answer in O(1)
+        without I/O, so there the flag is ignored.
+    """
+    if mode == 'exact':
+        return ExactDuplicateDetector
+    if mode == 'hash64':
+        return partial(HashedDuplicateDetector, bits=64)
+    if mode == 'hash128':
+        return partial(HashedDuplicateDetector, bits=128)
+    if mode != 'disk':
+        raise ValueError(f"Invalid dedup mode: {mode}. Use: {', '.join(DEDUP_MODES)}")
+
+    if bloom:
+        return lambda: BloomPrefilter(SqliteDuplicateDetector(), capacity=bloom_capacity)
+    return SqliteDuplicateDetector
@@ -0,0 +1,88 @@
+"""
+Delta Transform Engine - Reutiliza la salida de una corrida anterior
+"""
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from src.features.email_processing.domain.email import Email, EmailBatch, TransformError
+from src.features.email_processing.domain.ports import TransformEngine
+from src.features.email_processing.domain.transform_engine import LookupTransformEngine
+
+
+class _Targets(Mapping):
+    """correo_original -> correo_nuevo view over the previous rows (no second dict)."""
+
+    def __init__(self, rows: Dict[str, Tuple[str, str, str]]):
+        self._rows = rows
+
+    def __getitem__(self, raw: str) -> str:
+        return self._rows[raw][2]
+
+    def get(self, raw: str, default: Optional[str] = None) -> Optional[str]:
+        row = self._rows.get(raw)
+        return default if row is None else row[2]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class DeltaTransformEngine(LookupTransformEngine):
+    """
+    Answers addresses already present in a previous run's output from that
+    output, so only new addresses are validated and transformed.
+
+    `previous` holds [nombre, apellido, correo_original, correo_nuevo] rows
+    (iter_csv_rows(), email_rows()). They are indexed as correo_original ->
+    (nombre, apellido, correo_nuevo) tuples; an Email is only built for a
+    row that is reused or reported as removed. A row is reused (unchanged)
+    when it targets the same domain; its correo_nuevo is kept as is. Pass
+    `targets` to EmailProcessingService(reserved=...) so the collision
+    resolver / DUP-TARGET detector treat those addresses as taken and
+    suffixes issued earlier stay stable. After the run:
+    - added: rows passed to record() (the final output) that were not reused
+    - removed(): previous rows whose address is no longer in the input
+    - unchanged: number of reused rows
+    Addresses rejected last time are not in the output, so they are
+    validated (and rejected) again.
+    """
+
+    def __init__(self, engine: TransformEngine, previous: Iterable[Sequence[str]]):
+        super().__init__(engine)
+        self._previous: Dict[str, Tuple[str, str, str]] = {
+            correo_original: (nombre, apellido, correo_nuevo)
+            for nombre, apellido, correo_original, correo_nuevo in previous
+        }
+        self.targets: Mapping[str, str] = _Targets(self._previous)
+        self._reused = set()
+        self.added: List[Email] = []
+
+    @property
+    def previous_count(self) -> int:
+        return len(self._previous)
+
+    @property
+    def unchanged(self) -> int:
+        return len(self._reused)
+
+    def _lookup(self, emails: List[str], domain: str) -> List[Optional[Union[Email, TransformError]]]:
+        suffix = f"@{domain}"
+        results = [Email(row[0], row[1], raw, row[2]) if row is not None and row[2].endswith(suffix) else None
+                   for raw, row in zip(emails, map(self._previous.get, emails))]
+        self._reused.update([raw for raw, item in zip(emails, results) if item is not None])
+        return results
+
+    def record(self, emails: Iterable[Email]) -> None:
+        """Accepted rows as finally written (after collision handling); new ones go to added."""
+        reused = self._reused
+        if isinstance(emails, EmailBatch):
+            # Solo se construye el Email de las filas nuevas
+            self.added.extend(emails[i] for i, raw in enumerate(emails.correos_originales) if raw not in reused)
+        else:
+            self.added.extend(email for email in emails if email.correo_original not in reused)
+
+    def removed(self) -> List[Email]:
+        """Previous rows not seen in this run (call after the stream is consumed)."""
+        reused = self._reused
+        return [Email(nombre, apellido, raw, correo_nuevo)
+                for raw, (nombre, apellido, correo_nuevo) in self._previous.items() if raw not in reused]
@@ -1,6 +1,7 @@
 """
 Error Logger - Genera error_log.txt según formato PDD
 """
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -8,7 +9,11 @@ from pathlib import Path
 class ErrorLogger:
     def __init__(self, log_file: str = "error_log.txt"):
         self.log_file = log_file
+        # Líneas pendientes de escribir (todas, si nunca se llama a flush())
         self.errors = []
+        self._flushed_errors = 0
+        self._flushed_warnings = 0
+        self._flushed_lines = 0
     
     def log_error(self, email: str, rule: str, description: str):
         """Registra error en formato PDD: [TIMESTAMP] ERROR: {correo} - {regla} - {descripción}"""
@@ -24,12 +29,45 @@ class ErrorLogger:
     
     def save(self):
         """Guarda errores en archivo"""
-        if self.errors:
+        if self._flushed_lines:
+            self.flush()
+        elif self.errors:
             with open(self.log_file, 'w', encoding='utf-8') as f:
                 f.write('\n'.join(self.errors))
     
+    def flush(self) -> int:
+        """
+        Escribe las líneas pendientes al final del archivo y las libera de
+        memoria (ejecuciones largas / checkpoints). Retorna el tamaño del
+        archivo, válido para resume().
+        """
+        mode = 'a' if self._flushed_lines else 'w'
+        with open(self.log_file, mode, encoding='utf-8') as f:
+            if self.errors:
+                f.write(('\n' if self._flushed_lines else '') + '\n'.join(self.errors))
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        self._flushed_errors += self._count('ERROR:')
+        self._flushed_warnings += self._count('WARNING:')
+        self._flushed_lines += len(self.errors)
+        self.errors = []
+        return size
+    
+    def resume(self, size: int, errors: int, warnings: int):
+        """Continúa un log escrito con flush(): lo recorta a size y restaura los contadores."""
+        if os.path.exists(self.log_file):
+            os.truncate(self.log_file, size)
+        self.errors = []
+        self._flushed_errors = errors
+        self._flushed_warnings = warnings
+        self._flushed_lines = errors + warnings
+    
+    def _count(self, kind: str) -> int:
+        return len([e for e in self.errors if kind in e])
+    
     def get_error_count(self) -> int:
-        return len([e for e in self.errors if 'ERROR:' in e])
+        return self._flushed_errors + self._count('ERROR:')
     
     def get_warning_count(self) -> int:
-        return len([e for e in self.errors if 'WARNING:' in e])
+        return self._flushed_warnings + self._count('WARNING:')
@@ -0,0 +1,146 @@
+"""
+Background Jobs - Cola en proceso para transformaciones largas (API)
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+class Job:
+    """
+    State of one background job: queued -> running -> done | failed.
+
+    The task updates `stats` in place (the dict given to
+    EmailProcessingService.transform_stream) and either `rows_total` (when
+    the input size is known) or `fraction` (e.g. bytes read / file size),
+    so progress() can be read from any thread while it runs.
+    """
+
+    def __init__(self, job_id: str, output_path: str, params: Optional[Dict] = None):
+        self.id = job_id
+        self.output_path = output_path
+        self.params = params or {}
+        self.status = 'queued'
+        self.error = None
+        self.stats = {}
+        self.rows_total = None
+        self.fraction = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+
+    @property
+    def rows_done(self) -> int:
+        return self.stats.get('total', 0)
+
+    def progress(self) -> Dict:
+        """rows_done, rows_total, percent, rate (rows/s) and eta_seconds (None when unknown)."""
+        done = self.rows_done
+        elapsed = ((self.finished or time.time()) - self.started) if self.started else 0.0
+        rate = done / elapsed if elapsed > 0 else 0.0
+
+        if self.status == 'done':
+            fraction = 1.0
+        elif self.rows_total:
+            fraction = min(done / self.rows_total, 1.0)
+        else:
+            fraction = self.fraction
+        eta = None
+        if self.status == 'running' and fraction:
+            eta = round(elapsed * (1 - fraction) / fraction, 1)
+
+        return {
+            'rows_done': done,
+            'rows_total': self.rows_total,
+            'percent': round(fraction * 100, 1) if fraction is not None else None,
+            'rate': round(rate, 1),
+            'eta_seconds': eta,
+        }
+
+    def to_dict(self) -> Dict:
+        data = {'id': self.id, 'status': self.status, 'params': self.params, 'progress': self.progress()}
+        if self.status == 'done':
+            data['processed'] = self.stats.get('processed', 0)
+            data['total'] = self.stats.get('total', 0)
+            data['error_counts'] = self.stats.get('error_counts', {})
+        if self.error is not None:
+            data['error'] = self.error
+        return data
+
+
+class JobManager:
+    """
+    In-process job queue: tasks run on a local thread pool and write their
+    output to a file under `directory` (a temporary directory by default).
+
+    Jobs are kept in memory; once more than max_jobs exist, the oldest
+    finished ones are dropped together with their output file. Nothing
+    survives a restart, which keeps the API free of external services.
+    """
+
+    def __init__(self, workers: int = 2, directory: Optional[str] = None, max_jobs: int = 100):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if max_jobs < 1:
+            raise ValueError("max_jobs must be >= 1")
+        self.workers = workers
+        self.max_jobs = max_jobs
+        self._owns_directory = directory is None
+        self._directory = directory
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="email-job")
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix='email_jobs_')
+        return self._directory
+
+    def submit(self, task: Callable[[Job], None], suffix: str = '', params: Optional[Dict] = None) -> Job:
+        """Queue task(job); the task writes job.output_path and updates job.stats."""
+        job_id = uuid.uuid4().hex
+        job = Job(job_id, os.path.join(self.directory, f"{job_id}{suffix}"), params)
+        with self._lock:
+            self._jobs[job_id] = job
+            self._evict()
+        self._executor.submit(self._run, job, task)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, task: Callable[[Job], None]) -> None:
+        job.status = 'running'
+        job.started = time.time()
+        try:
+            task(job)
+            status = 'done'
+        except Exception as e:
+            job.error = str(e)
+            status = 'failed'
+        # finished antes que status: quien consulte nunca ve 'done' sin tiempo final
+        job.finished = time.time()
+        job.status = status
+
+    def _evict(self) -> None:
+        # Solo trabajos terminados: los que están en cola o en curso se conservan
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in [j.id for j in self._jobs.values() if j.status in ('done', 'failed')][:max(excess, 0)]:
+            job = self._jobs.pop(job_id)
+            if os.path.exists(job.output_path):
+                os.unlink(job.output_path)
+
+    def close(self) -> None:
+        """Wait for running jobs and remove the temporary directory (if owned)."""
+        self._executor.shutdown(wait=True)
+        if self._owns_directory and self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
@@ -1,27 +1,110 @@
+import atexit
+import functools
 import logging
 import os
-from datetime import datetime
+import time
+from typing import TYPE_CHECKING, Dict, Optional
 from src.features.email_processing.domain.ports import Logger
 
+# logging.handlers (socket, pickle...) y queue solo hacen falta en modo async:
+# se importan al activarlo, fuera del arranque en frío de Lambda
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+# Un listener por logger con nombre (los loggers de logging son globales por nombre)
+_LISTENERS: Dict[str, 'QueueListener'] = {}
+
+
+class WarningSampler(logging.Filter):
+    """
+    Thins out WARNING records (one per duplicate / rejected row on dirty data).
+
+    Keeps one of every `sample_every` warnings and at most `max_per_second`
+    per wall-clock second. Other levels always pass. Dropped records are
+    counted in `suppressed`.
+    """
+
+    def __init__(self, sample_every: int = 1, max_per_second: Optional[int] = None):
+        super().__init__()
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
+        if max_per_second is not None and max_per_second < 1:
+            raise ValueError("max_per_second must be >= 1")
+        self.sample_every = sample_every
+        self.max_per_second = max_per_second
+        self.suppressed = 0
+        self._seen = 0
+        self._window = None
+        self._window_count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.WARNING:
+            return True
+
+        self._seen += 1
+        if (self._seen - 1) % self.sample_every:
+            self.suppressed += 1
+            return False
+
+        if self.max_per_second is not None:
+            window = int(time.monotonic())
+            if window != self._window:
+                self._window = window
+                self._window_count = 0
+            if self._window_count >= self.max_per_second:
+                self.suppressed += 1
+                return False
+            self._window_count += 1
+        return True
+
+
+@functools.lru_cache(maxsize=None)
+def _in_process_queue_handler() -> type:
+    """
+    QueueHandler for a listener in the same process: enqueues the record
+    untouched, so formatting happens on the listener thread instead of in
+    the caller (QueueHandler.prepare copies and formats every record).
+    """
+    from logging.handlers import QueueHandler
+
+    class _InProcessQueueHandler(QueueHandler):
+        def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+            return record
+
+    return _InProcessQueueHandler
+
 
 class PythonLogger(Logger):
-    def __init__(self, name: str = "email_processor"):
+    """
+    Logger adapter over the standard logging module.
+
+    async_mode moves the console/file handlers to a QueueListener thread so
+    callers only enqueue records. warning_sample / warning_rate install a
+    WarningSampler on the logger (see configure()).
+    """
+
+    def __init__(self, name: str = "email_processor", async_mode: bool = False,
+                 warning_sample: int = 1, warning_rate: Optional[int] = None):
         self.logger = logging.getLogger(name)
         self._setup_logger()
-    
+        # Con los valores por defecto no se toca la configuración compartida del nombre
+        if async_mode or warning_sample > 1 or warning_rate is not None:
+            self.configure(async_mode, warning_sample, warning_rate)
+
     def _setup_logger(self):
         if not self.logger.handlers:
             self.logger.setLevel(logging.INFO)
-            
+
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.INFO)
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             console_handler.setFormatter(formatter)
             self.logger.addHandler(console_handler)
-            
+
             # Solo agregar file handler si NO estamos en Lambda
             if not os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
                 try:
+                    from datetime import datetime
                     log_file = f"email_processor_{datetime.now().strftime('%Y%m%d')}.log"
                     file_handler = logging.FileHandler(log_file, encoding='utf-8')
                     file_handler.setLevel(logging.DEBUG)
@@ -29,12 +112,87 @@ class PythonLogger(Logger):
                     self.logger.addHandler(file_handler)
                 except (OSError, PermissionError):
                     pass
-    
+
+    def configure(self, async_mode: bool = False, warning_sample: int = 1,
+                  warning_rate: Optional[int] = None) -> None:
+        """
+        Switch between synchronous and queue-based logging and (re)set
+        warning sampling. Applies to every PythonLogger sharing this name.
+        """
+        for existing in [f for f in self.logger.filters if isinstance(f, WarningSampler)]:
+            self.logger.removeFilter(existing)
+        if warning_sample > 1 or warning_rate is not None:
+            self.logger.addFilter(WarningSampler(warning_sample, warning_rate))
+
+        if async_mode:
+            self._start_async()
+        else:
+            self._stop_async()
+
+    @property
+    def async_mode(self) -> bool:
+        return self.logger.name in _LISTENERS
+
+    @property
+    def suppressed(self) -> int:
+        """Warnings dropped by sampling / rate limiting so far."""
+        return sum(f.suppressed for f in self.logger.filters if isinstance(f, WarningSampler))
+
+    def _start_async(self):
+        if self.async_mode:
+            return
+        import queue
+        from logging.handlers import QueueListener
+        handlers = list(self.logger.handlers)
+        for handler in handlers:
+            self.logger.removeHandler(handler)
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _LISTENERS[self.logger.name] = listener
+        self.logger.addHandler(_in_process_queue_handler()(log_queue))
+
+    def _stop_async(self):
+        listener = _LISTENERS.pop(self.logger.name, None)
+        if listener is None:
+            return
+        from logging.handlers import QueueHandler
+        # stop() procesa lo que quede en la cola antes de volver
+        listener.stop()
+        for handler in [h for h in self.logger.handlers if isinstance(h, QueueHandler)]:
+            self.logger.removeHandler(handler)
+        for handler in listener.handlers:
+            self.logger.addHandler(handler)
+
+    def flush(self) -> None:
+        """Drain queued records (async mode) and flush handlers."""
+        if self.async_mode:
+            self._stop_async()
+            self._start_async()
+        for handler in self.logger.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """Report dropped warnings and go back to synchronous handlers."""
+        suppressed = self.suppressed
+        if suppressed:
+            self.logger.info(f"Suppressed {suppressed} warning records (sampling/rate limit)")
+        for sampler in [f for f in self.logger.filters if isinstance(f, WarningSampler)]:
+            sampler.suppressed = 0
+        self._stop_async()
+
     def info(self, message: str):
         self.logger.info(message)
-    
+
     def warning(self, message: str):
         self.logger.warning(message)
-    
+
     def error(self, message: str):
-        self.logger.error(message)
\ No newline at end of file
+        self.logger.error(message)
+
+
+@atexit.register
+def _stop_listeners():
+    for listener in list(_LISTENERS.values()):
+        listener.stop()
+    _LISTENERS.clear()
@@ -0,0 +1,105 @@
+"""
+Parallel Transform Engine - Ejecuta BR-001..BR-005 / TR-001..TR-005 en varios procesos
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Union
+from src.features.email_processing.domain.email import Email, TransformError
+from src.features.email_processing.domain.ports import EmailValidator, TransformEngine
+from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+from src.features.email_processing.domain.validation import ValidationReason
+
+# Engine del proceso worker, creado una sola vez por el initializer del pool
+_worker_engine = None
+
+# Resultado compacto por fila (pickle de tuplas, no de objetos): aceptada ->
+# (nombre, apellido, correo_nuevo); rechazada -> (índice de la razón, detail).
+# El correo_original no viaja de vuelta, el proceso padre ya lo tiene.
+_REASONS = list(ValidationReason)
+_REASON_INDEX = {reason: index for index, reason in enumerate(_REASONS)}
+
+
+def _init_worker(validator: EmailValidator):
+    global _worker_engine
+    _worker_engine = SequentialTransformEngine(validator)
+
+
+def _transform_in_worker(emails: List[str], new_domain: str) -> List[tuple]:
+    return [(item.nombre, item.apellido, item.correo_nuevo) if isinstance(item, Email)
+            else (_REASON_INDEX[item.reason], item.detail)
+            for item in _worker_engine.transform_batch(emails, new_domain)]
+
+
+def _decode(emails: List[str], rows: List[tuple]) -> List[Union[Email, TransformError]]:
+    return [Email(row[0], row[1], raw_email, row[2]) if len(row) == 3
+            else TransformError(raw_email, _REASONS[row[0]], row[1])
+            for raw_email, row in zip(emails, rows)]
+
+
+class ProcessPoolTransformEngine(TransformEngine):
+    """
+    Shards batches across a process pool and yields results in input order.
+
+    workers=None uses every core. At most `prefetch` batches are in flight,
+    so input is still consumed lazily. Duplicate detection stays in the
+    calling process (see EmailProcessingService), which keeps it global and
+    deterministic. Workers send back compact tuples instead of pickled
+    Email objects; rows are rebuilt here next to the submitted batch.
+    """
+
+    def __init__(self, validator: EmailValidator, workers: Optional[int] = None,
+                 batch_size: int = 2000, prefetch: Optional[int] = None):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self._validator = validator
+        self.workers = workers
+        self.batch_size = batch_size
+        self._prefetch = prefetch or workers * 2
+        self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self._validator,)
+            )
+        return self._executor
+
+    def transform_batch(self, emails: List[str], new_domain: str) -> List[Union[Email, TransformError]]:
+        if not emails:
+            return []
+        return _decode(emails, self._get_executor().submit(_transform_in_worker, emails, new_domain).result())
+
+    def transform_batches(self, batches: Iterable[List[str]], new_domain: str) -> Iterator[List[Union[Email, TransformError]]]:
+        executor = self._get_executor()
+        pending = deque()
+
+        try:
+            for batch in batches:
+                pending.append((batch, executor.submit(_transform_in_worker, batch, new_domain)))
+                if len(pending) >= self._prefetch:
+                    batch, future = pending.popleft()
+                    yield _decode(batch, future.result())
+            while pending:
+                batch, future = pending.popleft()
+                yield _decode(batch, future.result())
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,78 @@
+"""
+Request Log - Una línea estructurada y acotada por invocación (Lambda)
+"""
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Encoder propio: shared no depende de los adapters de la feature
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+class RequestLog:
+    """
+    Collects metadata of one request (path, sizes, counts, timings) and logs
+    it as a single JSON line when the request finishes.
+
+    The body is never serialized or logged by default. With sample_rate > 0
+    that fraction of requests also logs the first max_payload characters of
+    the raw body (payload_truncated tells whether it was cut). Headers are
+    not logged, so the API key never reaches the logs.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, sample_rate: float = 0.0,
+                 max_payload: int = 1024, rng: Callable[[], float] = random.random):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        if max_payload < 0:
+            raise ValueError("max_payload must be >= 0")
+        self.logger = logger or logging.getLogger(__name__)
+        self.sample_rate = sample_rate
+        self.max_payload = max_payload
+        self._rng = rng
+        self._record: Dict[str, Any] = {}
+        self._started = None
+
+    @classmethod
+    def from_env(cls, logger: Optional[logging.Logger] = None) -> 'RequestLog':
+        """LOG_PAYLOAD_SAMPLE_RATE (0..1, default 0) and LOG_PAYLOAD_MAX_CHARS (default 1024)."""
+        return cls(logger,
+                   sample_rate=float(os.environ.get('LOG_PAYLOAD_SAMPLE_RATE', '0')),
+                   max_payload=int(os.environ.get('LOG_PAYLOAD_MAX_CHARS', '1024')))
+
+    def start(self, event: Dict[str, Any], context: Any = None) -> None:
+        """Begin a request: keep only metadata of the API Gateway event."""
+        headers = event.get('headers') or {}
+        body = event.get('body') or ''
+        http = (event.get('requestContext') or {}).get('http') or {}
+        self._started = time.perf_counter()
+        self._record = {
+            'request_id': getattr(context, 'aws_request_id', None),
+            'method': http.get('method') or event.get('httpMethod'),
+            'path': event.get('rawPath', event.get('path', '')),
+            'content_type': headers.get('content-type') or headers.get('Content-Type'),
+            'body_chars': len(body),
+            'base64': bool(event.get('isBase64Encoded')),
+        }
+        if self.sample_rate and self._rng() < self.sample_rate:
+            self._record['payload'] = body[:self.max_payload]
+            self._record['payload_truncated'] = len(body) > self.max_payload
+
+    def add(self, **fields: Any) -> None:
+        """Attach counts / timings from the processing steps (no-op outside a request)."""
+        if self._started is not None:
+            self._record.update(fields)
+
+    def finish(self, status: int) -> Dict[str, Any]:
+        """Log the request line (status, duration_ms) and return it."""
+        record = self._record
+        if self._started is not None:
+            record['status'] = status
+            record['duration_ms'] = round((time.perf_counter() - self._started) * 1000, 2)
+            self.logger.info(_ENCODER.encode(record))
+        self._record = {}
+        self._started = None
+        return record
@@ -0,0 +1,183 @@
+"""
+Transform Cache - Caché persistente de BR-001..BR-005 / TR-001..TR-005 en SQLite
+"""
+import hashlib
+import sqlite3
+from typing import Dict, List, Optional, Union
+from src.features.email_processing.domain.email import Email, TransformError
+from src.features.email_processing.domain.ports import TransformEngine
+from src.features.email_processing.domain.transform_engine import LookupTransformEngine
+from src.features.email_processing.domain.validation import RULES_VERSION, ValidationReason
+
+
+def rules_fingerprint() -> str:
+    """Cache version: RULES_VERSION plus every rule code and message."""
+    digest = hashlib.sha1(RULES_VERSION.encode('utf-8'))
+    for reason in ValidationReason:
+        digest.update(f"\0{reason.name}\0{reason.message}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class CachedTransformEngine(LookupTransformEngine):
+    """
+    Wraps another engine with an on-disk cache keyed by (raw email, domain).
+
+    Each batch is looked up first, with its distinct addresses in sorted
+    order so the B-tree is walked forward; only misses reach the wrapped
+    engine. Their outcome is stored as one compact text value: nombre and
+    apellido, or the rule code and detail of a rejection.
+
+    Entries carry the run that last used them, and close() evicts the
+    least recently used ones beyond max_entries. A hit whose stamp is at
+    least stamp_age runs old is collected and re-stamped in bulk (sorted,
+    one UPDATE per chunk of keys) once stamp_buffer hits are pending and at
+    the end of the run. stamp_age=1 re-stamps every hit (exact LRU); the
+    default 4 keeps LRU order to within 4 runs while entries used on every
+    run are written once every 4 runs instead of on each. An evicted
+    address that is still in the input is simply a miss and re-inserted.
+    The cache is dropped when the rule set fingerprint or the storage
+    layout changes (see RULES_VERSION).
+    """
+
+    _LOOKUP_CHUNK = 997  # + dominio y corrida = 999, límite de parámetros de SQLite < 3.32
+    _LAYOUT = '2'
+    _SEP = '\x1f'  # no aparece en un correo que pasa BR-001..BR-005
+
+    def __init__(self, engine: TransformEngine, path: str, max_entries: int = 5_000_000,
+                 version: Optional[str] = None, cache_kb: int = 64 * 1024, stamp_age: int = 4,
+                 stamp_buffer: int = 100_000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if stamp_age < 1:
+            raise ValueError("stamp_age must be >= 1")
+        super().__init__(engine)
+        self.path = path
+        self.max_entries = max_entries
+        self.version = version or rules_fingerprint()
+        self.cache_kb = cache_kb
+        self.stamp_age = stamp_age
+        self.stamp_buffer = stamp_buffer
+        self._conn = None
+        # Aciertos pendientes de re-sellar con la corrida actual, por dominio
+        self._stamps: Dict[str, List[str]] = {}
+        self._pending_stamps = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_kb)}")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        stored = dict(conn.execute("SELECT key, value FROM meta WHERE key IN ('version', 'layout')"))
+        if stored.get('version') != self.version or stored.get('layout') != self._LAYOUT:
+            # Reglas o formato distintos: los resultados guardados ya no valen
+            conn.execute("DROP TABLE IF EXISTS transforms")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (self.version,))
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('layout', ?)", (self._LAYOUT,))
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('run', '0')")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS transforms (
+                domain TEXT NOT NULL,
+                raw TEXT NOT NULL,
+                result TEXT NOT NULL,
+                run INTEGER NOT NULL,
+                PRIMARY KEY (domain, raw)
+            ) WITHOUT ROWID
+        """)
+        self._run = int(conn.execute("SELECT value FROM meta WHERE key = 'run'").fetchone()[0]) + 1
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'run'", (str(self._run),))
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def _lookup(self, emails: List[str], domain: str) -> List[Optional[Union[Email, TransformError]]]:
+        """Cached result per email, None on a miss."""
+        conn = self._connect()
+        keys = sorted(set(emails))
+        found = {}
+        stale = []
+        oldest_fresh = self._run - self.stamp_age + 1
+        for start in range(0, len(keys), self._LOOKUP_CHUNK):
+            chunk = keys[start:start + self._LOOKUP_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            for raw, result, fresh in conn.execute(
+                    f"SELECT raw, result, run >= ? FROM transforms WHERE domain = ? AND raw IN ({placeholders})",
+                    [oldest_fresh, domain, *chunk]):
+                found[raw] = result
+                if not fresh:
+                    stale.append(raw)
+        if not found:
+            return [None] * len(emails)
+        if stale:
+            self._stamp(domain, stale)
+
+        sep = self._SEP
+        suffix = f"@{domain}"
+        results = []
+        for raw in emails:
+            value = found.get(raw)
+            if value is None:
+                results.append(None)
+            elif value[0] == sep:
+                reason, _, detail = value[1:].partition(sep)
+                results.append(TransformError(raw, ValidationReason[reason], detail or None))
+            else:
+                nombre, _, apellido = value.partition(sep)
+                results.append(Email(nombre, apellido, raw, f"{nombre.lower()}.{apellido.lower()}{suffix}"))
+        return results
+
+    def _store(self, emails: List[str], results: List[Union[Email, TransformError]], domain: str) -> None:
+        sep = self._SEP
+        run = self._run
+        rows = [(domain, raw, f"{item.nombre}{sep}{item.apellido}" if isinstance(item, Email)
+                 else f"{sep}{item.reason.name}{sep}{item.detail or ''}", run)
+                for raw, item in zip(emails, results)]
+        self._conn.executemany("INSERT OR REPLACE INTO transforms VALUES (?, ?, ?, ?)", rows)
+
+    def _stamp(self, domain: str, keys: List[str]) -> None:
+        self._stamps.setdefault(domain, []).extend(keys)
+        self._pending_stamps += len(keys)
+        if self._pending_stamps >= self.stamp_buffer:
+            self._flush_stamps()
+
+    def _flush_stamps(self) -> None:
+        """Mark pending hits as used by this run: sorted keys, one UPDATE per chunk."""
+        for domain, keys in self._stamps.items():
+            keys = sorted(set(keys))
+            for start in range(0, len(keys), self._LOOKUP_CHUNK):
+                chunk = keys[start:start + self._LOOKUP_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                self._conn.execute(f"UPDATE transforms SET run = ? WHERE domain = ? AND raw IN ({placeholders})",
+                                   [self._run, domain, *chunk])
+        self._stamps = {}
+        self._pending_stamps = 0
+
+    def _finish(self) -> None:
+        if self._conn is not None:
+            self._flush_stamps()
+            self._conn.commit()
+
+    def evict(self) -> int:
+        """Drop the least recently used entries beyond max_entries; returns how many were removed."""
+        conn = self._connect()
+        self._flush_stamps()
+        excess = conn.execute("SELECT COUNT(*) FROM transforms").fetchone()[0] - self.max_entries
+        if excess <= 0:
+            return 0
+        conn.execute("""
+            DELETE FROM transforms WHERE (domain, raw) IN (
+                SELECT domain, raw FROM transforms ORDER BY run LIMIT ?
+            )
+        """, (excess,))
+        conn.commit()
+        return excess
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.evict()
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+        super().close()
@@ -1,6 +1,10 @@
 import re
 from typing import Tuple
 from src.features.email_processing.domain.ports import EmailValidator
+from src.features.email_processing.domain.validation import ValidationReason, ValidationResult
+
+# Resultados de rechazo precalculados: el camino inválido no asigna objetos nuevos
+_REJECTED = {reason: ValidationResult(reason) for reason in ValidationReason}
 
 
 class RegexEmailValidator(EmailValidator):
@@ -77,3 +81,96 @@ class RegexEmailValidator(EmailValidator):
     def validate_domain(self, domain: str) -> bool:
         """Valida formato DNS del dominio destino"""
         return bool(self.domain_pattern.match(domain))
+
+
+class CompiledEmailValidator(EmailValidator):
+    """
+    Single-pass implementation of BR-001 to BR-005.
+
+    Valid addresses are accepted with one fullmatch of a compiled pattern
+    (named groups nombre/apellido). Only rejected addresses pay for locating
+    the failing rule, which produces the same codes and messages as
+    RegexEmailValidator. validate_fast() never raises.
+    """
+
+    _EMAIL_PATTERN = re.compile(r'(?P<nombre>[a-zA-Z]{2,50})\.(?P<apellido>[a-zA-Z]{2,50})@[^@]*')
+
+    # BR-005: (números, guiones, apóstrofes, otros) por campo
+    _NOMBRE_CHARSET_REASONS = (ValidationReason.NOMBRE_DIGITS, ValidationReason.NOMBRE_HYPHEN,
+                               ValidationReason.NOMBRE_APOSTROPHE, ValidationReason.NOMBRE_INVALID_CHARS)
+    _APELLIDO_CHARSET_REASONS = (ValidationReason.APELLIDO_DIGITS, ValidationReason.APELLIDO_HYPHEN,
+                                 ValidationReason.APELLIDO_APOSTROPHE, ValidationReason.APELLIDO_INVALID_CHARS)
+
+    def __init__(self):
+        self.name_pattern = re.compile(r'^[a-zA-Z]+$')
+        self.domain_pattern = re.compile(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+        self._fullmatch = self._EMAIL_PATTERN.fullmatch
+
+    def is_valid(self, email: str) -> bool:
+        return self.validate_fast(email).reason is None
+
+    def validate_and_parse(self, email: str) -> Tuple[str, str]:
+        email = email.strip()
+
+        match = self._fullmatch(email)
+        if match is not None:
+            return match.group('nombre').lower(), match.group('apellido').lower()
+
+        reason, nombre, apellido, _ = self._find_violation(email)
+        if reason is not None:
+            raise ValueError(reason.message)
+        return nombre, apellido
+
+    def validate_fast(self, email: str) -> ValidationResult:
+        email = email.strip()
+
+        match = self._fullmatch(email)
+        if match is not None:
+            return ValidationResult(None, match.group('nombre').lower(), match.group('apellido').lower())
+        return self._find_violation(email)
+
+    def validate_domain(self, domain: str) -> bool:
+        """Valida formato DNS del dominio destino"""
+        return bool(self.domain_pattern.match(domain))
+
+    def _find_violation(self, email: str) -> ValidationResult:
+        """Locate the first failing rule with index scans instead of count()/split()."""
+        # BR-001: Exactamente un @
+        at = email.find('@')
+        if at < 0:
+            return _REJECTED[ValidationReason.MISSING_AT]
+        if email.find('@', at + 1) >= 0:
+            return _REJECTED[ValidationReason.MULTIPLE_AT]
+
+        # BR-002: Exactamente un punto en prefijo
+        dot = email.find('.', 0, at)
+        if dot < 0:
+            return _REJECTED[ValidationReason.MISSING_DOT]
+        if email.find('.', dot + 1, at) >= 0:
+            return _REJECTED[ValidationReason.MULTIPLE_DOTS]
+
+        nombre = email[:dot]
+        apellido = email[dot + 1:at]
+
+        # BR-003 / BR-004: Longitud 2-50
+        if len(nombre) < 2:
+            return _REJECTED[ValidationReason.NOMBRE_TOO_SHORT]
+        if len(nombre) > 50:
+            return _REJECTED[ValidationReason.NOMBRE_TOO_LONG]
+        if len(apellido) < 2:
+            return _REJECTED[ValidationReason.APELLIDO_TOO_SHORT]
+        if len(apellido) > 50:
+            return _REJECTED[ValidationReason.APELLIDO_TOO_LONG]
+
+        # BR-005: Solo letras (sin acentos)
+        for part, reasons in ((nombre, self._NOMBRE_CHARSET_REASONS), (apellido, self._APELLIDO_CHARSET_REASONS)):
+            if not self.name_pattern.match(part):
+                if any(c.isdigit() for c in part):
+                    return _REJECTED[reasons[0]]
+                if '-' in part:
+                    return _REJECTED[reasons[1]]
+                if "'" in part:
+                    return _REJECTED[reasons[2]]
+                return _REJECTED[reasons[3]]
+
+        return ValidationResult(None, nombre.lower(), apellido.lower())
@@ -1,6 +1,11 @@
 @echo off
 echo Building Lambda deployment package...
 
+REM Debe coincidir con el runtime de main.tf (python3.11): los .pyc llevan la version en el nombre
+if "%PYTHON%"=="" set PYTHON=python
+%PYTHON% -c "import sys; sys.exit(sys.version_info[:2] != (3, 11))"
+if errorlevel 1 echo WARNING: %PYTHON% is not Python 3.11; precompiled bytecode will be ignored by the Lambda runtime
+
 if exist lambda_package rmdir /s /q lambda_package
 if exist lambda_function.zip del lambda_function.zip
 
@@ -8,6 +13,22 @@ mkdir lambda_package
 xcopy /E /I /Y ..\src lambda_package\src
 copy /Y lambda_handler.py lambda_package\
 
+REM Fuera del zip: adaptadores que Lambda no usa y que dependen de paquetes no
+REM incluidos (Flask, openpyxl, numpy, uvicorn)
+del /q lambda_package\src\features\email_processing\adapters\input\api_adapter.py
+del /q lambda_package\src\features\email_processing\adapters\input\asgi_adapter.py
+del /q lambda_package\src\features\email_processing\adapters\input\cli_adapter.py
+del /q lambda_package\src\features\email_processing\adapters\input\cli_entrypoint.py
+del /q lambda_package\src\features\email_processing\adapters\output\excel_adapter.py
+del /q lambda_package\src\shared\vectorized_engine.py
+for /d /r lambda_package %%d in (__pycache__) do if exist "%%d" rmdir /s /q "%%d"
+
+REM Bytecode precompilado: /var/task es de solo lectura, sin .pyc cada arranque en
+REM frio recompila todos los modulos. unchecked-hash: valido aunque el zip cambie
+REM las fechas de los .py
+%PYTHON% -m compileall -q --invalidation-mode unchecked-hash lambda_package
+if errorlevel 1 exit /b 1
+
 cd lambda_package
 powershell Compress-Archive -Path * -DestinationPath ..\lambda_function.zip -Force
 cd ..
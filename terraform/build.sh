@@ -3,6 +3,15 @@
 # Build Lambda deployment package
 echo "Building Lambda deployment package..."
 
+# Debe coincidir con el runtime de main.tf (python3.11): los .pyc llevan la versión en el nombre
+PYTHON=${PYTHON:-python3.11}
+if ! command -v "$PYTHON" > /dev/null; then
+    PYTHON=python3
+fi
+if [ "$($PYTHON -c 'import sys; print("%d.%d" % sys.version_info[:2])')" != "3.11" ]; then
+    echo "WARNING: $PYTHON is not Python 3.11; precompiled bytecode will be ignored by the Lambda runtime"
+fi
+
 # Create temp directory
 rm -rf lambda_package
 mkdir -p lambda_package
@@ -11,9 +20,24 @@ mkdir -p lambda_package
 cp -r ../src lambda_package/
 cp lambda_handler.py lambda_package/
 
+# Fuera del zip: adaptadores que Lambda no usa y que dependen de paquetes no
+# incluidos (Flask, openpyxl, numpy, uvicorn)
+rm -f lambda_package/src/features/email_processing/adapters/input/api_adapter.py \
+      lambda_package/src/features/email_processing/adapters/input/asgi_adapter.py \
+      lambda_package/src/features/email_processing/adapters/input/cli_adapter.py \
+      lambda_package/src/features/email_processing/adapters/input/cli_entrypoint.py \
+      lambda_package/src/features/email_processing/adapters/output/excel_adapter.py \
+      lambda_package/src/shared/vectorized_engine.py
+find lambda_package -name __pycache__ -prune -exec rm -rf {} +
+
+# Bytecode precompilado: /var/task es de solo lectura, sin .pyc cada arranque en
+# frío recompila todos los módulos. unchecked-hash: válido aunque el zip cambie
+# las fechas de los .py
+"$PYTHON" -m compileall -q --invalidation-mode unchecked-hash lambda_package || exit 1
+
 # Create zip
 cd lambda_package
-zip -r ../lambda_function.zip . -x "*.pyc" -x "__pycache__/*"
+zip -qr ../lambda_function.zip .
 cd ..
 
 # Cleanup
@@ -6,6 +6,7 @@ import logging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 
 from src.features.email_processing.adapters.input.lambda_adapter import EmailProcessingLambda
+from src.features.email_processing.adapters.output.json_adapter import iter_ndjson_values
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -22,15 +23,27 @@ def validate_api_key(event):
     return api_key == API_KEY
 
 def handler(event, context):
+    # Solo metadatos: volcar el evento en cada invocación (MB de correos,
+    # file_content en base64, x-api-key) cuesta CPU e ingesta de CloudWatch
+    request_log = lambda_adapter.request_log
+    request_log.start(event, context)
+    result = route(event)
+    request_log.finish(result['statusCode'])
+    return result
+
+def route(event):
     try:
-        logger.info(f"Event: {json.dumps(event)}")
-        
         # Validate API Key
         if not validate_api_key(event):
             logger.warning("Unauthorized: Invalid or missing API key")
             return response(401, {'error': 'Unauthorized: Invalid or missing API key'})
         
         path = event.get('rawPath', event.get('path', ''))
+        
+        # Antes de json.loads: el cuerpo puede ser NDJSON
+        if '/validate/batch' in path:
+            return validate_batch(event)
+        
         body = json.loads(event.get('body', '{}'))
         
         if '/validate' in path:
@@ -64,6 +77,27 @@ def validate_email(data):
         return response(500, {'error': f'Internal server error: {str(e)}'})
 
 
+def validate_batch(event):
+    try:
+        headers = event.get('headers') or {}
+        content_type = headers.get('content-type') or headers.get('Content-Type') or ''
+        raw_body = event.get('body') or ''
+        
+        if content_type.startswith('application/x-ndjson'):
+            emails = iter_ndjson_values(raw_body.splitlines())
+        else:
+            emails = json.loads(raw_body or '{}').get('emails')
+            if not isinstance(emails, list):
+                return response(400, {'error': 'Missing required field: emails (list)'})
+        
+        return response(200, lambda_adapter.validate_batch(emails))
+    except ValueError as e:
+        logger.warning(f"Validation error: {e}")
+        return response(400, {'error': str(e)})
+    except Exception as e:
+        logger.error(f"Validate batch error: {e}", exc_info=True)
+        return response(500, {'error': f'Internal server error: {str(e)}'})
+
 def extract(data):
     try:
         emails = lambda_adapter.extract(data)
@@ -131,6 +165,8 @@ def generate(data):
                 )
                 email_objects.append(email_obj)
         
+        lambda_adapter.request_log.add(output_type=output_type, generated=len(email_objects))
+        
         if output_type == 'inline':
             from src.features.email_processing.domain.output_service import OutputService
             emails = OutputService.generate_inline(email_objects)
@@ -39,6 +39,9 @@ resource "aws_lambda_function" "email_processor" {
     variables = {
       NEW_DOMAIN = "company.com"
       API_KEY    = "prod-email-processor-2024-secure-key"
+      # Fracción de invocaciones que registran el cuerpo (recortado); 0 = solo metadatos
+      LOG_PAYLOAD_SAMPLE_RATE = "0"
+      LOG_PAYLOAD_MAX_CHARS   = "1024"
     }
   }
 }
@@ -126,6 +129,12 @@ resource "aws_apigatewayv2_route" "generate" {
   target    = "integrations/${aws_apigatewayv2_integration.lambda.id}"
 }
 
+resource "aws_apigatewayv2_route" "validate_batch" {
+  api_id    = aws_apigatewayv2_api.email_api.id
+  route_key = "POST /validate/batch"
+  target    = "integrations/${aws_apigatewayv2_integration.lambda.id}"
+}
+
 resource "aws_lambda_permission" "api_gateway" {
   statement_id  = "AllowAPIGatewayInvoke"
   action        = "lambda:InvokeFunction"
@@ -4,6 +4,8 @@ Cobertura de API REST para procesamiento de emails
 """
 import pytest
 import json
+import threading
+import time
 from src.features.email_processing.adapters.input.api_adapter import EmailProcessingAPI
 
 
@@ -55,7 +57,8 @@ def test_api_adapter_init():
 def test_api_adapter_routes_registered(api_adapter):
     """APIAdapter: __init__() registra todas las rutas necesarias"""
     # Arrange
-    expected_routes = ['/validate', '/extract', '/transform', '/generate']
+    expected_routes = ['/validate', '/validate/batch', '/extract', '/transform', '/generate', '/process',
+                       '/jobs', '/jobs/<job_id>', '/jobs/<job_id>/result']
     
     # Act
     registered_routes = [rule.rule for rule in api_adapter.app.url_map.iter_rules() if rule.rule != '/static/<path:filename>']
@@ -133,6 +136,66 @@ def test_api_validate_empty_email(client):
     assert response.status_code == 400
 
 
+# ============================================================================
+# Tests de /validate/batch endpoint
+# ============================================================================
+
+def test_api_validate_batch_json(client):
+    """APIAdapter: /validate/batch devuelve índice, validez y regla por email"""
+    # Arrange
+    payload = {'emails': ['juan.perez@old.com', 'juanperez@old.com', 'j.perez@old.com']}
+
+    # Act
+    response = client.post('/validate/batch', data=json.dumps(payload), content_type='application/json')
+
+    # Assert
+    data = json.loads(response.data)
+    assert response.status_code == 200
+    assert data['results'] == [
+        {'index': 0, 'valid': True},
+        {'index': 1, 'valid': False, 'rule': 'BR-002'},
+        {'index': 2, 'valid': False, 'rule': 'BR-003'},
+    ]
+    assert data['valid'] == 1
+    assert data['total'] == 3
+
+
+def test_api_validate_batch_ndjson(client):
+    """APIAdapter: /validate/batch acepta NDJSON y responde NDJSON con resumen"""
+    # Arrange
+    body = '"juan.perez@old.com"\n{"email": "bad@@old.com"}\n\n'
+
+    # Act
+    response = client.post('/validate/batch', data=body, content_type='application/x-ndjson')
+
+    # Assert
+    lines = [json.loads(line) for line in response.data.decode('utf-8').splitlines()]
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert lines == [
+        {'index': 0, 'valid': True},
+        {'index': 1, 'valid': False, 'rule': 'BR-001'},
+        {'summary': {'valid': 1, 'total': 2}},
+    ]
+
+
+def test_api_validate_batch_invalid_body(client):
+    """APIAdapter: /validate/batch responde 400 sin lista, con elementos no texto o NDJSON inválido"""
+    # Act
+    missing = client.post('/validate/batch', data=json.dumps({}), content_type='application/json')
+    not_string = client.post('/validate/batch', data=json.dumps({'emails': [1]}), content_type='application/json')
+    bad_ndjson = client.post('/validate/batch', data='{not json\n', content_type='application/x-ndjson')
+    no_email = client.post('/validate/batch', data='"juan.perez@old.com"\n{"mail": "x@old.com"}\n',
+                           content_type='application/x-ndjson')
+
+    # Assert
+    assert missing.status_code == 400
+    assert not_string.status_code == 400
+    assert bad_ndjson.status_code == 400
+    assert no_email.status_code == 400
+    assert 'line 2' in json.loads(no_email.data)['error']
+
+
 # ============================================================================
 # Tests de /extract endpoint
 # ============================================================================
@@ -430,6 +493,31 @@ def test_api_generate_json_format(client):
     assert data['format'] == 'json'
 
 
+def test_api_generate_ndjson_format(client):
+    """APIAdapter: POST /generate con output_type='ndjson' retorna una línea por correo"""
+    # Arrange
+    payload = {
+        'transformed': [
+            {'original': 'juan.perez@old.com', 'transformed': 'juan.perez@new.com', 'valid': True},
+            {'original': 'maria.garcia@old.com', 'transformed': 'maria.garcia@new.com', 'valid': True}
+        ],
+        'output_type': 'ndjson'
+    }
+    
+    # Act
+    response = client.post('/generate',
+                          data=json.dumps(payload),
+                          content_type='application/json')
+    
+    # Assert
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['format'] == 'ndjson'
+    lines = data['content'].splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])['correo_nuevo'] == 'juan.perez@new.com'
+
+
 def test_api_generate_inline_format(client):
     """APIAdapter: POST /generate con output_type='inline' retorna lista"""
     # Arrange
@@ -577,3 +665,211 @@ def test_api_complete_flow_extract_transform_generate(client):
     assert generate_response.status_code == 200
     generate_data = json.loads(generate_response.data)
     assert generate_data['count'] == 1
+
+
+# ============================================================================
+# Tests de /process (pipeline en una sola llamada)
+# ============================================================================
+
+def test_api_process_json_default(client):
+    """APIAdapter: /process devuelve emails y resumen en JSON por defecto"""
+    # Arrange
+    payload = {
+        'input_type': 'list',
+        'input': ['juan.perez@old.com', 'invalid', 'maria.garcia@old.com'],
+        'new_domain': 'company.com'
+    }
+
+    # Act
+    response = client.post('/process', data=json.dumps(payload), content_type='application/json')
+
+    # Assert
+    data = json.loads(response.data)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+    assert [e['correo_nuevo'] for e in data['emails']] == ['juan.perez@company.com', 'maria.garcia@company.com']
+    assert data['processed'] == 2
+    assert data['total'] == 3
+    assert sum(data['error_counts'].values()) == 1
+
+
+def test_api_process_matches_three_step_flow(client):
+    """APIAdapter: /process produce el mismo CSV que extract -> transform -> generate"""
+    # Arrange
+    emails = ['juan.perez@old.com', 'ana.lopez@old.com', 'juan.perez@old.com', 'bad@@old.com']
+    transform_data = json.loads(client.post('/transform', data=json.dumps(
+        {'emails': emails, 'new_domain': 'company.com'}), content_type='application/json').data)
+    generate_data = json.loads(client.post('/generate', data=json.dumps(
+        {'transformed': transform_data['transformed'], 'output_type': 'csv'}), content_type='application/json').data)
+
+    # Act
+    response = client.post('/process', data=json.dumps(
+        {'input_type': 'list', 'input': emails, 'new_domain': 'company.com', 'output_type': 'csv'}),
+        content_type='application/json')
+
+    # Assert
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+    assert response.data.decode('utf-8') == generate_data['content']
+
+
+def test_api_process_ndjson_from_text(client):
+    """APIAdapter: /process con texto de entrada y salida NDJSON con línea de resumen"""
+    # Arrange
+    payload = {
+        'input_type': 'text',
+        'input': 'juan.perez@old.com\n\nmaria.garcia@old.com\n',
+        'new_domain': 'company.com',
+        'output_type': 'ndjson'
+    }
+
+    # Act
+    response = client.post('/process', data=json.dumps(payload), content_type='application/json')
+
+    # Assert
+    lines = [json.loads(line) for line in response.data.decode('utf-8').splitlines()]
+    assert response.status_code == 200
+    assert lines[0]['correo_nuevo'] == 'juan.perez@company.com'
+    assert lines[1]['correo_nuevo'] == 'maria.garcia@company.com'
+    assert lines[2] == {'summary': {'processed': 2, 'total': 2, 'error_counts': {}}}
+
+
+def test_api_process_from_file(client, tmp_path):
+    """APIAdapter: /process lee el archivo de entrada"""
+    # Arrange
+    source = tmp_path / "emails.txt"
+    source.write_text("juan.perez@old.com\nmaria.garcia@old.com\n", encoding='utf-8')
+    payload = {'input_type': 'file', 'input': str(source), 'new_domain': 'company.com'}
+
+    # Act
+    response = client.post('/process', data=json.dumps(payload), content_type='application/json')
+
+    # Assert
+    assert response.status_code == 200
+    assert json.loads(response.data)['processed'] == 2
+
+
+def test_api_process_invalid_requests(client):
+    """APIAdapter: /process responde 400 ante dominio, formato o entrada inválidos"""
+    # Arrange
+    base = {'input_type': 'list', 'input': ['juan.perez@old.com'], 'new_domain': 'company.com'}
+    cases = [
+        {**base, 'new_domain': None},
+        {**base, 'new_domain': 'invalid'},
+        {**base, 'output_type': 'xml'},
+        {**base, 'input_type': 'unknown'},
+        {**base, 'input_type': 'file', 'input': 'missing.txt'},
+        {**base, 'input': ['juan.perez@old.com', 42]},
+        {**base, 'input': 'juan.perez@old.com'},
+        {**base, 'input_type': 'text', 'input': ['juan.perez@old.com']},
+    ]
+
+    # Act
+    responses = [client.post('/process', data=json.dumps(case), content_type='application/json')
+                 for case in cases]
+
+    # Assert
+    assert [r.status_code for r in responses] == [400] * len(cases)
+    assert all('error' in json.loads(r.data) for r in responses)
+
+
+# ============================================================================
+# Tests de /jobs (trabajos en segundo plano)
+# ============================================================================
+
+def wait_job(client, job_id, timeout=5.0):
+    """Consulta GET /jobs/<id> hasta que el trabajo termine"""
+    deadline = time.monotonic() + timeout
+    while True:
+        data = json.loads(client.get(f'/jobs/{job_id}').data)
+        if data['status'] not in ('queued', 'running') or time.monotonic() > deadline:
+            return data
+        time.sleep(0.01)
+
+
+def test_api_jobs_list_input_csv_result(client):
+    """APIAdapter: POST /jobs encola, GET /jobs/<id> informa progreso y /result devuelve el CSV"""
+    # Arrange
+    payload = {
+        'input_type': 'list',
+        'input': ['juan.perez@old.com', 'invalid', 'maria.garcia@old.com'],
+        'new_domain': 'company.com'
+    }
+
+    # Act
+    submit = client.post('/jobs', data=json.dumps(payload), content_type='application/json')
+    job_id = json.loads(submit.data)['id']
+    status = wait_job(client, job_id)
+    result = client.get(f'/jobs/{job_id}/result')
+
+    # Assert
+    assert submit.status_code == 202
+    assert status['status'] == 'done'
+    assert status['processed'] == 2
+    assert status['total'] == 3
+    assert status['progress']['rows_done'] == 3
+    assert status['progress']['rows_total'] == 3
+    assert status['progress']['percent'] == 100.0
+    assert result.status_code == 200
+    assert result.mimetype == 'text/csv'
+    assert result.data.decode('utf-8').splitlines() == [
+        'Nombre,Apellido,Correo Original,Correo Nuevo',
+        'Juan,Perez,juan.perez@old.com,juan.perez@company.com',
+        'Maria,Garcia,maria.garcia@old.com,maria.garcia@company.com',
+    ]
+
+
+def test_api_jobs_file_input_ndjson(client, tmp_path):
+    """APIAdapter: trabajo desde archivo con salida NDJSON"""
+    # Arrange
+    source = tmp_path / "emails.txt"
+    source.write_text("juan.perez@old.com\nmaria.garcia@old.com\n", encoding='utf-8')
+    payload = {'input_type': 'file', 'input': str(source), 'new_domain': 'company.com', 'output_type': 'ndjson'}
+
+    # Act
+    job_id = json.loads(client.post('/jobs', data=json.dumps(payload), content_type='application/json').data)['id']
+    status = wait_job(client, job_id)
+    result = client.get(f'/jobs/{job_id}/result')
+
+    # Assert
+    lines = [json.loads(line) for line in result.data.decode('utf-8').splitlines()]
+    assert status['status'] == 'done'
+    assert status['progress']['rows_total'] is None
+    assert [line['correo_nuevo'] for line in lines] == ['juan.perez@company.com', 'maria.garcia@company.com']
+
+
+def test_api_jobs_invalid_requests(client):
+    """APIAdapter: POST /jobs responde 400 ante dominio, formato o entrada inválidos"""
+    # Arrange
+    base = {'input_type': 'list', 'input': ['juan.perez@old.com'], 'new_domain': 'company.com'}
+    cases = [
+        {**base, 'new_domain': None},
+        {**base, 'new_domain': 'invalid'},
+        {**base, 'output_type': 'xml'},
+        {**base, 'input_type': 'file', 'input': 'missing.txt'},
+    ]
+
+    # Act
+    responses = [client.post('/jobs', data=json.dumps(case), content_type='application/json') for case in cases]
+
+    # Assert
+    assert [r.status_code for r in responses] == [400] * len(cases)
+
+
+def test_api_jobs_unknown_and_unfinished(client, api_adapter):
+    """APIAdapter: trabajo inexistente 404; resultado de un trabajo sin terminar 409"""
+    # Arrange
+    release = threading.Event()
+    job = api_adapter.jobs.submit(lambda job: release.wait(5), params={'output_type': 'csv'})
+
+    # Act
+    unknown_status = client.get('/jobs/unknown')
+    unknown_result = client.get('/jobs/unknown/result')
+    pending = client.get(f'/jobs/{job.id}/result')
+    release.set()
+
+    # Assert
+    assert unknown_status.status_code == 404
+    assert unknown_result.status_code == 404
+    assert pending.status_code == 409
+    assert json.loads(pending.data)['status'] in ('queued', 'running')
@@ -0,0 +1,295 @@
+"""
+Tests Unitarios - EmailProcessingASGI (Input Adapter)
+Cobertura de la API streaming (ASGI) sin servidor: receive/send simulados
+"""
+import asyncio
+import json
+import pytest
+from src.features.email_processing.adapters.input.asgi_adapter import EmailProcessingASGI, _LineSplitter
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def app():
+    """Crea instancia de la app ASGI para tests"""
+    application = EmailProcessingASGI()
+    yield application
+    application.close()
+
+
+def call(app, path, body_chunks, query='', method='POST', content_type=b'application/x-ndjson', sent=None):
+    """Ejecuta una petición contra la app; devuelve (status, headers, body)"""
+    scope = {
+        'type': 'http', 'method': method, 'path': path,
+        'query_string': query.encode('latin-1'),
+        'headers': [(b'content-type', content_type)],
+    }
+    messages = [{'type': 'http.request', 'body': chunk, 'more_body': i < len(body_chunks) - 1}
+                for i, chunk in enumerate(body_chunks)] or [{'type': 'http.request', 'body': b''}]
+    sent = [] if sent is None else sent
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start = sent[0]
+    body = b''.join(m.get('body', b'') for m in sent[1:])
+    return start['status'], dict(start['headers']), body, sent
+
+
+def ndjson(body):
+    return [json.loads(line) for line in body.decode('utf-8').splitlines()]
+
+
+# ============================================================================
+# Tests de /transform
+# ============================================================================
+
+def test_transform_ndjson_stream(app):
+    """Test: NDJSON de entrada genera un resultado por fila y un resumen final"""
+    # Arrange
+    body = b'{"email": "juan.perez@old.com"}\n"maria.garcia@old.com"\n{"email": "invalid"}\n'
+
+    # Act
+    status, headers, raw, _ = call(app, '/transform', [body], 'new_domain=new.com')
+
+    # Assert
+    rows = ndjson(raw)
+    assert status == 200
+    assert headers[b'content-type'].startswith(b'application/x-ndjson')
+    assert rows[0] == {'original': 'juan.perez@old.com', 'transformed': 'juan.perez@new.com', 'valid': True}
+    assert rows[1]['transformed'] == 'maria.garcia@new.com'
+    assert rows[2]['valid'] is False and rows[2]['original'] == 'invalid'
+    assert rows[3]['summary']['valid'] == 2
+    assert rows[3]['summary']['total'] == 3
+
+
+def test_transform_lines_split_across_chunks(app):
+    """Test: una línea partida entre chunks se reconstruye"""
+    # Arrange
+    chunks = [b'{"email": "juan.pe', b'rez@old.com"}\n{"email": "ana.', b'lopez@old.com"}']
+
+    # Act
+    status, _, raw, _ = call(app, '/transform', chunks, 'new_domain=new.com')
+
+    # Assert
+    rows = ndjson(raw)
+    assert status == 200
+    assert [r['transformed'] for r in rows[:2]] == ['juan.perez@new.com', 'ana.lopez@new.com']
+
+
+def test_transform_text_plain_csv(app):
+    """Test: text/plain de entrada y CSV de salida con solo filas válidas"""
+    # Arrange
+    body = b'juan.perez@old.com\r\ninvalid\n\nmaria.garcia@old.com\n'
+
+    # Act
+    status, headers, raw, _ = call(app, '/transform', [body], 'new_domain=new.com&format=csv',
+                                   content_type=b'text/plain')
+
+    # Assert
+    lines = raw.decode('utf-8').splitlines()
+    assert status == 200
+    assert headers[b'content-type'].startswith(b'text/csv')
+    assert lines[0] == 'Nombre,Apellido,Correo Original,Correo Nuevo'
+    assert lines[1:] == ['Juan,Perez,juan.perez@old.com,juan.perez@new.com',
+                         'Maria,Garcia,maria.garcia@old.com,maria.garcia@new.com']
+
+
+def test_transform_streams_multiple_body_messages(app):
+    """Test: la respuesta se envía en varios mensajes http.response.body"""
+    # Arrange
+    app.BATCH_LINES = 1
+    chunks = [f'"user.n{chr(97 + i)}@old.com"\n'.encode() for i in range(5)]
+
+    # Act
+    _, _, raw, sent = call(app, '/transform', chunks, 'new_domain=new.com')
+
+    # Assert
+    assert len(ndjson(raw)) == 6
+    assert len(sent) > 3
+    assert sent[-1] == {'type': 'http.response.body', 'body': b'', 'more_body': False}
+
+
+def test_transform_invalid_domain_returns_400(app):
+    """Test: dominio inválido responde 400 antes de iniciar el stream"""
+    # Act
+    status, _, raw, _ = call(app, '/transform', [b'"juan.perez@old.com"\n'], 'new_domain=invalid')
+
+    # Assert
+    assert status == 400
+    assert 'Invalid target domain' in json.loads(raw)['error']
+
+
+def test_transform_missing_domain_returns_400(app):
+    """Test: sin new_domain responde 400"""
+    # Act
+    status, _, raw, _ = call(app, '/transform', [b''])
+
+    # Assert
+    assert status == 400
+    assert 'new_domain' in json.loads(raw)['error']
+
+
+def test_transform_bad_json_reports_error_line(app):
+    """Test: una línea NDJSON inválida termina el stream con una línea de error"""
+    # Act
+    status, _, raw, _ = call(app, '/transform', [b'"juan.perez@old.com"\n{not json\n'], 'new_domain=new.com')
+
+    # Assert
+    rows = ndjson(raw)
+    assert status == 200
+    assert rows[0]['transformed'] == 'juan.perez@new.com'
+    assert 'error' in rows[-1]
+
+
+def test_transform_csv_error_aborts_response(app):
+    """Test: en CSV un error a mitad de stream no cierra la respuesta como completa"""
+    # Arrange
+    sent = []
+
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="Stream aborted"):
+        call(app, '/transform', [b'"juan.perez@old.com"\n{not json\n'], 'new_domain=new.com&format=csv', sent=sent)
+    assert sent[0]['status'] == 200
+    assert all(m.get('more_body', False) for m in sent[1:])
+
+
+def test_transform_bad_first_line_returns_400(app):
+    """Test: las cabeceras se envían con la primera salida; un error antes aún es un 400"""
+    # Act
+    status, _, raw, _ = call(app, '/transform', [b'{not json\n'], 'new_domain=new.com')
+
+    # Assert
+    assert status == 400
+    assert 'error' in json.loads(raw)
+
+
+def test_slow_uploads_do_not_hold_workers():
+    """Test: subidas lentas no ocupan hilos mientras esperan datos; una petición corta no espera"""
+    # Arrange
+    app = EmailProcessingASGI(max_workers=1)
+    finished = []
+
+    async def request(name, chunks, delay):
+        scope = {'type': 'http', 'method': 'POST', 'path': '/transform',
+                 'query_string': b'new_domain=new.com', 'headers': [(b'content-type', b'text/plain')]}
+        messages = [{'type': 'http.request', 'body': chunk, 'more_body': i < len(chunks) - 1}
+                    for i, chunk in enumerate(chunks)]
+
+        async def receive():
+            await asyncio.sleep(delay)
+            return messages.pop(0)
+
+        async def send(message):
+            if message['type'] == 'http.response.body' and not message.get('more_body', False):
+                finished.append(name)
+
+        await app(scope, receive, send)
+
+    async def main():
+        slow = [request(f'slow{i}', [b'juan.perez@old.com\n'] * 5, 0.05) for i in range(4)]
+        await asyncio.gather(*slow, request('short', [b'ana.lopez@old.com\n'], 0))
+
+    # Act
+    try:
+        asyncio.run(main())
+    finally:
+        app.close()
+
+    # Assert
+    assert finished[0] == 'short'
+    assert len(finished) == 5
+
+
+def test_unknown_route_and_method(app):
+    """Test: ruta desconocida 404, método distinto de POST 405"""
+    # Act
+    status_404, _, _, _ = call(app, '/unknown', [b''])
+    status_405, _, _, _ = call(app, '/transform', [b''], method='GET')
+
+    # Assert
+    assert status_404 == 404
+    assert status_405 == 405
+
+
+# ============================================================================
+# Tests de /generate
+# ============================================================================
+
+def test_generate_csv_from_transform_results(app):
+    """Test: /generate convierte resultados de /transform en filas CSV"""
+    # Arrange
+    body = (b'{"original": "juan.perez@old.com", "transformed": "juan.perez@new.com", "valid": true}\n'
+            b'{"original": "invalid", "valid": false, "error": "x"}\n')
+
+    # Act
+    status, _, raw, _ = call(app, '/generate', [body])
+
+    # Assert
+    lines = raw.decode('utf-8').splitlines()
+    assert status == 200
+    assert lines[0] == 'Nombre,Apellido,Correo Original,Correo Nuevo'
+    assert lines[1] == 'Juan,Perez,juan.perez@old.com,juan.perez@new.com'
+    assert len(lines) == 2
+
+
+def test_generate_ndjson(app):
+    """Test: /generate con format=ndjson"""
+    # Arrange
+    body = b'{"original": "juan.perez@old.com", "transformed": "juan.perez@new.com", "valid": true}\n'
+
+    # Act
+    status, headers, raw, _ = call(app, '/generate', [body], 'format=ndjson')
+
+    # Assert
+    assert status == 200
+    assert headers[b'content-type'].startswith(b'application/x-ndjson')
+    assert ndjson(raw)[0]['correo_nuevo'] == 'juan.perez@new.com'
+
+
+# ============================================================================
+# Tests de utilidades
+# ============================================================================
+
+def test_line_splitter_keeps_partial_line():
+    """Test: el splitter retiene la línea incompleta hasta el siguiente chunk"""
+    # Arrange
+    splitter = _LineSplitter()
+
+    # Act
+    first = splitter.feed(b'a\nb')
+    second = splitter.feed(b'c\n')
+    tail = splitter.close()
+
+    # Assert
+    assert first == ['a']
+    assert second == ['bc']
+    assert tail == []
+
+
+def test_lifespan(app):
+    """Test: la app responde al protocolo lifespan"""
+    # Arrange
+    messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    # Act
+    asyncio.run(app({'type': 'lifespan'}, receive, send))
+
+    # Assert
+    assert [m['type'] for m in sent] == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
@@ -2,10 +2,13 @@
 Tests Unitarios - EmailProcessingCLI (Input Adapter)
 Cobertura de interfaz CLI
 """
+import csv
 import pytest
+import json
 import tempfile
 import os
 from src.features.email_processing.adapters.input.cli_adapter import EmailProcessingCLI
+from src.shared.error_logger import ErrorLogger
 
 
 # ============================================================================
@@ -266,6 +269,175 @@ def test_cli_run_silent_mode(cli_adapter, temp_input_file):
         os.unlink('summary.txt')
 
 
+def test_cli_stream_to_file_matches_generate(cli_adapter, tmp_path):
+    """CLIAdapter: stream_to_file() produce el mismo CSV que transform() + generate()"""
+    # Arrange
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("juan.perez@old.com\njuanperez@old.com\njuan.perez@old.com\nmaria.garcia@old.com\n", encoding='utf-8')
+    expected = tmp_path / "expected.csv"
+    streamed = tmp_path / "streamed.csv"
+    emails = cli_adapter.extract(str(input_file), 'file')
+    cli_adapter.generate(cli_adapter.transform(emails, 'new.com'), 'csv', str(expected))
+    
+    # Act
+    error_logger = ErrorLogger(str(tmp_path / "error_log.txt"))
+    stats = cli_adapter.stream_to_file(str(input_file), 'new.com', str(streamed), 'csv', error_logger)
+    
+    # Assert
+    assert streamed.read_text(encoding='utf-8') == expected.read_text(encoding='utf-8')
+    assert stats['total'] == 4
+    assert stats['processed'] == 2
+    assert error_logger.get_error_count() == 2
+
+
+@pytest.mark.parametrize("output_type", ["csv", "ndjson", "json"])
+def test_cli_stream_to_file_missing_input_keeps_output(cli_adapter, tmp_path, output_type):
+    """CLIAdapter: un --input inexistente no trunca la salida existente"""
+    # Arrange
+    output_file = tmp_path / f"existing.{output_type}"
+    output_file.write_text("contenido previo\n", encoding='utf-8')
+
+    # Act & Assert
+    with pytest.raises(FileNotFoundError):
+        cli_adapter.stream_to_file(str(tmp_path / "typo.txt"), 'new.com', str(output_file), output_type)
+    assert output_file.read_text(encoding='utf-8') == "contenido previo\n"
+
+
+def test_cli_run_ndjson_streams_from_file(cli_adapter, temp_input_file, tmp_path):
+    """CLIAdapter: run() con output_type='ndjson' escribe una línea por correo válido"""
+    # Arrange
+    output_file = tmp_path / "result.ndjson"
+    config = {
+        'input': temp_input_file,
+        'input_type': 'file',
+        'new_domain': 'company.com',
+        'output_type': 'ndjson',
+        'output_file': str(output_file)
+    }
+    
+    # Act
+    cli_adapter.run(config)
+    
+    # Assert
+    lines = output_file.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['correo_nuevo'] for line in lines] == ['juan.perez@company.com', 'maria.garcia@company.com']
+    
+    # Cleanup
+    for path in ('error_log.txt', 'summary.txt'):
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_cli_run_since_transforms_only_new_addresses(tmp_path, monkeypatch):
+    """CLIAdapter: con since se reutiliza la salida anterior y se escriben added/removed"""
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "v1.txt").write_text("juan.perez@old.com\nana.gil@old.com\n", encoding='utf-8')
+    (tmp_path / "v2.txt").write_text("ana.gil@old.com\nluis.diaz@old.com\n", encoding='utf-8')
+    config = {'input_type': 'file', 'new_domain': 'new.com', 'output_type': 'csv'}
+    EmailProcessingCLI().run({**config, 'input': 'v1.txt', 'output_file': 'out1.csv'})
+    cli = EmailProcessingCLI(since='out1.csv')
+    
+    # Act
+    cli.run({**config, 'input': 'v2.txt', 'output_file': 'out2.csv'})
+    
+    # Assert
+    def originals(path):
+        return [row[2] for row in csv.reader(open(tmp_path / path, encoding='utf-8'))][1:]
+    assert originals('out2.csv') == ['ana.gil@old.com', 'luis.diaz@old.com']
+    assert originals('out2.added.csv') == ['luis.diaz@old.com']
+    assert originals('out2.removed.csv') == ['juan.perez@old.com']
+    assert cli.delta.hits == 1
+    assert cli.delta.misses == 1
+
+
+@pytest.mark.parametrize("rows", [
+    "juan.perez@otro.org\njuan.perez@old.com\n",
+    "juan.perez@old.com\njuan.perez@otro.org\n",
+])
+def test_cli_run_since_keeps_previous_addresses_on_collision(tmp_path, monkeypatch, rows):
+    """CLIAdapter: con since y resolve_collisions la fila previa conserva su dirección y added coincide con la salida"""
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "v1.txt").write_text("juan.perez@old.com\n", encoding='utf-8')
+    (tmp_path / "v2.txt").write_text(rows, encoding='utf-8')
+    config = {'input_type': 'file', 'new_domain': 'new.com', 'output_type': 'csv'}
+    EmailProcessingCLI().run({**config, 'input': 'v1.txt', 'output_file': 'out1.csv'})
+
+    # Act
+    EmailProcessingCLI(since='out1.csv', resolve_collisions=True).run({**config, 'input': 'v2.txt', 'output_file': 'out2.csv'})
+
+    # Assert
+    def targets(path):
+        return {row[2]: row[3] for row in list(csv.reader(open(tmp_path / path, encoding='utf-8')))[1:]}
+    assert targets('out2.csv') == {'juan.perez@old.com': 'juan.perez@new.com',
+                                   'juan.perez@otro.org': 'juan.perez2@new.com'}
+    assert targets('out2.added.csv') == {'juan.perez@otro.org': 'juan.perez2@new.com'}
+
+
+def test_cli_run_resume_after_crash(tmp_path, monkeypatch):
+    """CLIAdapter: tras un corte después de un checkpoint, resume produce la misma salida"""
+    # Arrange
+    import src.features.email_processing.adapters.input.cli_adapter as cli_module
+    monkeypatch.chdir(tmp_path)
+    rows = [f"user{i % 23000}.{'abcdefghij'[i % 10]}x@old.com" if i % 7 else f"bad{i}@old.com" for i in range(25000)]
+    (tmp_path / "in.txt").write_text('\n'.join(rows) + '\n', encoding='utf-8')
+    config = {'input_type': 'file', 'input': 'in.txt', 'new_domain': 'new.com', 'output_type': 'csv'}
+    EmailProcessingCLI().run({**config, 'output_file': 'ref.csv'})
+    reference_log = (tmp_path / "error_log.txt").read_text(encoding='utf-8')
+    
+    real_save = cli_module.save_checkpoint
+    
+    def save_then_crash(path, checkpoint):
+        real_save(path, checkpoint)
+        raise KeyboardInterrupt
+    
+    monkeypatch.setattr(cli_module, 'save_checkpoint', save_then_crash)
+    with pytest.raises(KeyboardInterrupt):
+        EmailProcessingCLI(checkpoint_interval=1e-9).run({**config, 'output_file': 'out.csv'})
+    monkeypatch.setattr(cli_module, 'save_checkpoint', real_save)
+    
+    # Act
+    EmailProcessingCLI().run({**config, 'output_file': 'out.csv', 'resume': True})
+    
+    # Assert
+    def without_timestamps(log):
+        return [line.split('] ', 1)[1] for line in log.split('\n')]
+    assert (tmp_path / "out.csv").read_text(encoding='utf-8') == (tmp_path / "ref.csv").read_text(encoding='utf-8')
+    assert without_timestamps((tmp_path / "error_log.txt").read_text(encoding='utf-8')) == without_timestamps(reference_log)
+    assert not (tmp_path / "out.csv.checkpoint").exists()
+
+
+def test_cli_resume_rejects_other_run(tmp_path):
+    """CLIAdapter: un checkpoint de otra ejecución no se reanuda"""
+    # Arrange
+    from src.shared.checkpoint import RunCheckpoint, save_checkpoint
+    (tmp_path / "in.txt").write_text("juan.perez@old.com\n", encoding='utf-8')
+    output_file = str(tmp_path / "out.csv")
+    save_checkpoint(output_file + ".checkpoint", RunCheckpoint("other.txt", "new.com", "csv", 0, 0, 0, [0, 0], {}, [0, 0]))
+    
+    # Act & Assert
+    with pytest.raises(ValueError, match="different run"):
+        EmailProcessingCLI().stream_to_file(str(tmp_path / "in.txt"), "new.com", output_file, resume=True)
+
+
+def test_cli_resume_rejects_changed_input(tmp_path):
+    """CLIAdapter: si el input cambió tras el checkpoint, el offset ya no es fiable y no se reanuda"""
+    # Arrange
+    from src.shared.checkpoint import RunCheckpoint, input_stamp, save_checkpoint
+    input_file = tmp_path / "in.txt"
+    input_file.write_text("juan.perez@old.com\n", encoding='utf-8')
+    output_file = str(tmp_path / "out.csv")
+    save_checkpoint(output_file + ".checkpoint", RunCheckpoint(
+        str(input_file), "new.com", "csv", 19, 0, 0, [0, 0], {}, input_stamp(str(input_file))))
+    with open(input_file, 'a', encoding='utf-8') as f:
+        f.write("ana.gil@old.com\n")
+    
+    # Act & Assert
+    with pytest.raises(ValueError, match="changed since checkpoint"):
+        EmailProcessingCLI().stream_to_file(str(input_file), "new.com", output_file, resume=True)
+
+
 # ============================================================================
 # Tests de show_usage()
 # ============================================================================
@@ -66,3 +66,73 @@ class TestCLIEntrypoint:
         mock_cli.return_value = mock_instance
         main()
         mock_instance.run.assert_called_once()
+
+    @patch('src.features.email_processing.adapters.input.cli_entrypoint.EmailProcessingCLI')
+    @patch('sys.argv', ['email-processor', '--input', 'test.txt', '--new-domain', 'new.com', '--output-type', 'silent', '--workers', '4'])
+    def test_main_with_workers(self, mock_cli):
+        """main() passes --workers to the CLI adapter."""
+        main()
+        mock_cli.assert_called_once_with(workers=4, engine='sequential', async_logging=False,
+                                         warning_sample=1, warning_rate=None, log_records=False,
+                                         dedup='exact', bloom=False, expected_rows=1_000_000, dedup_target=False,
+                                         resolve_collisions=False, directory=None, suffix_format='{local}{n}',
+                                         cache=None, cache_max_entries=5_000_000, since=None,
+                                         checkpoint_interval=60.0)
+
+    @patch('src.features.email_processing.adapters.input.cli_entrypoint.EmailProcessingCLI')
+    @patch('sys.argv', ['email-processor', '--input', 'test.txt', '--new-domain', 'new.com', '--output-type', 'silent',
+                        '--log-mode', 'async', '--log-records', '--warning-sample', '10', '--warning-rate', '100'])
+    def test_main_with_logging_options(self, mock_cli):
+        """main() passes logging options to the CLI adapter."""
+        main()
+        mock_cli.assert_called_once_with(workers=1, engine='sequential', async_logging=True,
+                                         warning_sample=10, warning_rate=100, log_records=True,
+                                         dedup='exact', bloom=False, expected_rows=1_000_000, dedup_target=False,
+                                         resolve_collisions=False, directory=None, suffix_format='{local}{n}',
+                                         cache=None, cache_max_entries=5_000_000, since=None,
+                                         checkpoint_interval=60.0)
+
+    @patch('src.features.email_processing.adapters.input.cli_entrypoint.EmailProcessingCLI')
+    @patch('sys.argv', ['email-processor', '--input', 'test.txt', '--new-domain', 'new.com', '--output-type', 'silent',
+                        '--dedup', 'disk', '--bloom', '--dedup-target'])
+    def test_main_with_dedup_options(self, mock_cli):
+        """main() passes --dedup / --bloom to the CLI adapter."""
+        main()
+        mock_cli.assert_called_once_with(workers=1, engine='sequential', async_logging=False,
+                                         warning_sample=1, warning_rate=None, log_records=False,
+                                         dedup='disk', bloom=True, expected_rows=1_000_000, dedup_target=True,
+                                         resolve_collisions=False, directory=None, suffix_format='{local}{n}',
+                                         cache=None, cache_max_entries=5_000_000, since=None,
+                                         checkpoint_interval=60.0)
+
+    @patch('src.features.email_processing.adapters.input.cli_entrypoint.EmailProcessingCLI')
+    @patch('sys.argv', ['email-processor', '--input', 'test.txt', '--new-domain', 'new.com', '--output-type', 'silent',
+                        '--resolve-collisions', '--directory', 'dir.csv', '--suffix-format', '{local}.{n}'])
+    def test_main_with_collision_options(self, mock_cli):
+        """main() passes collision resolution options to the CLI adapter."""
+        main()
+        assert mock_cli.call_args.kwargs['resolve_collisions'] is True
+        assert mock_cli.call_args.kwargs['directory'] == 'dir.csv'
+        assert mock_cli.call_args.kwargs['suffix_format'] == '{local}.{n}'
+
+    @patch('src.features.email_processing.adapters.input.cli_entrypoint.EmailProcessingCLI')
+    @patch('sys.argv', ['email-processor', '--input', 'test.txt', '--new-domain', 'new.com', '--output', 'out.csv',
+                        '--since', 'prev.csv', '--cache', 'cache.sqlite'])
+    def test_main_with_since_and_cache(self, mock_cli):
+        """main() passes --since / --cache to the CLI adapter."""
+        main()
+        assert mock_cli.call_args.kwargs['since'] == 'prev.csv'
+        assert mock_cli.call_args.kwargs['cache'] == 'cache.sqlite'
+
+    @patch('sys.argv', ['email-processor', '--input', 'test.txt', '--new-domain', 'new.com', '--output-type', 'silent',
+                        '--warning-sample', '0'])
+    def test_main_with_invalid_warning_sample(self):
+        """main() rejects --warning-sample < 1."""
+        with pytest.raises(SystemExit):
+            main()
+
+    @patch('sys.argv', ['email-processor', '--input', 'test.txt', '--new-domain', 'new.com', '--output-type', 'silent', '--workers', '0'])
+    def test_main_with_invalid_workers(self):
+        """main() rejects --workers < 1."""
+        with pytest.raises(SystemExit):
+            main()
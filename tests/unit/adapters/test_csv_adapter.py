@@ -4,8 +4,10 @@ Plan 20% → 25%: Fase 2
 """
 import pytest
 import csv
-from src.features.email_processing.adapters.output.csv_adapter import CsvEmailWriter, CsvFormatter
-from src.features.email_processing.domain.email import Email
+from src.features.email_processing.adapters.output.csv_adapter import (
+    CsvEmailWriter, CsvFormatter, StreamingCsvWriter, iter_csv, iter_csv_emails, iter_csv_rows
+)
+from src.features.email_processing.domain.email import Email, EmailBatch
 
 
 @pytest.fixture
@@ -169,3 +171,135 @@ def test_format_csv_custom_headers(sample_emails):
     
     # Assert
     assert 'Name,Surname,Old,New' in result
+
+
+# ============================================================================
+# Tests de StreamingCsvWriter
+# ============================================================================
+
+def test_streaming_csv_same_output_as_writer(tmp_path, sample_emails):
+    """StreamingCsvWriter produce el mismo archivo que CsvEmailWriter"""
+    # Arrange
+    expected_path = tmp_path / "expected.csv"
+    streamed_path = tmp_path / "streamed.csv"
+    CsvEmailWriter().save_emails(sample_emails, str(expected_path))
+    
+    # Act
+    StreamingCsvWriter().save_emails(iter(sample_emails), str(streamed_path))
+    
+    # Assert
+    assert streamed_path.read_text(encoding='utf-8') == expected_path.read_text(encoding='utf-8')
+
+
+def test_streaming_csv_rows_on_disk_before_close(tmp_path, sample_emails):
+    """Cada write() deja las filas en disco antes de cerrar el archivo"""
+    # Arrange
+    file_path = tmp_path / "output.csv"
+    
+    with StreamingCsvWriter().open(str(file_path)) as writer:
+        # Act
+        written = writer.write(sample_emails[:1])
+        
+        # Assert
+        assert written == 1
+        assert file_path.read_text(encoding='utf-8').splitlines()[1] == 'Juan,Perez,juan.perez@old.com,juan.perez@new.com'
+        
+        writer.write(EmailBatch("new.com", sample_emails[1:]))
+    
+    assert writer.rows_written == 2
+    assert len(file_path.read_text(encoding='utf-8').splitlines()) == 3
+
+
+def test_streaming_csv_periodic_flush(tmp_path, sample_emails):
+    """flush_every fuerza flush dentro de un mismo write()"""
+    # Arrange
+    file_path = tmp_path / "output.csv"
+    seen = []
+    
+    def rows():
+        for email in sample_emails:
+            seen.append(len(file_path.read_text(encoding='utf-8').splitlines()))
+            yield email
+    
+    # Act
+    with StreamingCsvWriter(flush_every=1).open(str(file_path)) as writer:
+        writer.write(rows())
+    
+    # Assert
+    assert seen == [1, 2]
+
+
+def test_streaming_csv_write_without_open():
+    """write() sin open() lanza error"""
+    # Arrange
+    writer = StreamingCsvWriter()
+    
+    # Act & Assert
+    with pytest.raises(ValueError, match="not open"):
+        writer.write([])
+
+
+def test_streaming_csv_resume_at_offset(tmp_path, sample_emails):
+    """open(offset=...) recorta el archivo a lo confirmado por flush() y sigue escribiendo"""
+    # Arrange
+    file_path = tmp_path / "output.csv"
+    writer = StreamingCsvWriter().open(str(file_path))
+    writer.write(sample_emails[:1])
+    offset = writer.flush()
+    writer.write(sample_emails[1:])
+    writer.close()
+    
+    # Act
+    with StreamingCsvWriter().open(str(file_path), offset) as resumed:
+        resumed.write(sample_emails[1:])
+    
+    # Assert
+    assert list(iter_csv_emails(str(file_path))) == sample_emails
+
+
+def test_iter_csv_matches_formatter(sample_emails):
+    """iter_csv produce el mismo texto que CsvFormatter, fila a fila"""
+    # Act
+    chunks = list(iter_csv(iter(sample_emails)))
+    
+    # Assert
+    assert ''.join(chunks) == CsvFormatter().format(sample_emails)
+    assert chunks[0].startswith('Nombre,Apellido')
+    assert ''.join(iter_csv([])) == 'Nombre,Apellido,Correo Original,Correo Nuevo\r\n'
+
+
+def test_iter_csv_emails_round_trip(tmp_path, sample_emails):
+    """iter_csv_emails lee de vuelta lo escrito por CsvEmailWriter"""
+    # Arrange
+    file_path = tmp_path / "output.csv"
+    CsvEmailWriter().save_emails(sample_emails, str(file_path))
+    
+    # Act
+    emails = list(iter_csv_emails(str(file_path)))
+    
+    # Assert
+    assert emails == sample_emails
+
+
+def test_iter_csv_rows_plain_lists(tmp_path, sample_emails):
+    """iter_csv_rows devuelve las filas como listas, sin construir Email"""
+    # Arrange
+    file_path = tmp_path / "output.csv"
+    CsvEmailWriter().save_emails(sample_emails, str(file_path))
+    
+    # Act
+    rows = list(iter_csv_rows(str(file_path)))
+    
+    # Assert
+    assert rows == [email.to_list() for email in sample_emails]
+
+
+def test_iter_csv_emails_wrong_columns(tmp_path):
+    """Un CSV que no tiene 4 columnas lanza ValueError"""
+    # Arrange
+    file_path = tmp_path / "other.csv"
+    file_path.write_text("email\njuan.perez@old.com\n", encoding='utf-8')
+    
+    # Act & Assert
+    with pytest.raises(ValueError, match="4 columns"):
+        list(iter_csv_emails(str(file_path)))
@@ -7,7 +7,7 @@ import tempfile
 import os
 from pathlib import Path
 from src.features.email_processing.adapters.output.excel_adapter import ExcelEmailWriter
-from src.features.email_processing.domain.email import Email
+from src.features.email_processing.domain.email import Email, EmailBatch
 
 
 # ============================================================================
@@ -172,4 +172,48 @@ def test_excel_writer_overwrite_existing(temp_excel_file):
     assert os.path.exists(temp_excel_file)
 
 
+# ============================================================================
+# Tests de escritura incremental y rollover de hojas
+# ============================================================================
+
+@pytest.mark.parametrize("write_only", [True, False])
+def test_excel_writer_rollover_new_sheet(temp_excel_file, write_only):
+    """ExcelEmailWriter: al llegar a max_rows continúa en una hoja nueva con headers"""
+    openpyxl = pytest.importorskip("openpyxl")
+    # Arrange
+    writer = ExcelEmailWriter(write_only=write_only, max_rows=3)
+    emails = [Email.create(n, "perez", f"{n}.perez@old.com", "new.com") for n in ("ana", "juan", "luis", "maria", "pedro")]
+    
+    # Act
+    writer.save_emails(emails, temp_excel_file)
+    
+    # Assert
+    wb = openpyxl.load_workbook(temp_excel_file)
+    assert wb.sheetnames == ["Correos Procesados", "Correos Procesados 2", "Correos Procesados 3"]
+    rows = [[c.value for c in row] for ws in wb.worksheets for row in ws.iter_rows()]
+    assert rows.count(writer.headers) == 3
+    assert [r[0] for r in rows if r != writer.headers] == ["Ana", "Juan", "Luis", "Maria", "Pedro"]
+    assert writer.rows_written == 5
+
+
+def test_excel_writer_incremental_batches(temp_excel_file):
+    """ExcelEmailWriter: open()/write()/close() acepta varios lotes"""
+    openpyxl = pytest.importorskip("openpyxl")
+    # Arrange
+    first = [Email.create("juan", "perez", "juan.perez@old.com", "new.com")]
+    second = EmailBatch("new.com", [Email.create("maria", "garcia", "maria.garcia@old.com", "new.com")])
+    
+    # Act
+    with ExcelEmailWriter().open(temp_excel_file) as writer:
+        writer.write(iter(first))
+        writer.write(second)
+    
+    # Assert
+    ws = openpyxl.load_workbook(temp_excel_file).active
+    assert [c.value for c in ws[3]] == ['Maria', 'Garcia', 'maria.garcia@old.com', 'maria.garcia@new.com']
+
 
+def test_excel_writer_invalid_max_rows():
+    """ExcelEmailWriter: max_rows < 2 lanza ValueError"""
+    with pytest.raises(ValueError, match="max_rows"):
+        ExcelEmailWriter(max_rows=1)
@@ -3,7 +3,7 @@ Tests Unitarios - FileEmailRepository
 Plan 20% → 25%: Fase 1
 """
 import pytest
-from src.features.email_processing.adapters.output.file_adapter import FileEmailRepository
+from src.features.email_processing.adapters.output.file_adapter import FileEmailRepository, iter_directory
 
 
 def test_read_valid_file(tmp_path):
@@ -130,3 +130,141 @@ def test_read_ignores_lines_without_at(tmp_path):
     # Assert
     assert len(emails) == 1
     assert emails[0] == "juan.perez@old.com"
+
+
+# ============================================================================
+# Tests de lectura por bloques (iter_chunks / iter_emails)
+# ============================================================================
+
+def test_iter_chunks_respects_chunk_lines(tmp_path):
+    """Divide el archivo en bloques de chunk_lines correos"""
+    # Arrange
+    file_path = tmp_path / "emails.txt"
+    file_path.write_text("\n".join(f"user{i}.perez@old.com" for i in range(5)) + "\n", encoding='utf-8')
+    repo = FileEmailRepository(chunk_lines=2)
+    
+    # Act
+    chunks = list(repo.iter_chunks(str(file_path)))
+    
+    # Assert
+    assert [len(c.emails) for c in chunks] == [2, 2, 1]
+    assert chunks[-1].end_offset == file_path.stat().st_size
+
+
+def test_iter_chunks_respects_chunk_bytes(tmp_path):
+    """Cierra el bloque al alcanzar chunk_bytes"""
+    # Arrange
+    file_path = tmp_path / "emails.txt"
+    file_path.write_text("juan.perez@old.com\nmaria.garcia@old.com\nana.lopez@old.com\n", encoding='utf-8')
+    repo = FileEmailRepository(chunk_bytes=1)
+    
+    # Act
+    chunks = list(repo.iter_chunks(str(file_path)))
+    
+    # Assert
+    assert [c.emails for c in chunks] == [["juan.perez@old.com"], ["maria.garcia@old.com"], ["ana.lopez@old.com"]]
+
+
+def test_iter_chunks_skips_filtered_lines(tmp_path):
+    """Comentarios y líneas sin @ no generan bloques vacíos"""
+    # Arrange
+    file_path = tmp_path / "emails.txt"
+    file_path.write_text("# header\n\nno email\njuan.perez@old.com\n", encoding='utf-8')
+    repo = FileEmailRepository(chunk_bytes=1)
+    
+    # Act
+    chunks = list(repo.iter_chunks(str(file_path)))
+    
+    # Assert
+    assert len(chunks) == 1
+    assert chunks[0].emails == ["juan.perez@old.com"]
+
+
+def test_iter_emails_matches_read_emails(tmp_path):
+    """iter_emails produce los mismos correos que read_emails"""
+    # Arrange
+    file_path = tmp_path / "emails.txt"
+    file_path.write_text("  josé.garcía@old.com \r\n# c\njuan.perez@old.com\n", encoding='utf-8')
+    repo = FileEmailRepository(chunk_lines=1)
+    
+    # Act
+    streamed = list(repo.iter_emails(str(file_path)))
+    
+    # Assert
+    assert streamed == repo.read_emails(str(file_path))
+    assert streamed == ["josé.garcía@old.com", "juan.perez@old.com"]
+
+
+def test_iter_chunks_start_and_stop(tmp_path):
+    """iter_chunks lee solo entre los offsets start y stop"""
+    # Arrange
+    file_path = tmp_path / "emails.txt"
+    file_path.write_text("a.b@x.com\nc.d@x.com\ne.f@x.com\n", encoding='utf-8')
+    repo = FileEmailRepository(chunk_lines=1)
+    first = next(repo.iter_chunks(str(file_path)))
+    
+    # Act
+    head = [c.emails for c in repo.iter_chunks(str(file_path), stop=first.end_offset)]
+    tail = [c.emails for c in repo.iter_chunks(str(file_path), start=first.end_offset)]
+    
+    # Assert
+    assert head == [["a.b@x.com"]]
+    assert tail == [["c.d@x.com"], ["e.f@x.com"]]
+
+
+def test_iter_emails_line_endings(tmp_path):
+    """Acepta saltos \\n, \\r\\n y \\r sueltos (Mac clásico), como el modo texto"""
+    # Arrange
+    file_path = tmp_path / "emails.txt"
+    file_path.write_bytes(b"a.b@x.com\rc.d@x.com\re.f@x.com\r\ng.h@x.com\ni.j@x.com\r")
+    
+    # Act
+    emails = FileEmailRepository().read_emails(str(file_path))
+    
+    # Assert
+    assert emails == ["a.b@x.com", "c.d@x.com", "e.f@x.com", "g.h@x.com", "i.j@x.com"]
+
+
+def test_invalid_chunk_size():
+    """chunk_lines menor a 1 lanza ValueError"""
+    # Act & Assert
+    with pytest.raises(ValueError, match="chunk_lines"):
+        FileEmailRepository(chunk_lines=0)
+
+
+def test_iter_directory_csv_reads_correo_nuevo_column(tmp_path):
+    """iter_directory lee la columna 'Correo Nuevo' de un CSV de salida"""
+    # Arrange
+    file_path = tmp_path / "directorio.csv"
+    file_path.write_text("Nombre,Apellido,Correo Original,Correo Nuevo\n"
+                         "Juan,Perez,juan.perez@old.com,juan.perez@new.com\n", encoding='utf-8')
+    
+    # Act
+    addresses = list(iter_directory(str(file_path)))
+    
+    # Assert
+    assert addresses == ["juan.perez@new.com"]
+
+
+def test_iter_directory_txt_one_address_per_line(tmp_path):
+    """iter_directory lee un correo por línea en archivos que no son CSV"""
+    # Arrange
+    file_path = tmp_path / "directorio.txt"
+    file_path.write_text("# buzones\njuan.perez@new.com\nana.gil@new.com\n", encoding='utf-8')
+    
+    # Act
+    addresses = list(iter_directory(str(file_path)))
+    
+    # Assert
+    assert addresses == ["juan.perez@new.com", "ana.gil@new.com"]
+
+
+def test_iter_directory_csv_missing_column(tmp_path):
+    """Un CSV sin la columna pedida lanza ValueError"""
+    # Arrange
+    file_path = tmp_path / "directorio.csv"
+    file_path.write_text("email\njuan.perez@new.com\n", encoding='utf-8')
+    
+    # Act & Assert
+    with pytest.raises(ValueError, match="Correo Nuevo"):
+        list(iter_directory(str(file_path)))
@@ -4,8 +4,10 @@ Plan 26% → 36%: Fase 1
 """
 import pytest
 import json
-from src.features.email_processing.adapters.output.json_adapter import JsonEmailWriter, JsonFormatter
-from src.features.email_processing.domain.email import Email
+from src.features.email_processing.adapters.output.json_adapter import (
+    JsonEmailWriter, JsonFormatter, NdjsonEmailWriter, NdjsonFormatter, iter_ndjson_values
+)
+from src.features.email_processing.domain.email import Email, EmailBatch
 
 
 @pytest.fixture
@@ -88,3 +90,163 @@ def test_format_json_custom_structure(sample_emails):
     
     # Assert
     assert all(key in data['emails'][0] for key in ['nombre', 'apellido', 'correo_original', 'correo_nuevo'])
+
+
+# ============================================================================
+# Tests de salida compacta / indentada
+# ============================================================================
+
+def test_format_json_compact_by_default(sample_emails):
+    """Sin indent la salida no tiene saltos de línea ni espacios"""
+    # Act
+    result = JsonFormatter().format(sample_emails)
+    
+    # Assert
+    assert '\n' not in result
+    assert result.startswith('{"emails":[{"nombre":"Juan"')
+    assert result.endswith('"total":2}')
+
+
+@pytest.mark.parametrize("emails", [[], None])
+def test_format_json_indent_matches_json_dumps(sample_emails, emails):
+    """Con indent la salida incremental es idéntica a json.dumps(indent=...)"""
+    # Arrange
+    emails = sample_emails if emails is None else emails
+    expected = json.dumps({'emails': [e.to_dict() for e in emails], 'total': len(emails)}, indent=2, ensure_ascii=False)
+    
+    # Act & Assert
+    assert JsonFormatter(indent=2).format(emails) == expected
+
+
+def test_write_json_incremental_batches(tmp_path, sample_emails):
+    """JsonEmailWriter acepta varios lotes y un iterador"""
+    # Arrange
+    file_path = tmp_path / "output.json"
+    
+    # Act
+    with JsonEmailWriter().open(str(file_path)) as writer:
+        writer.write(iter(sample_emails[:1]))
+        writer.write(EmailBatch("new.com", sample_emails[1:]))
+    
+    # Assert
+    data = json.loads(file_path.read_text(encoding='utf-8'))
+    assert data['total'] == 2
+    assert [e['nombre'] for e in data['emails']] == ['Juan', 'Maria']
+
+
+# ============================================================================
+# Tests de NDJSON
+# ============================================================================
+
+def test_write_ndjson_one_object_per_line(tmp_path, sample_emails):
+    """NdjsonEmailWriter escribe un objeto JSON por línea"""
+    # Arrange
+    file_path = tmp_path / "output.ndjson"
+    
+    # Act
+    NdjsonEmailWriter().save_emails(sample_emails, str(file_path))
+    
+    # Assert
+    lines = file_path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == [e.to_dict() for e in sample_emails]
+
+
+def test_format_ndjson_non_ascii():
+    """NdjsonFormatter conserva caracteres no ASCII"""
+    # Arrange
+    emails = [Email("José", "Núñez", "jose.nunez@old.com", "jose.nunez@new.com")]
+    
+    # Act
+    result = NdjsonFormatter().format(emails)
+    
+    # Assert
+    assert '"nombre":"José"' in result
+    assert result.endswith('\n')
+
+
+def test_format_ndjson_empty():
+    """NdjsonFormatter con lista vacía retorna string vacío"""
+    assert NdjsonFormatter().format([]) == ''
+
+
+def test_ndjson_resume_at_offset(tmp_path, sample_emails):
+    """NdjsonEmailWriter.open(offset=...) continúa un archivo interrumpido"""
+    # Arrange
+    file_path = tmp_path / "output.ndjson"
+    writer = NdjsonEmailWriter().open(str(file_path))
+    writer.write(sample_emails[:1])
+    offset = writer.flush()
+    writer.close()
+    
+    # Act
+    with NdjsonEmailWriter().open(str(file_path), offset) as resumed:
+        resumed.write(sample_emails[1:])
+    
+    # Assert
+    lines = file_path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == [e.to_dict() for e in sample_emails]
+
+
+def test_json_writer_cannot_resume(tmp_path):
+    """El documento JSON (con cierre) no admite continuar a mitad de archivo"""
+    # Arrange
+    file_path = tmp_path / "output.json"
+    file_path.write_text("", encoding='utf-8')
+    
+    # Act & Assert
+    with pytest.raises(ValueError, match="cannot append"):
+        JsonEmailWriter().open(str(file_path), 0)
+
+
+def test_json_writer_skips_footer_on_error(tmp_path, sample_emails):
+    """Si el bloque falla, el JSON queda sin cierre en vez de parecer completo"""
+    # Arrange
+    file_path = tmp_path / "output.json"
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with JsonEmailWriter().open(str(file_path)) as writer:
+            writer.write(sample_emails)
+            raise RuntimeError("fallo a mitad")
+
+    # Assert
+    content = file_path.read_text(encoding='utf-8')
+    assert '"total"' not in content
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(content)
+
+
+def test_streaming_writer_requires_records():
+    """Un writer sin _records() falla al crearse, no a mitad del stream"""
+    # Arrange
+    from src.features.email_processing.adapters.output.json_adapter import _StreamingJsonWriter
+
+    class NoRecords(_StreamingJsonWriter):
+        pass
+
+    # Act & Assert
+    with pytest.raises(TypeError):
+        NoRecords()
+
+
+def test_iter_ndjson_values_reads_field_or_string():
+    """Lee el campo indicado de cada objeto o el string directo, omitiendo líneas vacías"""
+    # Arrange
+    lines = ['{"email": "juan.perez@old.com"}', '', '"maria.garcia@old.com"\r', '{"other": 1}']
+    
+    # Act
+    values = list(iter_ndjson_values(lines[:3]))
+    raw = list(iter_ndjson_values(lines, None))
+    
+    # Assert
+    assert values == ["juan.perez@old.com", "maria.garcia@old.com"]
+    assert raw == [{"email": "juan.perez@old.com"}, "maria.garcia@old.com", {"other": 1}]
+
+
+def test_iter_ndjson_values_rejects_malformed_lines():
+    """Una línea que no es JSON o un objeto sin el campo es un ValueError con su número de línea"""
+    # Act & Assert
+    with pytest.raises(ValueError, match='line 2: missing "email"'):
+        list(iter_ndjson_values(['"juan.perez@old.com"', '{"other": 1}']))
+    with pytest.raises(ValueError, match="line 1"):
+        list(iter_ndjson_values(['{not json']))
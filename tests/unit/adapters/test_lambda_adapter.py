@@ -3,6 +3,7 @@ Tests for LambdaAdapter - Input Layer
 """
 import pytest
 import base64
+from unittest.mock import MagicMock
 from src.features.email_processing.adapters.input.lambda_adapter import EmailProcessingLambda
 
 
@@ -144,3 +145,32 @@ class TestEmailProcessingLambda:
         assert 'processed' in result
         assert 'total' in result
         assert 'results' in result
+
+    def test_validate_batch(self):
+        """Validate many emails with compact per-item results."""
+        adapter = EmailProcessingLambda()
+        result = adapter.validate_batch(['juan.perez@old.com', 'juanperez@old.com', 'juan.perez@old.com'])
+        assert result['results'] == [
+            {'index': 0, 'valid': True},
+            {'index': 1, 'valid': False, 'rule': 'BR-002'},
+            {'index': 2, 'valid': True},
+        ]
+        assert result['valid'] == 2
+        assert result['total'] == 3
+
+    def test_validate_batch_rejects_non_string(self):
+        """Reject non-string items."""
+        adapter = EmailProcessingLambda()
+        with pytest.raises(ValueError, match='index 1'):
+            adapter.validate_batch(['juan.perez@old.com', 42])
+
+    def test_transform_summary_goes_to_request_log(self):
+        """Per-run summary lines are folded into the request log line, not logged at INFO."""
+        adapter = EmailProcessingLambda()
+        adapter.service._logger = MagicMock()
+        adapter.request_log.start({'rawPath': '/transform', 'body': ''})
+        adapter.transform(['juan.perez@old.com', 'juanperez@old.com'], 'new.com')
+        record = adapter.request_log.finish(200)
+        adapter.service._logger.info.assert_not_called()
+        assert record['processed'] == 1
+        assert record['error_counts'] == {'BR-002': 1}
@@ -4,6 +4,7 @@ Cobertura de uso como librería Python
 """
 import pytest
 import tempfile
+import json
 import os
 from src.features.email_processing.adapters.input.library_adapter import EmailProcessingLibrary
 
@@ -268,6 +269,21 @@ def test_library_generate_json(temp_output):
         os.unlink(output_file)
 
 
+def test_library_generate_ndjson(tmp_path):
+    """LibraryAdapter: generate() con output_type='ndjson' escribe una línea por correo"""
+    # Arrange
+    transformed = EmailProcessingLibrary.transform(['juan.perez@old.com', 'maria.garcia@old.com'], 'new.com')
+    output_file = tmp_path / "output.ndjson"
+    
+    # Act
+    result = EmailProcessingLibrary.generate(transformed, 'ndjson', str(output_file))
+    
+    # Assert
+    assert result == 2
+    lines = output_file.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['nombre'] for line in lines] == ['Juan', 'Maria']
+
+
 def test_library_generate_inline():
     """LibraryAdapter: generate() con output_type='inline' retorna lista"""
     # Arrange
@@ -456,3 +472,21 @@ def test_library_complete_flow_with_logging_and_summary(temp_file, temp_output):
         os.unlink('summary.txt')
     if os.path.exists('error_log.txt'):
         os.unlink('error_log.txt')
+
+
+def test_library_configure_logging():
+    """LibraryAdapter: configure_logging() activa y desactiva el modo async"""
+    # Act
+    EmailProcessingLibrary.configure_logging(async_mode=True, warning_sample=5, log_records=True)
+    
+    try:
+        # Assert
+        assert EmailProcessingLibrary._logger.async_mode
+        assert EmailProcessingLibrary._service.log_records
+        result = EmailProcessingLibrary.transform(['juan.perez@old.com', 'invalid'], 'new.com')
+        assert result.emails[0].correo_nuevo == 'juan.perez@new.com'
+    finally:
+        EmailProcessingLibrary.configure_logging()
+    
+    assert not EmailProcessingLibrary._logger.async_mode
+    assert not EmailProcessingLibrary._service.log_records
@@ -0,0 +1,91 @@
+"""
+Tests Unitarios - CollisionResolver
+"""
+import pytest
+from src.features.email_processing.domain.collision_resolver import CollisionResolver
+
+
+def test_resolve_free_address_is_kept():
+    """Un correo libre se emite sin cambios"""
+    # Arrange
+    resolver = CollisionResolver()
+    
+    # Act
+    result = resolver.resolve("juan.perez@new.com")
+    
+    # Assert
+    assert result == "juan.perez@new.com"
+    assert resolver.resolved == 0
+
+
+def test_resolve_collisions_get_increasing_suffixes():
+    """Las colisiones reciben el siguiente sufijo libre"""
+    # Arrange
+    resolver = CollisionResolver()
+    
+    # Act
+    results = [resolver.resolve("juan.perez@new.com") for _ in range(3)]
+    
+    # Assert
+    assert results == ["juan.perez@new.com", "juan.perez2@new.com", "juan.perez3@new.com"]
+    assert resolver.resolved == 2
+
+
+def test_resolve_batch_handles_repeats_within_batch():
+    """resolve_batch resuelve repeticiones dentro del mismo lote en orden"""
+    # Arrange
+    resolver = CollisionResolver()
+    
+    # Act
+    results = resolver.resolve_batch(["juan.perez@new.com", "ana.gil@new.com", "juan.perez@new.com"])
+    
+    # Assert
+    assert results == ["juan.perez@new.com", "ana.gil@new.com", "juan.perez2@new.com"]
+
+
+def test_seed_marks_existing_addresses_as_issued():
+    """Los buzones precargados se saltan, incluidos los sufijos ya existentes"""
+    # Arrange
+    resolver = CollisionResolver()
+    seeded = resolver.seed([" Juan.Perez@new.com ", "juan.perez2@new.com"])
+    
+    # Act
+    result = resolver.resolve("juan.perez@new.com")
+    
+    # Assert
+    assert seeded == 2
+    assert result == "juan.perez3@new.com"
+
+
+def test_custom_suffix_format_and_start():
+    """El formato del sufijo y el primer número son configurables"""
+    # Arrange
+    resolver = CollisionResolver(suffix_format='{local}.{n}', start=1)
+    resolver.resolve("juan.perez@new.com")
+    
+    # Act
+    result = resolver.resolve("juan.perez@new.com")
+    
+    # Assert
+    assert result == "juan.perez.1@new.com"
+
+
+def test_invalid_suffix_format():
+    """Un formato sin {n} lanza ValueError"""
+    # Act & Assert
+    with pytest.raises(ValueError, match="suffix_format"):
+        CollisionResolver(suffix_format='{local}x')
+
+
+def test_forgotten_base_address_probes_again():
+    """Con max_tracked el índice de sufijos queda acotado y el resultado no cambia"""
+    # Arrange
+    resolver = CollisionResolver(max_tracked=1)
+    resolver.resolve_batch(["juan.perez@new.com", "juan.perez@new.com", "ana.gil@new.com", "ana.gil@new.com"])
+    
+    # Act
+    result = resolver.resolve("juan.perez@new.com")
+    
+    # Assert
+    assert len(resolver._next) == 1
+    assert result == "juan.perez3@new.com"
@@ -2,8 +2,9 @@
 Tests Unitarios - Email Entity (TR-001 a TR-005)
 Fase 2 del Plan Maestro de Tests
 """
+import dataclasses
 import pytest
-from src.features.email_processing.domain.email import Email
+from src.features.email_processing.domain.email import Email, EmailBatch, email_rows
 
 
 # ============================================================================
@@ -282,3 +283,105 @@ def test_email_dataclass_attributes():
     assert hasattr(email, 'correo_nuevo')
     assert email.nombre == "Pedro"
     assert email.apellido == "Sanchez"
+
+
+def test_email_uses_slots():
+    """Email no tiene __dict__ por instancia"""
+    # Arrange & Act
+    email = Email.create("pedro", "sanchez", "pedro.sanchez@old.com", "new.com")
+    
+    # Assert
+    assert not hasattr(email, '__dict__')
+    with pytest.raises(AttributeError):
+        email.extra = 'x'
+
+
+# ============================================================================
+# EmailBatch: almacenamiento columnar
+# ============================================================================
+
+def test_email_batch_roundtrip():
+    """EmailBatch devuelve los mismos Email que recibió"""
+    # Arrange
+    emails = [
+        Email.create("juan", "perez", "juan.perez@old.com", "New.com"),
+        Email.create("MARIA", "garcia", "MARIA.garcia@old.com", "New.com"),
+    ]
+    
+    # Act
+    batch = EmailBatch("New.com", emails)
+    
+    # Assert
+    assert len(batch) == 2
+    assert list(batch) == emails
+    assert batch[-1] == emails[1]
+    assert batch[0:1] == emails[:1]
+    assert batch == emails
+
+
+def test_email_batch_derives_correo_nuevo():
+    """EmailBatch no guarda correo_nuevo si sigue TR-005"""
+    # Arrange & Act
+    batch = EmailBatch("new.com", [Email.create("juan", "perez", "juan.perez@old.com", "new.com")])
+    
+    # Assert
+    assert batch._overrides == {}
+    assert list(batch.correos_nuevos()) == ["juan.perez@new.com"]
+
+
+def test_email_batch_keeps_custom_correo_nuevo():
+    """EmailBatch conserva correo_nuevo que no sigue TR-005"""
+    # Arrange
+    email = Email("Juan", "Perez", "juan.perez@old.com", "juan.perez2@new.com")
+    
+    # Act
+    batch = EmailBatch("new.com", [email])
+    
+    # Assert
+    assert batch[0].correo_nuevo == "juan.perez2@new.com"
+    assert list(batch.dicts()) == [email.to_dict()]
+
+
+def test_email_rows_accepts_list_and_batch():
+    """email_rows() produce las mismas filas para lista y EmailBatch"""
+    # Arrange
+    emails = [Email.create("ana", "lopez", "ana.lopez@old.com", "new.com")]
+    
+    # Act & Assert
+    assert list(email_rows(emails)) == list(email_rows(EmailBatch("new.com", emails)))
+    assert list(email_rows(emails)) == [["Ana", "Lopez", "ana.lopez@old.com", "ana.lopez@new.com"]]
+
+
+def test_email_batch_copy_is_independent():
+    """copy() no comparte columnas con el original"""
+    # Arrange
+    batch = EmailBatch("new.com", [Email.create("ana", "lopez", "ana.lopez@old.com", "new.com")])
+    
+    # Act
+    clone = batch.copy()
+    batch.clear()
+    
+    # Assert
+    assert len(batch) == 0
+    assert len(clone) == 1
+
+
+def test_email_dataclass_with_slots():
+    """Email es una dataclass con __slots__: compara por campos y admite asdict/replace"""
+    # Arrange
+    email = Email("Juan", "Perez", "juan.perez@old.com", "juan.perez@new.com")
+    
+    # Act
+    same = Email("Juan", "Perez", "juan.perez@old.com", "juan.perez@new.com")
+    other = Email("Juan", "Perez", "juan.perez@old.com", "juan.perez@otro.com")
+    
+    # Assert
+    assert email == same
+    assert email != other
+    assert email != ("Juan", "Perez", "juan.perez@old.com", "juan.perez@new.com")
+    assert repr(email) == ("Email(nombre='Juan', apellido='Perez', "
+                           "correo_original='juan.perez@old.com', correo_nuevo='juan.perez@new.com')")
+    assert Email.__hash__ is None
+    assert dataclasses.asdict(email) == email.to_dict()
+    assert dataclasses.replace(email, correo_nuevo="juan.perez@otro.com") == other
+    assert not hasattr(email, '__dict__')
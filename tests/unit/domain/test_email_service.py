@@ -3,7 +3,10 @@ Tests Unitarios - EmailProcessingService
 Fase 1 del Plan de Incremento de Cobertura +5%
 """
 import pytest
+from unittest.mock import MagicMock
 from src.features.email_processing.domain.email import Email
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.shared.validation_adapter import RegexEmailValidator
 
 
 # ============================================================================
@@ -222,8 +225,23 @@ def test_transform_logging_calls(email_service, valid_emails_service):
     assert result['success_rate'] == 100.0
 
 
+def test_transform_log_summary_disabled():
+    """Con log_summary=False no se emiten las líneas INFO por ejecución; stats sigue completo"""
+    # Arrange
+    logger = MagicMock()
+    service = EmailProcessingService(RegexEmailValidator(), logger, log_summary=False)
+    
+    # Act
+    result = service.transform_emails(["juan.perez@old.com", "invalid"], "new.com")
+    
+    # Assert
+    logger.info.assert_not_called()
+    assert result['error_counts'] == {'BR-001': 1}
+    assert result['success_rate'] == 50.0
+
+
 def test_transform_progress_logging(email_service):
-    """Logger registra progreso cada 10 emails"""
+    """Progreso por tiempo: la ejecución no depende del número de filas"""
     # Arrange
     names = ["juan", "maria", "carlos", "ana", "pedro", "laura", "jose", "carmen", "luis", "rosa", "miguel", "elena", "jorge", "sofia", "pablo"]
     emails = [f"{name}.perez@old.com" for name in names]
@@ -235,3 +253,299 @@ def test_transform_progress_logging(email_service):
     # Assert
     assert result['processed'] == 15
     assert result['success_rate'] == 100.0
+
+
+# ============================================================================
+# Tests de transform_stream() - Pipeline en streaming
+# ============================================================================
+
+def test_transform_stream_accepts_generator(email_service):
+    """transform_stream acepta cualquier iterable y produce resultados en orden"""
+    # Arrange
+    emails = (e for e in ["juan.perez@old.com", "invalid", "maria.garcia@old.com"])
+    
+    # Act
+    results = list(email_service.transform_stream(emails, "new.com"))
+    
+    # Assert
+    assert [type(r).__name__ for r in results] == ['Email', 'TransformError', 'Email']
+    assert results[0].correo_nuevo == "juan.perez@new.com"
+    assert results[1].email == "invalid"
+    assert results[1].error.startswith("BR-001")
+
+
+def test_transform_stream_is_lazy(email_service):
+    """transform_stream no consume la entrada hasta que se itera"""
+    # Arrange
+    consumed = []
+    
+    def source():
+        for email in ["juan.perez@old.com", "maria.garcia@old.com"]:
+            consumed.append(email)
+            yield email
+    
+    # Act
+    stream = email_service.transform_stream(source(), "new.com")
+    first = next(stream)
+    
+    # Assert
+    assert first.correo_nuevo == "juan.perez@new.com"
+    assert consumed == ["juan.perez@old.com"]
+
+
+def test_transform_stream_updates_stats_incrementally(email_service):
+    """Las estadísticas se acumulan mientras se consume el stream"""
+    # Arrange
+    stats = {}
+    stream = email_service.transform_stream(
+        ["juan.perez@old.com", "juan.perez@old.com", "invalid"], "new.com", stats
+    )
+    
+    # Act
+    next(stream)
+    partial = dict(stats)
+    list(stream)
+    
+    # Assert
+    assert partial['total'] == 1 and partial['processed'] == 1
+    assert stats['total'] == 3
+    assert stats['processed'] == 1
+    assert stats['errors'] == 2
+    assert stats['success_rate'] == pytest.approx(33.33, rel=0.1)
+
+
+def test_transform_stream_invalid_domain_raises_eagerly(email_service):
+    """Dominio inválido se detecta al crear el stream, no al iterarlo"""
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid target domain"):
+        email_service.transform_stream(["juan.perez@old.com"], "invalid")
+
+
+def test_transform_stream_errors_carry_rule_code(email_service):
+    """Los errores del stream llevan el código de regla sin construir mensajes"""
+    # Arrange
+    emails = ["juanperez@old.com", "juan.perez@old.com", "juan.perez@old.com"]
+    
+    # Act
+    errors = [r for r in email_service.transform_stream(emails, "new.com") if not hasattr(r, 'correo_nuevo')]
+    
+    # Assert
+    assert [e.rule for e in errors] == ["BR-002", "Duplicate"]
+    assert errors[0].error == "BR-002: Falta punto separador en prefijo"
+
+
+# ============================================================================
+# Tests de contadores agregados y logging O(1)
+# ============================================================================
+
+def test_transform_error_counts_per_rule(email_service):
+    """stats['error_counts'] agrega rechazos por código de regla"""
+    # Arrange
+    emails = ["juanperez@old.com", "juan.perez@old.com", "juan.perez@old.com", "a.perez@old.com", "mariagarcia@old.com"]
+    
+    # Act
+    result = email_service.transform_emails(emails, "new.com")
+    
+    # Assert
+    assert result['error_counts'] == {'BR-002': 2, 'Duplicate': 1, 'BR-003': 1}
+    assert sum(result['error_counts'].values()) == result['errors']
+    assert len(result['error_details']) == 4
+
+
+def test_transform_no_per_record_warnings_by_default():
+    """Sin log_records no se emite un warning por fila rechazada"""
+    # Arrange
+    logger = MagicMock()
+    service = EmailProcessingService(RegexEmailValidator(), logger)
+    emails = [f"invalid{i}@old.com" for i in range(1000)]
+    
+    # Act
+    service.transform_emails(emails, "new.com")
+    
+    # Assert
+    logger.warning.assert_not_called()
+    assert logger.info.call_count <= 4
+    logger.info.assert_any_call("Rejected by rule: BR-002=1000")
+
+
+def test_transform_per_record_warnings_opt_in():
+    """Con log_records=True se registra cada rechazo y cada duplicado"""
+    # Arrange
+    logger = MagicMock()
+    service = EmailProcessingService(RegexEmailValidator(), logger, log_records=True)
+    
+    # Act
+    service.transform_emails(["juanperez@old.com", "juan.perez@old.com", "juan.perez@old.com"], "new.com")
+    
+    # Assert
+    assert logger.warning.call_args_list[0].args[0] == "Validation failed for juanperez@old.com: BR-002: Falta punto separador en prefijo"
+    assert logger.warning.call_args_list[1].args[0] == "Duplicate email: juan.perez@old.com"
+
+
+def test_transform_progress_is_time_based():
+    """progress_interval controla cada cuánto se registra el progreso"""
+    # Arrange
+    logger = MagicMock()
+    service = EmailProcessingService(RegexEmailValidator(), logger, progress_interval=0)
+    
+    # Act
+    service.transform_emails(["juan.perez@old.com", "maria.garcia@old.com"], "new.com")
+    
+    # Assert
+    progress = [c.args[0] for c in logger.info.call_args_list if c.args[0].startswith("Processed")]
+    assert progress == ["Processed 1 emails", "Processed 2 emails"]
+
+
+def test_transform_uses_dedup_factory():
+    """El detector de duplicados se crea con la fábrica inyectada y se cierra al terminar"""
+    # Arrange
+    from src.features.email_processing.domain.duplicate_detector import ExactDuplicateDetector
+    detectors = []
+
+    class TrackingDetector(ExactDuplicateDetector):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    def factory():
+        detectors.append(TrackingDetector())
+        return detectors[-1]
+
+    service = EmailProcessingService(RegexEmailValidator(), MagicMock(), dedup=factory)
+    
+    # Act
+    result = service.transform_emails(["juan.perez@old.com", "juan.perez@old.com"], "new.com")
+    
+    # Assert
+    assert len(detectors) == 1
+    assert detectors[0].closed
+    assert result['processed'] == 1
+    assert result['error_counts'] == {'Duplicate': 1}
+
+
+def test_transform_batched_dedup_matches_row_by_row():
+    """Con lotes, los duplicados (también dentro del mismo lote) se marcan igual que fila a fila"""
+    # Arrange
+    from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+    validator = RegexEmailValidator()
+    emails = ["juan.perez@old.com", " juan.perez@old.com", "bad", "maria.garcia@old.com", "bad"] * 3
+    row_service = EmailProcessingService(validator, MagicMock())
+    batch_service = EmailProcessingService(validator, MagicMock(), SequentialTransformEngine(validator, batch_size=4))
+    
+    # Act
+    expected = row_service.transform_emails(emails, "new.com")
+    result = batch_service.transform_emails(emails, "new.com")
+    
+    # Assert
+    assert result['emails'] == expected['emails']
+    assert result['error_counts'] == expected['error_counts']
+
+
+def test_transform_target_dedup_rejects_colliding_targets():
+    """Con target_dedup, variantes de mayúsculas que generan el mismo correo nuevo se rechazan como DUP-TARGET"""
+    # Arrange
+    service = EmailProcessingService(RegexEmailValidator(), MagicMock(), target_dedup=True)
+    emails = ["juan.perez@old.com", "Juan.Perez@old.com", "JUAN.PEREZ@other.com", "juan.perez@old.com"]
+    
+    # Act
+    result = service.transform_emails(emails, "new.com")
+    
+    # Assert
+    assert [e.correo_original for e in result['emails']] == ["juan.perez@old.com"]
+    assert result['error_counts'] == {'DUP-TARGET': 2, 'Duplicate': 1}
+    assert result['error_details'][0] == {
+        'email': "Juan.Perez@old.com",
+        'error': "DUP-TARGET: Correo nuevo ya generado por otra fila: juan.perez@new.com",
+    }
+
+
+def test_transform_target_dedup_off_by_default(email_service):
+    """Sin target_dedup las variantes de mayúsculas se aceptan como antes"""
+    # Act
+    result = email_service.transform_emails(["juan.perez@old.com", "Juan.Perez@old.com"], "new.com")
+    
+    # Assert
+    assert result['processed'] == 2
+
+
+def test_transform_collisions_resolved_with_suffix():
+    """Con un CollisionResolver los correos nuevos repetidos reciben sufijo en vez de rechazarse"""
+    # Arrange
+    from src.features.email_processing.domain.collision_resolver import CollisionResolver
+    service = EmailProcessingService(RegexEmailValidator(), MagicMock(), target_dedup=True,
+                                     collisions=CollisionResolver)
+    emails = ["juan.perez@old.com", "Juan.Perez@old.com", "juan.perez@other.com"]
+    
+    # Act
+    result = service.transform_emails(emails, "new.com")
+    
+    # Assert
+    assert [e.correo_nuevo for e in result['emails']] == [
+        "juan.perez@new.com", "juan.perez2@new.com", "juan.perez3@new.com"]
+    assert result['processed'] == 3
+    assert result['renamed'] == 2
+
+
+def test_transform_stream_seen_primes_dedup(email_service):
+    """Los correos de seen (ejecución interrumpida) cuentan como ya vistos, sin transformarse"""
+    # Arrange
+    stats = {}
+    
+    # Act
+    items = list(email_service.transform_stream(["juan.perez@old.com", "maria.garcia@old.com"], "new.com", stats,
+                                                seen=[[" juan.perez@old.com"]]))
+    
+    # Assert
+    assert items[0].rule == 'Duplicate'
+    assert items[1].correo_nuevo == "maria.garcia@new.com"
+    assert stats['total'] == 2
+
+
+def test_open_session_spans_fed_batches(email_service):
+    """Una sesión push mantiene duplicados y contadores entre lotes alimentados por separado"""
+    # Arrange
+    stats = {}
+    session = email_service.open_session("new.com", stats)
+    
+    # Act
+    first = list(session.feed(["juan.perez@old.com"]))
+    second = list(session.feed([" juan.perez@old.com", "invalid"]))
+    session.close()
+    
+    # Assert
+    assert first[0].correo_nuevo == "juan.perez@new.com"
+    assert [item.rule for item in second] == ['Duplicate', 'BR-001']
+    assert stats['total'] == 3 and stats['processed'] == 1
+    assert stats['error_counts'] == {'Duplicate': 1, 'BR-001': 1}
+
+
+def test_open_session_invalid_domain_raises(email_service):
+    """open_session valida el dominio destino antes de recibir datos"""
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid target domain"):
+        email_service.open_session("invalid")
+
+
+def test_validate_batch_per_item_results(email_service):
+    """validate_batch devuelve índice, validez y regla por email, sin detectar duplicados"""
+    # Arrange
+    emails = ["juan.perez@old.com", "juan@old.com", "juan.perez@old.com", "juan.p3rez@old.com"]
+    
+    # Act
+    results = list(email_service.validate_batch(emails))
+    
+    # Assert
+    assert results == [
+        {'index': 0, 'valid': True},
+        {'index': 1, 'valid': False, 'rule': 'BR-002'},
+        {'index': 2, 'valid': True},
+        {'index': 3, 'valid': False, 'rule': 'BR-005'},
+    ]
+
+
+def test_validate_batch_rejects_non_string(email_service):
+    """validate_batch rechaza elementos que no son texto"""
+    # Act & Assert
+    with pytest.raises(ValueError, match="index 0"):
+        list(email_service.validate_batch([None]))
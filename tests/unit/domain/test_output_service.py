@@ -4,7 +4,7 @@ Cobertura de métodos de generación de salida
 """
 import pytest
 from src.features.email_processing.domain.output_service import OutputService
-from src.features.email_processing.domain.email import Email
+from src.features.email_processing.domain.email import Email, EmailBatch
 
 
 # ============================================================================
@@ -129,3 +129,18 @@ def test_output_to_dict_list_multiple():
     assert len(result) == 2
     assert result[0]['nombre'] == 'Juan'
     assert result[1]['nombre'] == 'Maria'
+
+
+def test_output_with_email_batch():
+    """OutputService: acepta EmailBatch sin materializar Email"""
+    # Arrange
+    emails = [
+        Email.create("juan", "perez", "juan.perez@old.com", "new.com"),
+        Email.create("maria", "garcia", "maria.garcia@old.com", "new.com")
+    ]
+    batch = EmailBatch("new.com", emails)
+    
+    # Act & Assert
+    assert OutputService.generate_inline(batch) == OutputService.generate_inline(emails)
+    assert OutputService.to_dict_list(batch) == OutputService.to_dict_list(emails)
+    assert OutputService.generate_silent(batch) == 2
@@ -6,6 +6,7 @@ import pytest
 from src.features.email_processing.domain.ports import (
     EmailValidator, Logger, EmailRepository, EmailWriter, OutputFormatter
 )
+from src.features.email_processing.domain.validation import ValidationReason
 
 
 # ============================================================================
@@ -21,6 +22,14 @@ class MockEmailValidator(EmailValidator):
         return True
 
 
+class RaisingEmailValidator(EmailValidator):
+    def validate_and_parse(self, email: str) -> tuple[str, str]:
+        raise ValueError("CUSTOM-001: Regla propia")
+    
+    def validate_domain(self, domain: str) -> bool:
+        return True
+
+
 class MockLogger(Logger):
     def info(self, message: str) -> None:
         pass
@@ -65,6 +74,32 @@ def test_port_email_validator_validate_and_parse_interface():
     assert len(result) == 2
 
 
+def test_port_email_validator_validate_fast_default():
+    """Port: EmailValidator.validate_fast() adapta validate_and_parse() sin lanzar"""
+    # Arrange
+    validator = MockEmailValidator()
+    
+    # Act
+    result = validator.validate_fast("juan.perez@test.com")
+    
+    # Assert
+    assert result.reason is None
+    assert (result.nombre, result.apellido) == ("Juan", "Perez")
+
+
+def test_port_email_validator_validate_fast_unknown_message():
+    """Port: mensajes de error desconocidos se conservan como detalle"""
+    # Arrange
+    validator = RaisingEmailValidator()
+    
+    # Act
+    result = validator.validate_fast("juan.perez@test.com")
+    
+    # Assert
+    assert result.reason is ValidationReason.OTHER
+    assert result.message == "CUSTOM-001: Regla propia"
+
+
 def test_port_email_validator_validate_domain_interface():
     """Port: EmailValidator.validate_domain() retorna bool"""
     # Arrange
@@ -161,3 +196,20 @@ def test_port_output_formatter_format_interface():
     
     # Assert
     assert isinstance(result, str)
+
+
+# ============================================================================
+# Tests de LookupTransformEngine (base abstracta)
+# ============================================================================
+
+def test_lookup_engine_requires_lookup():
+    """LookupTransformEngine: sin _lookup() falla al crearse, no a mitad del stream"""
+    # Arrange
+    from src.features.email_processing.domain.transform_engine import LookupTransformEngine, SequentialTransformEngine
+
+    class NoLookup(LookupTransformEngine):
+        pass
+
+    # Act & Assert
+    with pytest.raises(TypeError):
+        NoLookup(SequentialTransformEngine(MockEmailValidator()))
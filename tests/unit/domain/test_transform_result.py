@@ -0,0 +1,81 @@
+"""
+Tests Unitarios - TransformResult
+"""
+from src.features.email_processing.domain.email import Email, EmailBatch
+from src.features.email_processing.domain.transform_result import TransformResult, emails_from_transformed
+
+
+def test_transform_result_is_list_of_dicts():
+    """TransformResult se comporta como la lista de dicts original"""
+    # Arrange
+    email = Email.create("juan", "perez", "juan.perez@old.com", "new.com")
+    
+    # Act
+    result = TransformResult([{'original': email.correo_original, 'transformed': str(email), 'valid': True}], [email])
+    
+    # Assert
+    assert result == [{'original': 'juan.perez@old.com', 'transformed': 'juan.perez@new.com', 'valid': True}]
+    assert TransformResult() == []
+
+
+def test_emails_from_transform_result_reuses_objects():
+    """emails_from_transformed() no vuelve a parsear un TransformResult"""
+    # Arrange
+    email = Email.create("juan", "perez", "juan.perez@old.com", "new.com")
+    result = TransformResult([{'original': 'juan.perez@old.com', 'transformed': 'juan.perez@new.com', 'valid': True}], [email])
+    
+    # Act & Assert
+    assert emails_from_transformed(result)[0] is email
+
+
+def test_emails_from_transform_result_after_filtering():
+    """Si el llamador filtra las filas, generate() no escribe las eliminadas"""
+    # Arrange
+    juan = Email.create("juan", "perez", "juan.perez@old.com", "new.com")
+    ana = Email.create("ana", "lopez", "ana.lopez@old.com", "new.com")
+    result = TransformResult([
+        {'original': juan.correo_original, 'transformed': str(juan), 'valid': True},
+        {'original': ana.correo_original, 'transformed': str(ana), 'valid': True},
+    ], [juan, ana])
+    
+    # Act
+    result.pop(0)
+    emails = emails_from_transformed(result)
+    
+    # Assert
+    assert not result.emails_in_sync()
+    assert emails == [ana]
+
+
+def test_emails_from_plain_dicts():
+    """emails_from_transformed() reconstruye Email desde dicts"""
+    # Arrange
+    transformed = [
+        {'original': 'juan.perez@old.com', 'transformed': 'juan.perez@new.com', 'valid': True},
+        {'original': 'bad', 'valid': False, 'error': 'BR-001: Falta símbolo @'},
+    ]
+    
+    # Act
+    emails = emails_from_transformed(transformed)
+    
+    # Assert
+    assert emails == [Email("Juan", "Perez", "juan.perez@old.com", "juan.perez@new.com")]
+
+
+def test_from_emails_detects_edited_rows():
+    """from_emails() crea las filas desde las columnas y detecta ediciones posteriores"""
+    # Arrange
+    batch = EmailBatch("new.com", [Email.create("juan", "perez", "juan.perez@old.com", "new.com"),
+                                   Email.create("ana", "lopez", "ana.lopez@old.com", "new.com")])
+    result = TransformResult.from_emails(batch)
+    result.append({'original': 'bad', 'valid': False, 'error': 'BR-001: Falta símbolo @'})
+    
+    # Act
+    in_sync = result.emails_in_sync()
+    result[1]['transformed'] = 'ana.lopez2@new.com'
+    
+    # Assert
+    assert in_sync
+    assert result[0] == {'original': 'juan.perez@old.com', 'transformed': 'juan.perez@new.com', 'valid': True}
+    assert not result.emails_in_sync()
+    assert emails_from_transformed(result)[1].correo_nuevo == 'ana.lopez2@new.com'
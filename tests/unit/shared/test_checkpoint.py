@@ -0,0 +1,41 @@
+"""
+Tests for Run Checkpoints - Shared Layer
+"""
+import os
+from src.shared.checkpoint import (
+    RunCheckpoint, checkpoint_path, input_stamp, load_checkpoint, remove_checkpoint, save_checkpoint
+)
+
+
+class TestRunCheckpoint:
+    """Test suite for checkpoint persistence."""
+
+    def test_round_trip(self, tmp_path):
+        """A saved checkpoint loads back unchanged."""
+        path = checkpoint_path(str(tmp_path / "out.csv"))
+        checkpoint = RunCheckpoint("in.txt", "new.com", "csv", 120, 300, 40, [2, 1],
+                                   {'total': 5, 'processed': 3, 'errors': 2, 'error_counts': {'BR-001': 2}}, [900, 1])
+        save_checkpoint(path, checkpoint)
+        assert load_checkpoint(path) == checkpoint
+        assert not os.path.exists(path + ".tmp")
+
+    def test_matches(self):
+        """Only the same input, domain and output type can resume."""
+        checkpoint = RunCheckpoint("in.txt", "new.com", "csv", 0, 0, 0, [0, 0], {}, [0, 0])
+        assert checkpoint.matches("in.txt", "new.com", "csv")
+        assert not checkpoint.matches("in.txt", "new.com", "ndjson")
+
+    def test_missing_and_remove(self, tmp_path):
+        """Missing checkpoints load as None; remove is idempotent."""
+        path = str(tmp_path / "out.csv.checkpoint")
+        assert load_checkpoint(path) is None
+        remove_checkpoint(path)
+
+    def test_input_stamp_changes_on_append(self, tmp_path):
+        """Appending to the input changes its stamp."""
+        path = tmp_path / "in.txt"
+        path.write_text("juan.perez@old.com\n", encoding='utf-8')
+        before = input_stamp(str(path))
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("ana.gil@old.com\n")
+        assert input_stamp(str(path)) != before
@@ -0,0 +1,95 @@
+"""
+Tests for Duplicate Detectors - Shared Layer
+"""
+import os
+import random
+import pytest
+from src.features.email_processing.domain.duplicate_detector import ExactDuplicateDetector
+from src.shared.dedup import (
+    BloomPrefilter, HashedDuplicateDetector, SqliteDuplicateDetector, build_duplicate_detector
+)
+
+
+def _corpus(size=5000, seed=7):
+    rng = random.Random(seed)
+    return [f"user{rng.randrange(size // 2)}.x@old.com" for _ in range(size)]
+
+
+def _flags(detector, keys, batch):
+    flags = []
+    for i in range(0, len(keys), batch):
+        flags.extend(detector.check_batch(keys[i:i + batch]))
+    detector.close()
+    return flags
+
+
+class TestDuplicateDetectors:
+    """Every mode must flag exactly what the in-memory set flags."""
+
+    @pytest.mark.parametrize("factory", [
+        lambda: HashedDuplicateDetector(bits=64, buffer_size=64),
+        lambda: HashedDuplicateDetector(bits=128, buffer_size=64),
+        lambda: SqliteDuplicateDetector(),
+        lambda: BloomPrefilter(HashedDuplicateDetector(bits=128, buffer_size=64), capacity=1000),
+        lambda: BloomPrefilter(SqliteDuplicateDetector(), capacity=1000),
+    ])
+    @pytest.mark.parametrize("batch", [1, 7, 1000])
+    def test_matches_exact(self, factory, batch):
+        """Same flags as ExactDuplicateDetector, including repeats inside a batch."""
+        keys = _corpus()
+        assert _flags(factory(), keys, batch) == _flags(ExactDuplicateDetector(), keys, batch)
+
+    @pytest.mark.parametrize("mode", ['exact', 'hash64', 'hash128', 'disk'])
+    @pytest.mark.parametrize("bloom", [False, True])
+    def test_build_duplicate_detector(self, mode, bloom):
+        """Factory builds a fresh detector per call."""
+        factory = build_duplicate_detector(mode, bloom, bloom_capacity=100)
+        detector = factory()
+        assert detector.check_batch(["a@x.com", "b@x.com", "a@x.com"]) == [False, False, True]
+        assert detector.is_duplicate("b@x.com")
+        detector.close()
+        assert factory().check_batch(["a@x.com"]) == [False]
+
+    @pytest.mark.parametrize("mode", ['exact', 'hash64', 'hash128'])
+    def test_bloom_only_in_front_of_disk(self, mode):
+        """In-memory modes ignore bloom; disk gets a filter sized from the expected count."""
+        detector = build_duplicate_detector('disk', True, bloom_capacity=1000)()
+        assert isinstance(detector, BloomPrefilter)
+        assert len(detector._words) * 8 < 2000
+        detector.close()
+        assert not isinstance(build_duplicate_detector(mode, True)(), BloomPrefilter)
+
+    def test_hashed_runs_are_merged(self):
+        """Flushed runs are merged so lookups touch few runs."""
+        detector = HashedDuplicateDetector(bits=64, buffer_size=16)
+        detector.check_batch([str(i) for i in range(16 * 64)])
+        assert len(detector) == 16 * 64
+        assert len(detector._runs) <= 7
+
+    def test_sqlite_temp_file_removed_on_close(self):
+        """The temporary database is deleted on close()."""
+        detector = SqliteDuplicateDetector()
+        detector.check_batch(["a@x.com"])
+        assert os.path.exists(detector.path)
+        detector.close()
+        assert not os.path.exists(detector.path)
+
+    def test_sqlite_explicit_path_is_kept(self, tmp_path):
+        """A caller-provided database survives close()."""
+        path = str(tmp_path / "seen.sqlite")
+        detector = SqliteDuplicateDetector(path)
+        detector.check_batch(["a@x.com"])
+        detector.close()
+        reopened = SqliteDuplicateDetector(path)
+        assert reopened.check_batch(["a@x.com"]) == [True]
+        reopened.close()
+
+    def test_invalid_mode(self):
+        """Unknown modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid dedup mode"):
+            build_duplicate_detector('fuzzy')
+
+    def test_invalid_bits(self):
+        """Only 64 and 128 bit digests are supported."""
+        with pytest.raises(ValueError):
+            HashedDuplicateDetector(bits=32)
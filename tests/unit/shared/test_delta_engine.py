@@ -0,0 +1,73 @@
+"""
+Tests for DeltaTransformEngine - Shared Layer
+"""
+from unittest.mock import MagicMock
+from src.features.email_processing.domain.collision_resolver import CollisionResolver
+from src.features.email_processing.domain.email import Email, email_rows
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+from src.shared.delta_engine import DeltaTransformEngine
+from src.shared.validation_adapter import CompiledEmailValidator
+
+
+def _previous():
+    return [
+        Email.create("juan", "perez", "juan.perez@old.com", "new.com"),
+        Email("Ana", "Gil", "ana.gil@old.com", "ana.gil2@new.com"),
+    ]
+
+
+def _run(emails, domain="new.com", batch_size=1, **service_options):
+    validator = CompiledEmailValidator()
+    engine = DeltaTransformEngine(SequentialTransformEngine(validator, batch_size), email_rows(_previous()))
+    service = EmailProcessingService(validator, MagicMock(), engine, reserved=engine.targets, **service_options)
+    result = service.transform_emails(emails, domain)
+    engine.record(result['emails'])
+    return result, engine
+
+
+class TestDeltaTransformEngine:
+    """Test suite for DeltaTransformEngine."""
+
+    def test_previous_rows_are_reused(self):
+        """Known addresses keep their previous row, including suffixed addresses."""
+        result, engine = _run(["ana.gil@old.com", "juan.perez@old.com"])
+        assert [e.correo_nuevo for e in result['emails']] == ["ana.gil2@new.com", "juan.perez@new.com"]
+        assert engine.unchanged == 2
+        assert engine.misses == 0
+
+    def test_added_and_removed(self):
+        """New accepted rows are added; missing previous rows are removed."""
+        result, engine = _run(["luis.diaz@old.com", "bad", "juan.perez@old.com"], batch_size=2)
+        assert [e.correo_original for e in engine.added] == ["luis.diaz@old.com"]
+        assert [e.correo_original for e in engine.removed()] == ["ana.gil@old.com"]
+        assert engine.unchanged == 1
+        assert result['error_counts'] == {'BR-001': 1}
+
+    def test_other_domain_is_not_reused(self):
+        """Previous rows for another target domain are transformed again."""
+        result, engine = _run(["juan.perez@old.com"], domain="other.com")
+        assert result['emails'][0].correo_nuevo == "juan.perez@other.com"
+        assert engine.unchanged == 0
+        assert len(engine.added) == 1
+
+    def test_reused_rows_keep_address_with_collisions(self):
+        """New rows colliding with a reused address get the suffix, in any input order."""
+        for emails in (["juan.perez@otro.org", "juan.perez@old.com"], ["juan.perez@old.com", "juan.perez@otro.org"]):
+            result, engine = _run(emails, collisions=CollisionResolver)
+            targets = {e.correo_original: e.correo_nuevo for e in result['emails']}
+            assert targets == {"juan.perez@old.com": "juan.perez@new.com", "juan.perez@otro.org": "juan.perez2@new.com"}
+            assert [e.correo_nuevo for e in engine.added] == ["juan.perez2@new.com"]
+            assert engine.unchanged == 1
+
+    def test_previous_suffixes_are_reserved(self):
+        """Addresses issued with a suffix last time are not handed out again."""
+        result, engine = _run(["ana.gil@otro.org", "ana.gil@tercero.org", "ana.gil@old.com"], collisions=CollisionResolver)
+        assert [e.correo_nuevo for e in result['emails']] == ["ana.gil@new.com", "ana.gil3@new.com", "ana.gil2@new.com"]
+
+    def test_reused_rows_keep_address_with_target_dedup(self):
+        """With DUP-TARGET the new colliding row is rejected, never the reused one."""
+        result, engine = _run(["juan.perez@otro.org", "juan.perez@old.com"], target_dedup=True)
+        assert [e.correo_original for e in result['emails']] == ["juan.perez@old.com"]
+        assert result['error_counts'] == {'DUP-TARGET': 1}
+        assert engine.added == []
@@ -236,3 +236,51 @@ def test_error_logger_warning_format_includes_timestamp():
     # Assert
     assert "[" in logger.errors[0]
     assert "]" in logger.errors[0]
+
+
+# ============================================================================
+# Tests de flush() / resume()
+# ============================================================================
+
+def test_error_logger_flush_matches_save(temp_log_file, tmp_path):
+    """ErrorLogger: escribir con flush() incremental da el mismo archivo que save()"""
+    # Arrange
+    incremental = ErrorLogger(temp_log_file)
+    single = ErrorLogger(str(tmp_path / "single.txt"))
+    
+    # Act
+    for logger in (incremental, single):
+        logger.log_error("a@x.com", "BR-001", "Falta")
+    incremental.flush()
+    for logger in (incremental, single):
+        logger.log_warning("b@x.com", "Duplicate")
+    incremental.save()
+    single.save()
+    
+    # Assert
+    assert open(temp_log_file, encoding='utf-8').read() == open(single.log_file, encoding='utf-8').read()
+    assert incremental.errors == []
+    assert incremental.get_error_count() == 1
+    assert incremental.get_warning_count() == 1
+
+
+def test_error_logger_resume_truncates_and_restores_counts(temp_log_file):
+    """ErrorLogger: resume() recorta el archivo al tamaño del checkpoint y conserva los contadores"""
+    # Arrange
+    logger = ErrorLogger(temp_log_file)
+    logger.log_error("a@x.com", "BR-001", "Falta")
+    size = logger.flush()
+    logger.log_error("lost@x.com", "BR-002", "Falta")
+    logger.flush()
+    
+    # Act
+    resumed = ErrorLogger(temp_log_file)
+    resumed.resume(size, 1, 0)
+    resumed.log_error("c@x.com", "BR-003", "Corto")
+    resumed.save()
+    
+    # Assert
+    content = open(temp_log_file, encoding='utf-8').read()
+    assert "lost@x.com" not in content
+    assert content.count("ERROR:") == 2
+    assert resumed.get_error_count() == 2
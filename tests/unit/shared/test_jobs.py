@@ -0,0 +1,141 @@
+"""
+Tests for JobManager / Job - in-process background jobs
+"""
+import os
+import threading
+import time
+import pytest
+from src.shared.jobs import Job, JobManager
+
+
+def wait_for(job, timeout=5.0):
+    """Poll until the job leaves queued/running."""
+    deadline = time.monotonic() + timeout
+    while job.status in ('queued', 'running'):
+        if time.monotonic() > deadline:
+            raise AssertionError(f"job still {job.status}")
+        time.sleep(0.01)
+    return job
+
+
+class TestJob:
+    """Progress reporting."""
+
+    def test_progress_with_known_total(self):
+        """Percent, rate and ETA come from rows done vs. rows_total."""
+        job = Job('a', 'out.csv')
+        job.status = 'running'
+        job.started = time.time() - 2.0
+        job.rows_total = 100
+        job.stats['total'] = 25
+
+        progress = job.progress()
+
+        assert progress['rows_done'] == 25
+        assert progress['percent'] == 25.0
+        assert 11.0 <= progress['rate'] <= 13.0
+        assert 5.5 <= progress['eta_seconds'] <= 6.5
+
+    def test_progress_with_fraction(self):
+        """Without a row total, the task-reported fraction drives percent and ETA."""
+        job = Job('a', 'out.csv')
+        job.status = 'running'
+        job.started = time.time() - 1.0
+        job.fraction = 0.5
+
+        progress = job.progress()
+
+        assert progress['rows_total'] is None
+        assert progress['percent'] == 50.0
+        assert 0.9 <= progress['eta_seconds'] <= 1.1
+
+    def test_progress_unknown(self):
+        """A queued job with no size information reports no percent or ETA."""
+        progress = Job('a', 'out.csv').progress()
+
+        assert progress == {'rows_done': 0, 'rows_total': None, 'percent': None, 'rate': 0.0, 'eta_seconds': None}
+
+
+class TestJobManager:
+    """Submission, execution and retention."""
+
+    def test_runs_task_and_reports_done(self, tmp_path):
+        """A finished job exposes its output and final stats."""
+        manager = JobManager(workers=1, directory=str(tmp_path))
+
+        def task(job):
+            job.stats.update({'total': 2, 'processed': 1, 'error_counts': {'BR-001': 1}})
+            with open(job.output_path, 'w') as f:
+                f.write('ok')
+
+        job = wait_for(manager.submit(task, suffix='.csv', params={'output_type': 'csv'}))
+        manager.close()
+
+        assert manager.get(job.id) is job
+        assert job.output_path.endswith('.csv')
+        assert open(job.output_path).read() == 'ok'
+        data = job.to_dict()
+        assert data['status'] == 'done'
+        assert data['processed'] == 1
+        assert data['error_counts'] == {'BR-001': 1}
+        assert data['progress']['percent'] == 100.0
+
+    def test_failed_task(self, tmp_path):
+        """Exceptions mark the job as failed with the error message."""
+        manager = JobManager(workers=1, directory=str(tmp_path))
+
+        def task(job):
+            raise ValueError("boom")
+
+        job = wait_for(manager.submit(task))
+        manager.close()
+
+        assert job.status == 'failed'
+        assert job.to_dict()['error'] == 'boom'
+        assert job.finished is not None
+
+    def test_evicts_oldest_finished_jobs(self, tmp_path):
+        """Past max_jobs the oldest finished job and its output are dropped."""
+        manager = JobManager(workers=1, directory=str(tmp_path), max_jobs=2)
+
+        def task(job):
+            open(job.output_path, 'w').close()
+
+        first = wait_for(manager.submit(task))
+        wait_for(manager.submit(task))
+        wait_for(manager.submit(task))
+        manager.close()
+
+        assert manager.get(first.id) is None
+        assert not os.path.exists(first.output_path)
+
+    def test_keeps_unfinished_jobs(self, tmp_path):
+        """Queued and running jobs are never evicted."""
+        manager = JobManager(workers=1, directory=str(tmp_path), max_jobs=1)
+        release = threading.Event()
+
+        running = manager.submit(lambda job: release.wait(5))
+        queued = manager.submit(lambda job: None)
+
+        assert manager.get(running.id) is running
+        assert manager.get(queued.id) is queued
+        release.set()
+        manager.close()
+
+    def test_owned_directory_removed_on_close(self):
+        """The temporary jobs directory is removed on close()."""
+        manager = JobManager(workers=1)
+        job = wait_for(manager.submit(lambda job: open(job.output_path, 'w').close()))
+        directory = manager.directory
+
+        manager.close()
+
+        assert os.path.exists(job.output_path) is False
+        assert not os.path.exists(directory)
+
+    def test_invalid_arguments(self):
+        """workers and max_jobs must be positive."""
+        with pytest.raises(ValueError):
+            JobManager(workers=0)
+        with pytest.raises(ValueError):
+            JobManager(max_jobs=0)
@@ -1,8 +1,10 @@
 """
 Tests for LoggingAdapter - Shared Layer
 """
+import logging
 import pytest
-from src.shared.logging_adapter import PythonLogger
+from logging.handlers import QueueHandler
+from src.shared.logging_adapter import PythonLogger, WarningSampler
 
 
 class TestPythonLogger:
@@ -24,3 +26,87 @@ class TestPythonLogger:
         logger = PythonLogger("test")
         assert logger.logger is not None
         assert len(logger.logger.handlers) > 0
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def captured():
+    """Logger with an in-memory handler; restores sync mode afterwards."""
+    logger = PythonLogger("test_async")
+    handler = _ListHandler()
+    logger.logger.addHandler(handler)
+    yield logger, handler
+    logger.configure()
+    logger.logger.removeHandler(handler)
+
+
+class TestAsyncLogging:
+    """Test suite for queue-based logging and warning sampling."""
+
+    def test_async_mode_uses_queue_handler(self, captured):
+        """Async mode leaves only a QueueHandler on the logger."""
+        logger, handler = captured
+        logger.configure(async_mode=True)
+        assert logger.async_mode
+        assert all(isinstance(h, QueueHandler) for h in logger.logger.handlers)
+
+    def test_async_records_delivered_in_order(self, captured):
+        """Records reach the real handlers after flush(), in order."""
+        logger, handler = captured
+        logger.configure(async_mode=True)
+        for i in range(100):
+            logger.warning(f"msg {i}")
+        logger.flush()
+        assert handler.messages == [f"msg {i}" for i in range(100)]
+
+    def test_back_to_sync_restores_handlers(self, captured):
+        """configure() without async restores the original handlers."""
+        logger, handler = captured
+        before = list(logger.logger.handlers)
+        logger.configure(async_mode=True)
+        logger.configure()
+        assert not logger.async_mode
+        assert logger.logger.handlers == before
+
+    def test_warning_sampling(self, captured):
+        """warning_sample keeps 1 of every N warnings; info is untouched."""
+        logger, handler = captured
+        logger.configure(warning_sample=10)
+        for i in range(100):
+            logger.warning(f"w{i}")
+        logger.info("done")
+        assert handler.messages[:2] == ["w0", "w10"]
+        assert len(handler.messages) == 11
+        assert logger.suppressed == 90
+
+    def test_close_reports_suppressed(self, captured):
+        """close() logs how many warnings were dropped."""
+        logger, handler = captured
+        logger.configure(async_mode=True, warning_rate=5)
+        for i in range(20):
+            logger.warning(f"w{i}")
+        logger.close()
+        assert handler.messages[-1] == "Suppressed 15 warning records (sampling/rate limit)"
+        assert not logger.async_mode
+
+    def test_default_instance_keeps_shared_config(self, captured):
+        """A new default PythonLogger with the same name does not reset async mode."""
+        logger, handler = captured
+        logger.configure(async_mode=True)
+        PythonLogger("test_async")
+        assert logger.async_mode
+
+    def test_sampler_rejects_invalid_values(self):
+        """WarningSampler validates its arguments."""
+        with pytest.raises(ValueError):
+            WarningSampler(sample_every=0)
+        with pytest.raises(ValueError):
+            WarningSampler(max_per_second=0)
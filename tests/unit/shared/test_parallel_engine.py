@@ -0,0 +1,56 @@
+"""
+Tests for ProcessPoolTransformEngine - Shared Layer
+"""
+import pytest
+from src.features.email_processing.domain.email import Email, TransformError
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.shared.parallel_engine import ProcessPoolTransformEngine
+from src.shared.logging_adapter import PythonLogger
+from src.shared.validation_adapter import RegexEmailValidator
+
+
+@pytest.fixture
+def engine():
+    engine = ProcessPoolTransformEngine(RegexEmailValidator(), workers=2, batch_size=3)
+    yield engine
+    engine.close()
+
+
+class TestProcessPoolTransformEngine:
+    """Test suite for ProcessPoolTransformEngine."""
+
+    def test_transform_batch_returns_results_in_order(self, engine):
+        """Results keep input order within a batch."""
+        results = engine.transform_batch(['juan.perez@old.com', 'invalid', 'ana.lopez@old.com'], 'new.com')
+        assert isinstance(results[0], Email)
+        assert isinstance(results[1], TransformError)
+        assert results[2].correo_nuevo == 'ana.lopez@new.com'
+
+    def test_transform_batches_ordered_merge(self, engine):
+        """Batches are yielded in submission order."""
+        batches = [[f'user{c}.perez@old.com'] for c in 'abcdefgh']
+        results = list(engine.transform_batches(iter(batches), 'new.com'))
+        assert [r[0].correo_original for r in results] == [b[0] for b in batches]
+
+    def test_service_matches_sequential_engine(self, engine):
+        """Service output with the pool is identical to the sequential one, duplicates included."""
+        emails = ['juan.perez@old.com', 'invalid', 'juan.perez@old.com', 'maria.garcia@old.com',
+                  'no-dot@old.com', 'maria.garcia@old.com', 'ana.lopez@old.com']
+        logger = PythonLogger("test")
+        sequential = EmailProcessingService(RegexEmailValidator(), logger).transform_emails(emails, 'new.com')
+        parallel = EmailProcessingService(RegexEmailValidator(), logger, engine).transform_emails(emails, 'new.com')
+
+        assert parallel['emails'] == sequential['emails']
+        assert parallel['error_details'] == sequential['error_details']
+        assert parallel['error_details'][1] == {'email': 'juan.perez@old.com', 'error': 'Duplicate'}
+
+    def test_invalid_workers(self):
+        """workers < 1 raises ValueError."""
+        with pytest.raises(ValueError, match="workers"):
+            ProcessPoolTransformEngine(RegexEmailValidator(), workers=-1)
+
+    def test_zero_workers_is_rejected_not_auto(self):
+        """An explicit workers=0 raises instead of meaning "every core"; None means auto."""
+        with pytest.raises(ValueError, match="workers"):
+            ProcessPoolTransformEngine(RegexEmailValidator(), workers=0)
+        assert ProcessPoolTransformEngine(RegexEmailValidator()).workers >= 1
@@ -0,0 +1,80 @@
+"""
+Tests for RequestLog - Shared Layer
+"""
+import json
+import logging
+from types import SimpleNamespace
+import pytest
+from src.shared.request_log import RequestLog
+
+
+def make_event(body='{"emails": ["juan.perez@old.com"]}'):
+    return {
+        'rawPath': '/transform',
+        'headers': {'content-type': 'application/json', 'x-api-key': 'secret'},
+        'requestContext': {'http': {'method': 'POST'}},
+        'body': body,
+    }
+
+
+class TestRequestLog:
+    """Test suite for per-request structured logging."""
+
+    def test_logs_metadata_only(self, caplog):
+        """One JSON line with metadata, status and duration; no body or headers."""
+        log = RequestLog(logging.getLogger('test_request_log'))
+        caplog.set_level(logging.INFO, logger='test_request_log')
+
+        log.start(make_event(), SimpleNamespace(aws_request_id='req-1'))
+        log.add(total=1, processed=1)
+        record = log.finish(200)
+
+        assert len(caplog.records) == 1
+        logged = json.loads(caplog.records[0].getMessage())
+        assert logged == record
+        assert logged['request_id'] == 'req-1'
+        assert logged['method'] == 'POST'
+        assert logged['path'] == '/transform'
+        assert logged['body_chars'] == len(make_event()['body'])
+        assert logged['status'] == 200
+        assert logged['processed'] == 1
+        assert 'duration_ms' in logged
+        assert 'payload' not in logged
+        assert 'secret' not in caplog.text
+
+    def test_samples_truncated_payload(self):
+        """Sampled requests carry the body cut to max_payload."""
+        log = RequestLog(sample_rate=0.5, max_payload=10, rng=lambda: 0.1)
+        log.start(make_event('x' * 50))
+        record = log.finish(200)
+        assert record['payload'] == 'x' * 10
+        assert record['payload_truncated'] is True
+
+    def test_not_sampled(self):
+        """Requests above the sample draw keep metadata only."""
+        log = RequestLog(sample_rate=0.5, rng=lambda: 0.9)
+        log.start(make_event())
+        assert 'payload' not in log.finish(200)
+
+    def test_add_outside_request_is_noop(self, caplog):
+        """Steps called without start() record and log nothing."""
+        log = RequestLog(logging.getLogger('test_request_log'))
+        caplog.set_level(logging.INFO, logger='test_request_log')
+        log.add(total=3)
+        assert log.finish(200) == {}
+        assert caplog.records == []
+
+    def test_from_env(self, monkeypatch):
+        """Sampling is configured through environment variables."""
+        monkeypatch.setenv('LOG_PAYLOAD_SAMPLE_RATE', '0.25')
+        monkeypatch.setenv('LOG_PAYLOAD_MAX_CHARS', '64')
+        log = RequestLog.from_env()
+        assert log.sample_rate == 0.25
+        assert log.max_payload == 64
+
+    def test_invalid_arguments(self):
+        """sample_rate must be in [0, 1] and max_payload non-negative."""
+        with pytest.raises(ValueError):
+            RequestLog(sample_rate=1.5)
+        with pytest.raises(ValueError):
+            RequestLog(max_payload=-1)
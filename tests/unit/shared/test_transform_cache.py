@@ -0,0 +1,109 @@
+"""
+Tests for TransformCache - Shared Layer
+"""
+import sqlite3
+import pytest
+from unittest.mock import MagicMock
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+from src.shared.transform_cache import CachedTransformEngine, rules_fingerprint
+from src.shared.validation_adapter import CompiledEmailValidator
+
+EMAILS = ["juan.perez@old.com", "juanperez@old.com", "maria.garcia@old.com", "juan.perez@old.com",
+          "ana.123@old.com"]
+
+
+class _CountingEngine(SequentialTransformEngine):
+    def __init__(self, validator, batch_size=2):
+        super().__init__(validator, batch_size)
+        self.rows = 0
+
+    def transform_batch(self, emails, new_domain):
+        self.rows += len(emails)
+        return super().transform_batch(emails, new_domain)
+
+
+def _run(path, emails=EMAILS, domain="new.com", **kwargs):
+    validator = CompiledEmailValidator()
+    inner = _CountingEngine(validator)
+    service = EmailProcessingService(validator, MagicMock(), CachedTransformEngine(inner, path, **kwargs))
+    result = service.transform_emails(emails, domain)
+    service.close()
+    return result, inner.rows
+
+
+class TestCachedTransformEngine:
+    """Test suite for CachedTransformEngine."""
+
+    def test_warm_run_skips_wrapped_engine(self, tmp_path):
+        """Second run is served from the cache with identical results."""
+        path = str(tmp_path / "cache.sqlite")
+        cold, cold_rows = _run(path)
+        warm, warm_rows = _run(path)
+        assert cold_rows == 4
+        assert warm_rows == 0
+        assert warm['emails'] == cold['emails']
+        assert warm['error_details'] == cold['error_details']
+        assert warm['error_counts'] == cold['error_counts']
+
+    def test_only_changed_rows_are_transformed(self, tmp_path):
+        """New addresses are misses; known ones are hits."""
+        path = str(tmp_path / "cache.sqlite")
+        _run(path)
+        result, rows = _run(path, EMAILS + ["pedro.lopez@old.com"])
+        assert rows == 1
+        assert result['processed'] == 3
+
+    def test_cache_is_per_domain(self, tmp_path):
+        """The same address is cached separately per target domain."""
+        path = str(tmp_path / "cache.sqlite")
+        _run(path)
+        result, rows = _run(path, domain="other.com")
+        assert rows == 4
+        assert result['emails'][0].correo_nuevo == "juan.perez@other.com"
+
+    def test_version_change_drops_cache(self, tmp_path):
+        """A different rules version invalidates stored results."""
+        path = str(tmp_path / "cache.sqlite")
+        _run(path, version="v1")
+        _, rows = _run(path, version="v2")
+        assert rows == 4
+
+    def test_eviction_keeps_max_entries(self, tmp_path):
+        """Oldest entries beyond max_entries are removed on close."""
+        path = str(tmp_path / "cache.sqlite")
+        _run(path, max_entries=2)
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM transforms").fetchone()[0] == 2
+        conn.close()
+
+    def test_eviction_is_least_recently_used(self, tmp_path):
+        """Hits are re-stamped, so eviction drops the entry unused for longest."""
+        path = str(tmp_path / "cache.sqlite")
+        _run(path, ["juan.perez@old.com", "maria.garcia@old.com"], max_entries=2, stamp_age=1)
+        _, rows = _run(path, ["juan.perez@old.com", "ana.lopez@old.com"], max_entries=2, stamp_age=1)
+        conn = sqlite3.connect(path)
+        cached = {raw for raw, in conn.execute("SELECT raw FROM transforms")}
+        conn.close()
+        assert rows == 1
+        assert cached == {"juan.perez@old.com", "ana.lopez@old.com"}
+
+    def test_transform_batch(self, tmp_path):
+        """transform_batch() mixes hits and misses in input order."""
+        engine = CachedTransformEngine(SequentialTransformEngine(CompiledEmailValidator()), str(tmp_path / "c.sqlite"))
+        engine.transform_batch(["juan.perez@old.com"], "new.com")
+        results = engine.transform_batch(["bad", "juan.perez@old.com"], "new.com")
+        engine.close()
+        assert results[0].rule == 'BR-001'
+        assert results[1].correo_nuevo == "juan.perez@new.com"
+        assert engine.hits == 1
+
+    def test_fingerprint_is_stable(self):
+        """The fingerprint only depends on the rule set."""
+        assert rules_fingerprint() == rules_fingerprint()
+
+    def test_invalid_max_entries(self, tmp_path):
+        """max_entries must be positive."""
+        with pytest.raises(ValueError):
+            CachedTransformEngine(SequentialTransformEngine(CompiledEmailValidator()), str(tmp_path / "c.sqlite"),
+                                  max_entries=0)
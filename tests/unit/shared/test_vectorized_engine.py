@@ -0,0 +1,75 @@
+"""
+Tests for VectorizedTransformEngine - Shared Layer
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+if not hasattr(np, 'strings'):
+    pytest.skip("numpy>=2.0 required", allow_module_level=True)
+
+from src.features.email_processing.domain.email import Email, TransformError
+from src.features.email_processing.domain.email_service import EmailProcessingService
+from src.features.email_processing.domain.transform_engine import SequentialTransformEngine
+from src.shared.logging_adapter import PythonLogger
+from src.shared.validation_adapter import RegexEmailValidator
+from src.shared.vectorized_engine import VectorizedTransformEngine
+
+
+CORPUS = [
+    "juan.perez@old.com",
+    "  MARIA.Garcia@Old.com ",
+    "juan.perezexample.com",
+    "juan.perez@@example.com",
+    "juanperez@example.com",
+    "juan.del.carmen@example.com",
+    "a.perez@example.com",
+    f"{'a' * 51}.perez@example.com",
+    "juan.p@example.com",
+    f"juan.{'a' * 51}@example.com",
+    "juan123.perez@example.com",
+    "juan.perez123@example.com",
+    "maria-jose.garcia@example.com",
+    "juan.o'brien@example.com",
+    "juan_x.perez@example.com",
+    "josé.garcía@example.com",
+    "juan².perez@example.com",
+    "juan\n.perez@example.com",
+    f"juan.perez@{'x' * 400}.com",
+    "",
+]
+
+
+class TestVectorizedTransformEngine:
+    """Test suite for VectorizedTransformEngine."""
+
+    def test_matches_row_by_row_engine(self):
+        """Same Email objects and rule codes as the sequential engine."""
+        vectorized = VectorizedTransformEngine().transform_batch(CORPUS, 'New.com')
+        sequential = SequentialTransformEngine(RegexEmailValidator()).transform_batch(CORPUS, 'New.com')
+        assert vectorized == sequential
+
+    def test_valid_rows_are_transformed(self):
+        """TR-001..TR-005 applied column-wise."""
+        result = VectorizedTransformEngine().transform_batch(["  MARIA.Garcia@Old.com "], 'New.com')
+        assert result == [Email('Maria', 'Garcia', "  MARIA.Garcia@Old.com ", 'maria.garcia@new.com')]
+
+    def test_rule_codes(self):
+        """Invalid rows carry the BR rule code."""
+        result = VectorizedTransformEngine().transform_batch(
+            ["juanperez@x.com", "juan.p@x.com", "maria-jose.garcia@x.com"], 'new.com')
+        assert all(isinstance(r, TransformError) for r in result)
+        assert [r.rule for r in result] == ['BR-002', 'BR-004', 'BR-005']
+        assert result[2].error == 'BR-005: Nombre contiene guiones'
+
+    def test_empty_batch(self):
+        """Empty batch returns empty list."""
+        assert VectorizedTransformEngine().transform_batch([], 'new.com') == []
+
+    def test_service_with_vectorized_engine(self):
+        """Plugs into EmailProcessingService, duplicates still detected."""
+        service = EmailProcessingService(RegexEmailValidator(), PythonLogger("test"), VectorizedTransformEngine(batch_size=4))
+        expected = EmailProcessingService(RegexEmailValidator(), PythonLogger("test")).transform_emails(
+            CORPUS + ["juan.perez@old.com"], 'new.com')
+        result = service.transform_emails(CORPUS + ["juan.perez@old.com"], 'new.com')
+        assert result == expected
+        assert result['error_details'][-1] == {'email': 'juan.perez@old.com', 'error': 'Duplicate'}
@@ -3,7 +3,8 @@ Tests Unitarios para RegexEmailValidator
 Cubre reglas BR-001 a BR-005 del PDD
 """
 import pytest
-from src.shared.validation_adapter import RegexEmailValidator
+from src.shared.validation_adapter import RegexEmailValidator, CompiledEmailValidator
+from src.features.email_processing.domain.validation import ValidationReason
 
 
 # ============================================================================
@@ -556,3 +557,102 @@ def test_case_insensitive_return(validator):
     assert apellido == "perez"
     assert nombre.islower()
     assert apellido.islower()
+
+
+# ============================================================================
+# CompiledEmailValidator: mismo contrato en una sola pasada
+# ============================================================================
+
+EQUIVALENCE_CORPUS = [
+    "juan.perez@example.com",
+    "  JUAN.PEREZ@example.com  ",
+    "juan.perezexample.com",
+    "juan.perez@@example.com",
+    "juanperez@example.com",
+    "juan.del.carmen@example.com",
+    "a.perez@example.com",
+    f"{'a' * 51}.perez@example.com",
+    f"{'a' * 50}.perez@example.com",
+    "juan.p@example.com",
+    f"juan.{'a' * 51}@example.com",
+    "juan123.perez@example.com",
+    "juan.perez123@example.com",
+    "maria-jose.garcia@example.com",
+    "o'brien.smith@example.com",
+    "josé.garcía@example.com",
+    "juan.pérez@example.com",
+    "juan@perez.test@example.com",
+    "juan.perez@",
+    "",
+]
+
+
+def _outcome(validator, email):
+    try:
+        return validator.validate_and_parse(email)
+    except ValueError as e:
+        return str(e)
+
+
+@pytest.mark.parametrize("email", EQUIVALENCE_CORPUS)
+def test_compiled_validator_matches_regex_validator(email):
+    """CompiledEmailValidator produce los mismos códigos y mensajes BR-001..BR-005"""
+    # Arrange
+    regex, compiled = RegexEmailValidator(), CompiledEmailValidator()
+    
+    # Act & Assert
+    assert _outcome(compiled, email) == _outcome(regex, email)
+
+
+def test_compiled_validator_is_valid():
+    """CompiledEmailValidator.is_valid() retorna bool correctamente"""
+    # Arrange
+    validator = CompiledEmailValidator()
+    
+    # Act & Assert
+    assert validator.is_valid("juan.perez@example.com") is True
+    assert validator.is_valid("juan.perez123@example.com") is False
+
+
+def test_compiled_validator_domain():
+    """CompiledEmailValidator.validate_domain() usa el mismo formato DNS"""
+    # Arrange
+    validator = CompiledEmailValidator()
+    
+    # Act & Assert
+    assert validator.validate_domain("company.com") is True
+    assert validator.validate_domain("invalid") is False
+
+
+@pytest.mark.parametrize("email", EQUIVALENCE_CORPUS)
+def test_validate_fast_matches_validate_and_parse(email):
+    """validate_fast() devuelve el mismo resultado sin lanzar excepciones"""
+    # Arrange
+    regex, compiled = RegexEmailValidator(), CompiledEmailValidator()
+    
+    # Act
+    result = compiled.validate_fast(email)
+    
+    # Assert
+    expected = _outcome(regex, email)
+    if result.reason is None:
+        assert (result.nombre, result.apellido) == expected
+    else:
+        assert result.message == expected
+        assert expected.startswith(result.reason.rule)
+
+
+def test_validate_fast_default_port_implementation():
+    """RegexEmailValidator hereda validate_fast() del puerto y mapea el código de regla"""
+    # Arrange
+    validator = RegexEmailValidator()
+    
+    # Act
+    valid = validator.validate_fast("juan.perez@example.com")
+    invalid = validator.validate_fast("juan123.perez@example.com")
+    
+    # Assert
+    assert valid.reason is None
+    assert (valid.nombre, valid.apellido) == ("juan", "perez")
+    assert invalid.reason is ValidationReason.NOMBRE_DIGITS
+    assert invalid.reason.rule == "BR-005"